@@ -0,0 +1,91 @@
+"""Run all benchmarks and write results as JSON.
+
+Usage::
+
+    python -m benchmarks [-o results.json] [--compare previous.json]
+
+Throughput metrics are higher-is-better, latency, allocation and memory
+metrics (suffixed `_ms`, `_kb`, `_b`) are lower-is-better.
+"""
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+from importlib import metadata
+from typing import Dict
+
+from benchmarks import (
+    decoding,
+    endpoints,
+    mapping,
+    memory,
+    request_data,
+    signing,
+    throughput,
+)
+
+
+def _flatten(results: dict, prefix: str = "") -> Dict[str, float]:
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{name}."))
+        else:
+            flat[name] = value
+    return flat
+
+
+def _compare(current: dict, previous: dict) -> None:
+    current = _flatten(current["results"])
+    previous = _flatten(previous["results"])
+    for name in sorted(current.keys() & previous.keys()):
+        lower_is_better = name.endswith(("_ms", "_kb", "_b"))
+        change = current[name] / previous[name] - 1 if previous[name] else 0.0
+        regression = change > 0 if lower_is_better else change < 0
+        marker = "!" if regression and abs(change) > 0.1 else " "
+        print(
+            f"{marker} {name:45} {previous[name]:14,.3f} -> {current[name]:14,.3f}"
+            f" ({change:+.1%})"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-o", "--output", help="file to write results to (stdout by default)"
+    )
+    parser.add_argument("--compare", help="results of a previous run to compare with")
+    args = parser.parse_args()
+
+    report = {
+        "mercapi_version": metadata.version("mercapi"),
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "results": {
+            "mapping_per_s": mapping.run(),
+            "search_decoding_per_s": decoding.run(),
+            "dpop_tokens_per_s": signing.run(),
+            "search_request_data_per_s": request_data.run(),
+            "endpoints": endpoints.run(),
+            "throughput_per_s": throughput.run(),
+            "memory": memory.run(),
+        },
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf8") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare, encoding="utf8") as file:
+            _compare(report, json.load(file))
+
+
+if __name__ == "__main__":
+    main()
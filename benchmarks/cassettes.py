@@ -0,0 +1,79 @@
+import json
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from mercapi.testing.fixtures import ENDPOINTS, cassette_interactions
+
+CASSETTES_DIR = Path(__file__).resolve().parent.parent / "tests" / "cassettes"
+
+
+def interactions() -> Iterator[Tuple[dict, dict]]:
+    """Yield (request, response) pairs recorded in `tests/cassettes`."""
+    return cassette_interactions(CASSETTES_DIR)
+
+
+def responses(endpoint: str, status_code: int = 200) -> List[dict]:
+    """Decoded bodies of recorded responses of `endpoint` (item, profile, items, search)."""
+    return [
+        json.loads(response["content"])
+        for request, response in interactions()
+        if ENDPOINTS.get(httpx.URL(request["uri"]).path) == endpoint
+        and response["status_code"] == status_code
+    ]
+
+
+def search_responses() -> List[dict]:
+    """Decoded bodies of all recorded search responses."""
+    return responses("search")
+
+
+def _replay_key(method: str, url: httpx.URL, body: Optional[bytes]) -> tuple:
+    if url.path == "/v2/entities:search":
+        data = json.loads(body or b"{}")
+        return (
+            method,
+            url.path,
+            data["searchCondition"]["keyword"],
+            data.get("pageToken") or "",
+        )
+    return method, url.path, tuple(sorted(url.params.multi_items()))
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Transport answering requests with responses recorded in `tests/cassettes`.
+
+    Requests are matched by method, path and query string,
+    search requests by keyword and page token.
+    """
+
+    def __init__(self):
+        self._responses: Dict[tuple, dict] = {}
+        for request, response in interactions():
+            body = request.get("body")
+            key = _replay_key(
+                request["method"],
+                httpx.URL(request["uri"]),
+                body.encode() if body else None,
+            )
+            self._responses.setdefault(key, response)
+
+    def __contains__(self, request: httpx.Request) -> bool:
+        return (
+            _replay_key(request.method, request.url, request.content) in self._responses
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        response = self._responses.get(
+            _replay_key(request.method, request.url, request.content)
+        )
+        if response is None:
+            return httpx.Response(404, json={"result": "error"}, request=request)
+        return httpx.Response(
+            response["status_code"],
+            headers={"Content-Type": "application/json"},
+            content=response["content"].encode("utf8"),
+            request=request,
+        )
@@ -0,0 +1,39 @@
+"""Measure decoding and mapping of recorded search responses per decoder.
+
+Run with `python -m benchmarks.decoding`.
+"""
+import json
+import timeit
+from typing import Dict
+
+from mercapi.mapping.decoders import JSONDecoder, MsgspecDecoder, OrjsonDecoder
+from benchmarks.cassettes import search_responses
+
+
+def run(repeat: int = 5, number: int = 20) -> Dict[str, float]:
+    """Return search responses decoded and mapped per second for every installed decoder."""
+    bodies = [json.dumps(r, ensure_ascii=False).encode() for r in search_responses()]
+
+    results = {}
+    for decoder_class in [JSONDecoder, OrjsonDecoder, MsgspecDecoder]:
+        try:
+            decoder = decoder_class()
+        except RuntimeError:
+            continue
+
+        def decode_all():
+            for body in bodies:
+                decoder.decode_search(body)
+
+        elapsed = min(timeit.repeat(decode_all, repeat=repeat, number=number))
+        results[decoder.name] = len(bodies) * number / elapsed
+    return results
+
+
+def main() -> None:
+    for name, throughput in run().items():
+        print(f"{name:8}{throughput:10,.0f} search responses/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Measure end-to-end latency and allocations of Mercapi calls.
+
+Responses recorded in `tests/cassettes` are replayed by a local transport,
+so the results reflect overhead of mercapi and httpx only.
+
+Run with `python -m benchmarks.endpoints`.
+"""
+import asyncio
+import statistics
+import time
+import tracemalloc
+from typing import Awaitable, Callable, Dict
+
+from mercapi import Mercapi
+from benchmarks.cassettes import ReplayTransport
+
+CALLS: Dict[str, Callable[[Mercapi], Awaitable]] = {
+    "search": lambda m: m.search("sharpnel"),
+    "item": lambda m: m.item("m12871737078"),
+    "profile": lambda m: m.profile("362164700"),
+    "items": lambda m: m.items("362164700"),
+}
+
+
+async def _measure(
+    m: Mercapi, call: Callable[[Mercapi], Awaitable], number: int
+) -> Dict[str, float]:
+    await call(m)  # warm up connection pool and compiled mappers
+
+    latencies = []
+    for _ in range(number):
+        start = time.perf_counter()
+        await call(m)
+        latencies.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        await call(m)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "latency_mean_ms": statistics.mean(latencies) * 1000,
+        "latency_p50_ms": latencies[len(latencies) // 2] * 1000,
+        "latency_p95_ms": latencies[int(len(latencies) * 0.95)] * 1000,
+        "peak_allocated_kb": peak / 1024,
+    }
+
+
+async def _run(number: int) -> Dict[str, Dict[str, float]]:
+    m = Mercapi(transport=ReplayTransport())
+    return {name: await _measure(m, call, number) for name, call in CALLS.items()}
+
+
+def run(number: int = 200) -> Dict[str, Dict[str, float]]:
+    """Return latency percentiles and peak allocations for every endpoint."""
+    return asyncio.run(_run(number))
+
+
+def main() -> None:
+    for name, metrics in run().items():
+        print(
+            f"{name:8} mean: {metrics['latency_mean_ms']:7.3f} ms"
+            f"  p50: {metrics['latency_p50_ms']:7.3f} ms"
+            f"  p95: {metrics['latency_p95_ms']:7.3f} ms"
+            f"  peak: {metrics['peak_allocated_kb']:8.1f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
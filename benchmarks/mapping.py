@@ -0,0 +1,77 @@
+"""Measure throughput of mapping recorded responses to models.
+
+Run with `python -m benchmarks.mapping`.
+"""
+import timeit
+from typing import Callable, Dict, List, Type
+from unittest.mock import patch
+
+from mercapi.mapping import definitions
+from mercapi.models import Item, Items, Profile, SearchResults
+from mercapi.models.base import ResponseModel
+from benchmarks.cassettes import responses
+
+
+def _interpreted(response, clazz, mapping_definition=None):
+    if mapping_definition is None:
+        mapping_definition = definitions.mapping_definitions[clazz]
+    return definitions._map_interpreted(response, clazz, mapping_definition)
+
+
+def _payloads() -> Dict[Type[ResponseModel], List[dict]]:
+    return {
+        SearchResults: responses("search"),
+        Item: [r["data"] for r in responses("item")],
+        Profile: [r["data"] for r in responses("profile")],
+        Items: responses("items"),
+    }
+
+
+def _throughput(
+    map_to_class: Callable,
+    clazz: Type[ResponseModel],
+    payloads: List[dict],
+    repeat,
+    number,
+) -> float:
+    def map_all():
+        for payload in payloads:
+            map_to_class(payload, clazz)
+
+    return (
+        len(payloads)
+        * number
+        / min(timeit.repeat(map_all, repeat=repeat, number=number))
+    )
+
+
+def run(repeat: int = 5, number: int = 20) -> Dict[str, float]:
+    """Return mapped responses per second for every model, compiled and interpreted."""
+    results = {}
+    for clazz, payloads in _payloads().items():
+        name = clazz.__name__
+        results[f"{name}.compiled"] = _throughput(
+            definitions.map_to_class, clazz, payloads, repeat, number
+        )
+        with patch.object(definitions, "map_to_class", _interpreted):
+            results[f"{name}.interpreted"] = _throughput(
+                _interpreted, clazz, payloads, repeat, number
+            )
+    return results
+
+
+def main() -> None:
+    search_items = sum(len(r["items"]) for r in responses("search"))
+    print(f"{len(responses('search'))} search responses, {search_items} items")
+    results = run()
+    for name in ["SearchResults", "Item", "Profile", "Items"]:
+        compiled = results[f"{name}.compiled"]
+        interpreted = results[f"{name}.interpreted"]
+        print(
+            f"{name:14} interpreted: {interpreted:10,.0f}/s"
+            f"  compiled: {compiled:10,.0f}/s  speedup: {compiled / interpreted:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
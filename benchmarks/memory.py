@@ -0,0 +1,47 @@
+"""Measure memory retained by mapped search results.
+
+Run with `python -m benchmarks.memory`.
+"""
+import gc
+import tracemalloc
+from typing import Dict
+
+from mercapi.mapping import map_to_class
+from mercapi.models import SearchResults
+from benchmarks.cassettes import search_responses
+
+
+def run(pages: int = 50) -> Dict[str, float]:
+    """Return memory retained per 120-item page (KiB) and per item (bytes)."""
+    response = max(search_responses(), key=lambda r: len(r["items"]))
+    items = response["items"]
+    # pad the largest recorded page to the full page size of 120 items
+    response = {**response, "items": (items * (120 // len(items) + 1))[:120]}
+    map_to_class(response, SearchResults)  # compile mappers before measuring
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        results = [map_to_class(response, SearchResults) for _ in range(pages)]
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    retained = (after - before) / pages
+    assert len(results) == pages
+    return {
+        "search_page_kb": retained / 1024,
+        "search_item_b": retained / 120,
+    }
+
+
+def main() -> None:
+    results = run()
+    print(f"search page (120 items): {results['search_page_kb']:10,.1f} KiB")
+    print(f"per item:                {results['search_item_b']:10,.0f} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Measure cost of building search request bodies.
+
+Run with `python -m benchmarks.request_data`.
+"""
+import timeit
+from typing import Dict
+
+from mercapi.requests import SearchRequestData
+
+
+def run(repeat: int = 5, number: int = 10_000) -> Dict[str, float]:
+    """Return `SearchRequestData.data` builds per second for a simple and a filtered query."""
+    requests = {
+        "simple": SearchRequestData(
+            SearchRequestData.SearchConditions(
+                "sharpnel",
+                sort_by=SearchRequestData.SortBy.SORT_SCORE,
+                sort_order=SearchRequestData.SortOrder.ORDER_DESC,
+            )
+        ),
+        "filtered": SearchRequestData(
+            SearchRequestData.SearchConditions(
+                "sharpnel",
+                categories=[75],
+                price_min=300,
+                price_max=10_000,
+                item_conditions=[1, 2],
+                shipping_methods=[
+                    SearchRequestData.ShippingMethod.SHIPPING_METHOD_ANONYMOUS
+                ],
+                status=[SearchRequestData.Status.STATUS_SOLD_OUT],
+                sort_by=SearchRequestData.SortBy.SORT_PRICE,
+                sort_order=SearchRequestData.SortOrder.ORDER_ASC,
+            )
+        ),
+    }
+    return {
+        name: number
+        / min(timeit.repeat(lambda: request.data, repeat=repeat, number=number))
+        for name, request in requests.items()
+    }
+
+
+def main() -> None:
+    for name, throughput in run().items():
+        print(f"{name:9}{throughput:12,.0f} builds/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Measure DPoP proofs generated per second.
+
+Run with `python -m benchmarks.signing`.
+"""
+import random
+import timeit
+from time import time
+from typing import Callable, Dict
+from uuid import UUID
+
+from ecdsa import SigningKey, NIST256p
+from jose import jws
+from jose.backends.ecdsa_backend import ECDSAECKey
+from jose.constants import ALGORITHMS
+
+from mercapi.util.jwt import DPoPSigner, SigningBackend
+
+URL = "https://api.mercari.jp/items/get?id=m12871737078"
+
+
+def _jose_dpop(url: str, method: str, key: SigningKey, extra_payload: dict) -> str:
+    # signing path used before DPoPSigner was introduced
+    payload = {
+        "iat": int(time()),
+        "jti": str(UUID(int=random.getrandbits(128))),
+        "htu": url,
+        "htm": method,
+        **extra_payload,
+    }
+    ec_key = ECDSAECKey(key, ALGORITHMS.ES256)
+    headers = {
+        "typ": "dpop+jwt",
+        "alg": "ES256",
+        "jwk": {k: ec_key.to_dict()[k] for k in ["crv", "kty", "x", "y"]},
+    }
+    return jws.sign(payload, key, headers, ALGORITHMS.ES256)
+
+
+def run(repeat: int = 5, number: int = 200) -> Dict[str, float]:
+    """Return DPoP proofs generated per second with jose and every signing backend."""
+    key = SigningKey.generate(NIST256p)
+    extra = {"uuid": "00000000-0000-0000-0000-000000000000"}
+
+    def throughput(generate: Callable[[], str]) -> float:
+        return number / min(timeit.repeat(generate, repeat=repeat, number=number))
+
+    results = {"jose": throughput(lambda: _jose_dpop(URL, "GET", key, extra))}
+    for backend in SigningBackend:
+        signer = DPoPSigner(key, backend)
+        results[backend.value] = throughput(
+            lambda: signer.generate_dpop(URL, "GET", extra)
+        )
+    return results
+
+
+def main() -> None:
+    results = run()
+    before = results.pop("jose")
+    print(f"jose.jws.sign:             {before:10,.0f} tokens/s")
+    for backend, after in results.items():
+        print(
+            f"DPoPSigner ({backend + '):':14}{after:10,.0f} tokens/s"
+            f"  ({after / before:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Measure throughput of concurrent calls against a local stand-in server.
+
+Every response of `mercapi.testing.StubTransport` is delayed to imitate
+network latency, so the results show how well requests overlap.
+
+Run with `python -m benchmarks.throughput`.
+"""
+import asyncio
+import time
+from typing import Dict
+
+from mercapi import Mercapi
+from mercapi.testing import Fixtures, StubTransport
+from benchmarks.cassettes import CASSETTES_DIR
+
+
+async def _items_bulk(concurrency: int, number: int, latency: float) -> float:
+    m = Mercapi(
+        transport=StubTransport(Fixtures.from_cassettes(CASSETTES_DIR), latency=latency)
+    )
+    ids = [f"m{i:011d}" for i in range(number)]
+    start = time.perf_counter()
+    async for _ in m.items_bulk(ids, concurrency=concurrency):
+        pass
+    return number / (time.perf_counter() - start)
+
+
+async def _search_iter(prefetch: int, pages: int, latency: float) -> float:
+    transport = StubTransport(
+        Fixtures.from_cassettes(CASSETTES_DIR), num_found=pages * 120, latency=latency
+    )
+    m = Mercapi(transport=transport)
+    start = time.perf_counter()
+    count = 0
+    async for _ in m.search_iter("sharpnel", prefetch=prefetch):
+        count += 1
+        if count % 120 == 0:
+            await asyncio.sleep(
+                latency
+            )  # consumer spends as long on a page as the server
+    return count / (time.perf_counter() - start)
+
+
+def run(latency: float = 0.02) -> Dict[str, float]:
+    """Return items per second for bulk fetches and paginated search."""
+    results = {}
+    for concurrency in [1, 8, 32]:
+        results[f"items_bulk.concurrency_{concurrency}"] = asyncio.run(
+            _items_bulk(concurrency, 200, latency)
+        )
+    for prefetch in [1, 2]:
+        results[f"search_iter.prefetch_{prefetch}"] = asyncio.run(
+            _search_iter(prefetch, 10, latency)
+        )
+    return results
+
+
+def main() -> None:
+    for name, throughput in run().items():
+        print(f"{name:32}{throughput:10,.0f} items/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,2 @@
+from .http import ResponseCache
+from .models import ModelCache
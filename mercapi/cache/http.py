@@ -0,0 +1,235 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from httpx import Request, Response
+
+ENDPOINTS = {
+    "/items/get": "item",
+    "/users/get_profile": "profile",
+    "/items/get_items": "items",
+    "/v2/entities:search": "search",
+}
+
+DEFAULT_TTL = {
+    "item": 300,
+    "profile": 600,
+    "items": 300,
+    "search": 60,
+}
+
+# request body properties which differ between otherwise identical requests
+_VOLATILE_BODY_PROPERTIES = ["searchSessionId"]
+
+_CACHEABLE_STATUS_CODES = {200, 404}
+
+# number of cache hits whose access times are written at once
+_ACCESS_BATCH = 256
+
+
+def canonical_body(data: dict) -> str:
+    """JSON of a request body without volatile properties,
+    equal for requests returning the same results."""
+    data = {k: v for k, v in data.items() if k not in _VOLATILE_BODY_PROPERTIES}
+    return json.dumps(data, sort_keys=True, separators=(",", ":"))
+
+
+class ResponseCache:
+    """Persistent cache of raw API responses backed by SQLite.
+
+    Responses are keyed by the method, URL and canonicalized body of a request.
+    Headers (and therefore unique `DPoP` proofs) are not part of the key.
+    Each endpoint has its own time-to-live, endpoints with TTL of 0 are not cached.
+    When the number of stored responses exceeds `max_entries`,
+    the least recently used ones are evicted.
+
+    The client uses :meth:`aget` and :meth:`aput`, which run database work
+    in a worker thread instead of blocking the event loop. Access times
+    of cache hits are recorded in memory and written in batches.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = ":memory:",
+        *,
+        ttl: Optional[Dict[str, float]] = None,
+        max_entries: int = 100_000,
+    ):
+        """
+        :param path: SQLite database file
+        :param ttl: time-to-live in seconds per endpoint (item, profile, items, search)
+        :param max_entries: maximum number of stored responses
+        """
+        self._ttl = {**DEFAULT_TTL, **(ttl or {})}
+        self._max_entries = max_entries
+        # used by one thread at a time, guarded by the lock
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        self._accessed: Dict[str, float] = {}
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                status_code INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                content BLOB NOT NULL,
+                expires REAL NOT NULL,
+                accessed REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+            """
+        )
+        self._size = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        self.hits: Counter = Counter()
+        """Number of responses served from cache per endpoint."""
+        self.misses: Counter = Counter()
+        """Number of cacheable requests not found in cache per endpoint."""
+
+    @staticmethod
+    def endpoint(request: Request) -> Optional[str]:
+        return ENDPOINTS.get(request.url.path)
+
+    @staticmethod
+    def key(request: Request) -> str:
+        body = request.content
+        if body:
+            try:
+                data = json.loads(body)
+            except ValueError:
+                pass
+            else:
+                if isinstance(data, dict):
+                    body = canonical_body(data).encode()
+                else:
+                    body = json.dumps(
+                        data, sort_keys=True, separators=(",", ":")
+                    ).encode()
+
+        digest = hashlib.sha256()
+        digest.update(request.method.encode())
+        digest.update(b"\0")
+        digest.update(str(request.url).encode())
+        digest.update(b"\0")
+        digest.update(body)
+        return digest.hexdigest()
+
+    def _cached(self, request: Request) -> bool:
+        return bool(self._ttl.get(self.endpoint(request)))
+
+    async def aget(self, request: Request) -> Optional[Response]:
+        """:meth:`get` running in a worker thread."""
+        if not self._cached(request):
+            return None
+        return await asyncio.get_running_loop().run_in_executor(None, self.get, request)
+
+    async def aput(self, request: Request, response: Response) -> None:
+        """:meth:`put` running in a worker thread."""
+        if (
+            not self._cached(request)
+            or response.status_code not in _CACHEABLE_STATUS_CODES
+        ):
+            return
+        await asyncio.get_running_loop().run_in_executor(
+            None, self.put, request, response
+        )
+
+    def get(self, request: Request) -> Optional[Response]:
+        endpoint = self.endpoint(request)
+        if not self._ttl.get(endpoint):
+            return None
+
+        key = self.key(request)
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT status_code, headers, content FROM responses WHERE key = ? AND expires > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                self.misses[endpoint] += 1
+                return None
+
+            self.hits[endpoint] += 1
+            self._accessed[key] = now
+            if len(self._accessed) >= _ACCESS_BATCH:
+                self._write_accessed()
+        status_code, headers, content = row
+        return Response(
+            status_code, headers=json.loads(headers), content=content, request=request
+        )
+
+    def put(self, request: Request, response: Response) -> None:
+        ttl = self._ttl.get(self.endpoint(request))
+        if not ttl or response.status_code not in _CACHEABLE_STATUS_CODES:
+            return
+
+        now = time.time()
+        headers = json.dumps(
+            [
+                (k, v)
+                for k, v in response.headers.items()
+                if k.lower() not in ("content-encoding", "content-length")
+            ]
+        )
+        key = self.key(request)
+        row = (response.status_code, headers, response.content, now + ttl, now)
+        with self._lock, self._db:
+            inserted = self._db.execute(
+                "INSERT OR IGNORE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, *row),
+            ).rowcount
+            if not inserted:
+                self._db.execute(
+                    """
+                    UPDATE responses
+                    SET status_code = ?, headers = ?, content = ?, expires = ?, accessed = ?
+                    WHERE key = ?
+                    """,
+                    (*row, key),
+                )
+            self._accessed.pop(key, None)
+            self._size += inserted
+            if self._size > self._max_entries:
+                self._evict()
+
+    def clear(self) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM responses")
+            self._accessed.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count()
+
+    def _count(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def _write_accessed(self) -> None:
+        with self._db:
+            self._db.executemany(
+                "UPDATE responses SET accessed = ? WHERE key = ?",
+                [(accessed, key) for key, accessed in self._accessed.items()],
+            )
+        self._accessed.clear()
+
+    def _evict(self) -> None:
+        self._write_accessed()
+        self._db.execute("DELETE FROM responses WHERE expires <= ?", (time.time(),))
+        self._db.execute(
+            """
+            DELETE FROM responses WHERE key IN (
+                SELECT key FROM responses ORDER BY accessed DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self._max_entries,),
+        )
+        self._size = self._count()
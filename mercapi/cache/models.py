@@ -0,0 +1,120 @@
+import asyncio
+import logging
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+
+log = logging.getLogger(__name__)
+
+
+class ModelCache:
+    """In-process LRU cache of mapped models (e.g. `Item`, `Profile`, `Items`) keyed by id.
+
+    Entries are fresh for `ttl` seconds. Afterwards, if `stale_while_revalidate`
+    is enabled, the stale entry is still returned immediately while a fresh one
+    is fetched in the background. Otherwise stale entries are fetched again
+    before returning.
+
+    Cached objects are shared between callers and should be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        *,
+        ttl: float = 300,
+        stale_while_revalidate: bool = False,
+    ):
+        """
+        :param maxsize: maximum number of stored models
+        :param ttl: number of seconds a stored model is considered fresh
+        :param stale_while_revalidate: return stale models immediately and refresh them in the background
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._stale_while_revalidate = stale_while_revalidate
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[Any, float]]" = (
+            OrderedDict()
+        )
+        self._refreshing: Set[Tuple[str, Hashable]] = set()
+        self._tasks: Set[asyncio.Future] = set()
+        self.hits: Counter = Counter()
+        """Number of fresh models returned per kind."""
+        self.stale_hits: Counter = Counter()
+        """Number of stale models returned per kind."""
+        self.misses: Counter = Counter()
+        """Number of models fetched before returning per kind."""
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Tuple[str, Hashable]) -> bool:
+        return key in self._entries
+
+    async def get(
+        self,
+        kind: str,
+        id_: Hashable,
+        fetch: Callable[[Hashable], Awaitable[Optional[T]]],
+    ) -> Optional[T]:
+        """Return cached model of `kind` with `id_`, call `fetch(id_)` if needed.
+
+        `None` results (e.g. not found) are returned but not stored.
+        """
+        key = (kind, id_)
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, stored = entry
+            self._entries.move_to_end(key)
+            if time.monotonic() - stored < self._ttl:
+                self.hits[kind] += 1
+                return value
+            if self._stale_while_revalidate:
+                self.stale_hits[kind] += 1
+                self._revalidate(key, fetch)
+                return value
+
+        self.misses[kind] += 1
+        value = await fetch(id_)
+        self.put(kind, id_, value)
+        return value
+
+    def put(self, kind: str, id_: Hashable, value: Any) -> None:
+        key = (kind, id_)
+        if value is None:
+            self._entries.pop(key, None)
+            return
+
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, kind: str, id_: Hashable) -> None:
+        self._entries.pop((kind, id_), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _revalidate(
+        self,
+        key: Tuple[str, Hashable],
+        fetch: Callable[[Hashable], Awaitable[Optional[T]]],
+    ) -> None:
+        if key in self._refreshing:
+            return
+
+        async def refresh() -> None:
+            try:
+                self.put(*key, await fetch(key[1]))
+            except Exception as exc:
+                log.warning(f"Failed to refresh cached {key[0]} {key[1]}: {exc!r}")
+            finally:
+                self._refreshing.discard(key)
+
+        self._refreshing.add(key)
+        task = asyncio.ensure_future(refresh())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
@@ -0,0 +1,4 @@
+from .price import PriceShardCrawler
+from .watch import ListingWatcher, ListingEvent
+from .schedule import SearchScheduler, ScheduledSearch
+from .category import CategoryCrawler
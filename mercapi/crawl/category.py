@@ -0,0 +1,187 @@
+import asyncio
+import heapq
+from copy import copy
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from mercapi import Mercapi
+from mercapi.facets import FacetCatalog
+from mercapi.models import SearchResultItem
+from mercapi.requests import SearchRequestData
+
+# marks the end of results of a leaf category
+_DONE = object()
+
+
+def sort_key(
+    sort_by: SearchRequestData.SortBy, sort_order: SearchRequestData.SortOrder
+) -> Optional[Callable[[SearchResultItem], Tuple[bool, float]]]:
+    """Key ordering items the way search results sorted by `sort_by` and `sort_order` are,
+    items missing the sorted property go last.
+
+    Returns None for orders which cannot be reproduced from item data (e.g. relevance).
+    """
+    if sort_by == SearchRequestData.SortBy.SORT_PRICE:
+        value = lambda item: item.price
+    elif sort_by == SearchRequestData.SortBy.SORT_CREATED_TIME:
+        value = lambda item: None if item.created is None else item.created.timestamp()
+    else:
+        return None
+    sign = -1 if sort_order == SearchRequestData.SortOrder.ORDER_DESC else 1
+
+    def key(item: SearchResultItem) -> Tuple[bool, float]:
+        v = value(item)
+        return (True, 0.0) if v is None else (False, sign * v)
+
+    return key
+
+
+class CategoryCrawler:
+    """Search a category by searching each of its leaf subcategories.
+
+    The category is expanded into its leaf descendants using the category tree
+    of a :class:`~mercapi.facets.FacetCatalog`. Leaves are searched concurrently,
+    each one paged through until its results end (or `max_pages`), so every leaf
+    has its own pagination depth. Results are deduplicated by `id_` and merged
+    in the order given by `sort_by` and `sort_order`. Orders which cannot be
+    reproduced from item data (relevance, likes) are merged by rank within leaves.
+
+    Iterate over the crawler to receive unique results as they are merged::
+
+        crawler = CategoryCrawler(m, "", 1, sort_by=SearchRequestData.SortBy.SORT_PRICE)
+        async for item in crawler:
+            ...
+        print(crawler.num_found)
+    """
+
+    def __init__(
+        self,
+        mercapi: "Mercapi",
+        query: str,
+        category_id: int,
+        *,
+        catalog: Optional[FacetCatalog] = None,
+        concurrency: int = 4,
+        max_pages: Optional[int] = None,
+        buffer: int = 120,
+        **search_parameters,
+    ):
+        """
+        :param mercapi: client used for sending requests
+        :param query: string results should match
+        :param category_id: id of the category to search, e.g. `root_category_id` of an item
+        :param catalog: catalog with the category tree, the bundled facets by default
+        :param concurrency: maximum number of search requests in flight
+        :param max_pages: maximum number of pages fetched per leaf category
+        :param buffer: number of results buffered ahead of the merge per leaf category
+        :param search_parameters: any other keyword parameter accepted by :func:`~mercapi.Mercapi.search`
+            except `categories`
+        """
+        if "categories" in search_parameters:
+            raise ValueError("categories cannot be combined with category_id")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if catalog is None:
+            catalog = FacetCatalog()
+        try:
+            leaves = catalog.categories.leaves(category_id)
+        except KeyError:
+            raise ValueError(f"Unknown category {category_id}") from None
+
+        self._mercapi = mercapi
+        self._query = query
+        self._concurrency = concurrency
+        self._max_pages = max_pages
+        self._buffer = buffer
+        self._search_parameters = search_parameters
+        self._key = sort_key(
+            search_parameters.get("sort_by", SearchRequestData.SortBy.SORT_SCORE),
+            search_parameters.get("sort_order", SearchRequestData.SortOrder.ORDER_DESC),
+        )
+
+        self.leaves: List[int] = [c.id_ for c in leaves]
+        """Ids of leaf categories searched."""
+        self.num_found: Dict[int, int] = {}
+        """Number of results reported for each leaf category searched so far."""
+        self._seen: Set[str] = set()
+
+    @property
+    def items_found(self) -> int:
+        """Number of unique results received so far."""
+        return len(self._seen)
+
+    def __aiter__(self) -> AsyncIterator[SearchResultItem]:
+        return self.crawl()
+
+    async def crawl(self) -> AsyncIterator[SearchResultItem]:
+        semaphore = asyncio.Semaphore(self._concurrency)
+        queues = [asyncio.Queue(maxsize=self._buffer) for _ in self.leaves]
+        tasks = [
+            asyncio.ensure_future(self._crawl_leaf(leaf, semaphore, queue))
+            for leaf, queue in zip(self.leaves, queues)
+        ]
+        heap: List[Tuple[Any, int, int, SearchResultItem]] = []
+        ranks = [0] * len(queues)
+
+        async def advance(index: int) -> None:
+            item = await queues[index].get()
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            rank = ranks[index]
+            ranks[index] += 1
+            key = rank if self._key is None else self._key(item)
+            heapq.heappush(heap, (key, rank, index, item))
+
+        try:
+            for index in range(len(queues)):
+                await advance(index)
+            while heap:
+                _, _, index, item = heapq.heappop(heap)
+                await advance(index)
+                if item.id_ in self._seen:
+                    continue
+                self._seen.add(item.id_)
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _crawl_leaf(
+        self, category_id: int, semaphore: asyncio.Semaphore, results: asyncio.Queue
+    ) -> None:
+        try:
+            request = self._mercapi._search_request(
+                self._query,
+                categories=[category_id],
+                **self._search_parameters,
+            )
+            async with semaphore:
+                page = await self._mercapi._search_impl(request)
+            self.num_found[category_id] = page.meta.num_found
+            pages = 1
+            while True:
+                for item in page.items:
+                    await results.put(item)
+                if page.meta.next_page_token == "" or pages == self._max_pages:
+                    break
+                request = copy(request)
+                request.page_token = page.meta.next_page_token
+                async with semaphore:
+                    page = await self._mercapi._search_impl(request)
+                pages += 1
+        except Exception as exc:
+            await results.put(exc)
+        else:
+            await results.put(_DONE)
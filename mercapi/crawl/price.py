@@ -0,0 +1,173 @@
+import asyncio
+from copy import copy
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional, Set
+
+if TYPE_CHECKING:
+    from mercapi import Mercapi
+from mercapi.models import SearchResults, SearchResultItem
+
+# lowest and highest price accepted by mercari.jp listings
+PRICE_MIN = 300
+PRICE_MAX = 9_999_999
+
+
+@dataclass
+class PriceShard:
+    price_min: int
+    price_max: int
+    num_found: int
+    pages: int = 0
+
+
+class PriceShardCrawler:
+    """Enumerate search results beyond pagination depth by splitting the query
+    into price ranges.
+
+    Each price range (shard) is probed first. Shards reporting more results than
+    `window` are split in half until they do, then every page of each shard is
+    fetched. Shards run concurrently, results are deduplicated by `id_`.
+
+    Iterate over the crawler to receive unique results as they arrive::
+
+        crawler = PriceShardCrawler(m, "sharpnel", categories=[75])
+        async for item in crawler:
+            ...
+        print(crawler.coverage)
+    """
+
+    def __init__(
+        self,
+        mercapi: "Mercapi",
+        query: str,
+        *,
+        price_min: int = PRICE_MIN,
+        price_max: int = PRICE_MAX,
+        window: int = 1200,
+        concurrency: int = 4,
+        buffer: int = 1000,
+        **search_parameters,
+    ):
+        """
+        :param mercapi: client used for sending requests
+        :param query: string results should match
+        :param price_min: lower bound of crawled price range
+        :param price_max: upper bound of crawled price range
+        :param window: number of results a single query can be paged through
+        :param concurrency: maximum number of search requests in flight
+        :param buffer: number of results buffered ahead of the consumer
+        :param search_parameters: any other keyword parameter accepted by :func:`~mercapi.Mercapi.search`
+        """
+        if price_min > price_max:
+            raise ValueError("price_min must not be greater than price_max")
+
+        self._mercapi = mercapi
+        self._query = query
+        self._price_min = price_min
+        self._price_max = price_max
+        self._window = window
+        self._concurrency = concurrency
+        self._buffer = buffer
+        self._search_parameters = search_parameters
+
+        self.num_found: Optional[int] = None
+        """Number of results reported for the whole price range."""
+        self.shards: List[PriceShard] = []
+        """Leaf shards crawled so far."""
+        self._seen: Set[str] = set()
+
+    @property
+    def items_found(self) -> int:
+        """Number of unique results received so far."""
+        return len(self._seen)
+
+    @property
+    def coverage(self) -> Optional[float]:
+        """Ratio of unique results received to results reported for the whole range."""
+        if self.num_found is None:
+            return None
+        if self.num_found == 0:
+            return 1.0
+        return self.items_found / self.num_found
+
+    def __aiter__(self) -> AsyncIterator[SearchResultItem]:
+        return self.crawl()
+
+    async def crawl(self) -> AsyncIterator[SearchResultItem]:
+        results: asyncio.Queue = asyncio.Queue(maxsize=self._buffer)
+        semaphore = asyncio.Semaphore(self._concurrency)
+        tasks: Set[asyncio.Future] = set()
+
+        def spawn(price_min: int, price_max: int) -> None:
+            task = asyncio.ensure_future(
+                self._crawl_shard(price_min, price_max, semaphore, results, spawn)
+            )
+            tasks.add(task)
+            task.add_done_callback(lambda t: finished(t))
+
+        def finished(task: asyncio.Future) -> None:
+            tasks.discard(task)
+            if task.cancelled():
+                return
+            if task.exception() is not None:
+                asyncio.ensure_future(results.put(task.exception()))
+            elif not tasks:
+                asyncio.ensure_future(results.put(None))
+
+        spawn(self._price_min, self._price_max)
+        try:
+            while True:
+                item = await results.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                if item.id_ in self._seen:
+                    continue
+                self._seen.add(item.id_)
+                yield item
+        finally:
+            for task in list(tasks):
+                task.cancel()
+
+    async def _crawl_shard(
+        self,
+        price_min: int,
+        price_max: int,
+        semaphore: asyncio.Semaphore,
+        results: asyncio.Queue,
+        spawn,
+    ) -> None:
+        request = self._mercapi._search_request(
+            self._query,
+            price_min=price_min,
+            price_max=price_max,
+            **self._search_parameters,
+        )
+        async with semaphore:
+            page = await self._mercapi._search_impl(request)
+        if self.num_found is None:
+            self.num_found = page.meta.num_found
+
+        if page.meta.num_found > self._window and price_min < price_max:
+            middle = (price_min + price_max) // 2
+            spawn(price_min, middle)
+            spawn(middle + 1, price_max)
+            return
+
+        shard = PriceShard(price_min, price_max, page.meta.num_found)
+        self.shards.append(shard)
+        while True:
+            shard.pages += 1
+            await self._put_all(page, results)
+            if page.meta.next_page_token == "":
+                break
+            request = copy(request)
+            request.page_token = page.meta.next_page_token
+            async with semaphore:
+                page = await self._mercapi._search_impl(request)
+
+    @staticmethod
+    async def _put_all(page: SearchResults, results: asyncio.Queue) -> None:
+        for item in page.items:
+            await results.put(item)
@@ -0,0 +1,276 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional, Set, Union
+
+if TYPE_CHECKING:
+    from mercapi import Mercapi
+from mercapi.cache.http import canonical_body
+from mercapi.models import SearchResults
+from mercapi.requests import SearchRequestData
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class ScheduledSearch:
+    """Fresh results of a scheduled query."""
+
+    name: str
+    results: SearchResults
+
+
+@dataclass
+class ScheduledQuery:
+    """Refresh state of a unique search request, shared by all subscriptions
+    (names) scheduled with an identical request."""
+
+    request: SearchRequestData
+    subscriptions: Dict[str, "Subscription"] = field(default_factory=dict)
+    next_run: float = 0.0
+    in_flight: bool = False
+    runs: int = 0
+    errors: int = 0
+    last_lag: float = 0.0
+    """Delay between the moment the query was due and its last request, in seconds."""
+
+    @property
+    def interval(self) -> float:
+        return min(s.interval for s in self.subscriptions.values())
+
+    @property
+    def priority(self) -> int:
+        return max(s.priority for s in self.subscriptions.values())
+
+
+@dataclass
+class Subscription:
+    """Query scheduled under a single name."""
+
+    name: str
+    key: str
+    interval: float
+    priority: int
+
+
+class SearchScheduler:
+    """Refresh many saved searches over a single client.
+
+    Queries are refreshed every `interval` seconds, sending at most `budget`
+    requests per second and keeping at most `concurrency` requests in flight.
+    Requests are spread evenly over time instead of being sent in bursts.
+    Due queries are served in order of their lag (plus the time of one request
+    slot) weighted by `1 + priority`, so higher priority queries go first,
+    but no query is starved. Identical queries added under different names are sent
+    as one request and their results are delivered to every name.
+
+    Iterate over the scheduler to receive results as they arrive::
+
+        scheduler = SearchScheduler(m, budget=2)
+        scheduler.add("sharpnel", "sharpnel", interval=60, priority=1)
+        scheduler.add("cyclick", "cyclick", interval=300, categories=[75])
+        async for search in scheduler:
+            print(search.name, search.results.meta.num_found)
+    """
+
+    def __init__(
+        self, mercapi: "Mercapi", *, budget: float = 4.0, concurrency: int = 4
+    ):
+        """
+        :param mercapi: client used for sending requests
+        :param budget: maximum number of requests sent per second
+        :param concurrency: maximum number of requests in flight
+        """
+        if budget <= 0:
+            raise ValueError("budget must be positive")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        self._mercapi = mercapi
+        self._budget = budget
+        self._concurrency = concurrency
+        self._queries: Dict[str, ScheduledQuery] = {}
+        self._subscriptions: Dict[str, Subscription] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._next_slot = 0.0
+
+    @property
+    def queries(self) -> Dict[str, ScheduledQuery]:
+        """Unique scheduled queries by their request key."""
+        return dict(self._queries)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of queries due for refresh and waiting for their turn."""
+        now = self._now()
+        return len(self._due(now))
+
+    def lag(self, name: str) -> float:
+        """Time in seconds the query named `name` has been waiting
+        for refresh since it became due, 0 if it is not due."""
+        query = self._queries[self._subscriptions[name].key]
+        if query.in_flight:
+            return 0.0
+        return max(self._now() - query.next_run, 0.0)
+
+    def add(
+        self,
+        name: str,
+        query: Union[str, SearchRequestData],
+        *,
+        interval: float,
+        priority: int = 0,
+        **search_parameters,
+    ) -> None:
+        """Schedule a query.
+
+        :param name: identifier of the query, results are delivered under this name
+        :param query: string results should match or complete search request data
+        :param interval: time between refreshes in seconds
+        :param priority: non-negative priority, higher is served sooner
+        :param search_parameters: any other keyword parameter accepted by :func:`~mercapi.Mercapi.search`,
+            only when `query` is a string
+        """
+        if name in self._subscriptions:
+            raise ValueError(f"Query {name} is already scheduled")
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        if priority < 0:
+            raise ValueError("priority must not be negative")
+        if isinstance(query, SearchRequestData):
+            if search_parameters:
+                raise ValueError(
+                    "Search parameters cannot be combined with search request data"
+                )
+            request = query
+        else:
+            request = self._mercapi._search_request(query, **search_parameters)
+
+        key = self.key(request)
+        subscription = Subscription(name, key, interval, priority)
+        scheduled = self._queries.get(key)
+        if scheduled is None:
+            scheduled = self._queries[key] = ScheduledQuery(
+                request, next_run=self._now()
+            )
+        scheduled.subscriptions[name] = subscription
+        self._subscriptions[name] = subscription
+        self._wake_up()
+
+    def remove(self, name: str) -> None:
+        """Stop refreshing the query named `name`."""
+        subscription = self._subscriptions.pop(name)
+        scheduled = self._queries[subscription.key]
+        del scheduled.subscriptions[name]
+        if not scheduled.subscriptions:
+            del self._queries[subscription.key]
+        self._wake_up()
+
+    @staticmethod
+    def key(request: SearchRequestData) -> str:
+        """Identifier of a request, equal for requests returning the same results."""
+        return canonical_body(request.data)
+
+    def __aiter__(self) -> AsyncIterator[ScheduledSearch]:
+        return self.run()
+
+    async def run(self) -> AsyncIterator[ScheduledSearch]:
+        """Refresh scheduled queries indefinitely and yield their results."""
+        results: asyncio.Queue = asyncio.Queue()
+        self._wakeup = asyncio.Event()
+        dispatcher = asyncio.ensure_future(self._dispatch(results))
+        try:
+            while True:
+                result = await results.get()
+                if isinstance(result, Exception):
+                    raise result
+                yield result
+        finally:
+            dispatcher.cancel()
+            self._wakeup = None
+
+    def _now(self) -> float:
+        try:
+            return asyncio.get_running_loop().time()
+        except RuntimeError:
+            return 0.0
+
+    def _wake_up(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _due(self, now: float) -> List[ScheduledQuery]:
+        return [
+            q for q in self._queries.values() if not q.in_flight and q.next_run <= now
+        ]
+
+    async def _dispatch(self, results: asyncio.Queue) -> None:
+        semaphore = asyncio.Semaphore(self._concurrency)
+        tasks: Set[asyncio.Future] = set()
+        try:
+            while True:
+                self._wakeup.clear()
+                now = self._now()
+                due = self._due(now)
+                if not due:
+                    waiting = [
+                        q.next_run for q in self._queries.values() if not q.in_flight
+                    ]
+                    timeout = min(waiting) - now if waiting else None
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                await semaphore.acquire()
+                delay = self._next_slot - self._now()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                now = self._now()
+                due = self._due(now)
+                if not due:
+                    semaphore.release()
+                    continue
+                slot = 1 / self._budget
+                query = max(
+                    due, key=lambda q: (now - q.next_run + slot) * (1 + q.priority)
+                )
+                self._next_slot = max(self._next_slot, now) + slot
+                query.in_flight = True
+                query.last_lag = now - query.next_run
+                task = asyncio.ensure_future(
+                    self._refresh(query, now, semaphore, results)
+                )
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except Exception as exc:
+            await results.put(exc)
+        finally:
+            for task in list(tasks):
+                task.cancel()
+
+    async def _refresh(
+        self,
+        query: ScheduledQuery,
+        started: float,
+        semaphore: asyncio.Semaphore,
+        results: asyncio.Queue,
+    ) -> None:
+        try:
+            page = await self._mercapi._search_impl(query.request)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            query.errors += 1
+            log.warning(f"Failed to refresh scheduled query {query.request}: {exc!r}")
+        else:
+            query.runs += 1
+            for name in query.subscriptions:
+                results.put_nowait(ScheduledSearch(name, page))
+        finally:
+            semaphore.release()
+            query.in_flight = False
+            if query.subscriptions:
+                query.next_run = started + query.interval
+            self._wake_up()
@@ -0,0 +1,319 @@
+import asyncio
+import logging
+from collections import OrderedDict
+from copy import copy
+from dataclasses import dataclass
+from datetime import datetime
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Optional,
+    Set,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from mercapi import Mercapi
+from mercapi.models import SearchResultItem
+from mercapi.requests import SearchRequestData
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class ListingEvent:
+    """New listing, or a change of price or status of an already seen one."""
+
+    query: str
+    item: SearchResultItem
+    previous_price: Optional[int] = None
+    previous_status: Optional[str] = None
+    new: bool = True
+
+    @property
+    def price_changed(self) -> bool:
+        return not self.new and self.previous_price != self.item.price
+
+    @property
+    def status_changed(self) -> bool:
+        return not self.new and self.previous_status != self.item.status
+
+
+class WatchedQuery:
+    """Polling state of a single watched query."""
+
+    def __init__(self, query: str, interval: float, search_parameters: dict):
+        self.query = query
+        self.search_parameters = search_parameters
+        self.high_water_mark: Optional[datetime] = None
+        """Creation time of the newest listing seen so far."""
+        self.seen: "OrderedDict[str, Tuple[int, str]]" = OrderedDict()
+        """Price and status of recently seen listings, by id."""
+        self.interval = interval
+        """Current polling interval in seconds."""
+        self.rate: Optional[float] = None
+        """Estimated number of new listings per second."""
+        self.polls = 0
+        self.next_poll = 0.0
+        self.last_poll: Optional[float] = None
+        self.polling = False
+
+
+class ListingWatcher:
+    """Poll many search queries for new listings and changes of seen ones.
+
+    Every query is searched by creation time, newest first. Listings created after
+    the newest one seen so far (the high-water mark) are reported as new,
+    listings seen before are reported if their price or status changed.
+    Further pages are fetched only until a page contains listings seen before.
+    The first poll of a query only records current listings, unless `emit_initial` is set.
+
+    Each query is polled in its own interval, adjusted so that about `target_per_poll`
+    new listings are found per poll, based on the rate at which the query produced
+    new listings so far.
+
+    ::
+
+        watcher = ListingWatcher(m)
+        watcher.add("sharpnel", categories=[75])
+        async for event in watcher:
+            if event.new:
+                ...
+    """
+
+    def __init__(
+        self,
+        mercapi: "Mercapi",
+        *,
+        min_interval: float = 5.0,
+        max_interval: float = 300.0,
+        target_per_poll: float = 10.0,
+        smoothing: float = 0.3,
+        max_seen: int = 1000,
+        max_pages: int = 5,
+        concurrency: int = 4,
+        emit_initial: bool = False,
+    ):
+        """
+        :param mercapi: client used for sending requests
+        :param min_interval: shortest time between polls of a single query in seconds
+        :param max_interval: longest time between polls of a single query in seconds
+        :param target_per_poll: number of new listings a single poll should find
+        :param smoothing: weight of the latest poll in the estimated rate of new listings
+        :param max_seen: number of most recently seen listings remembered per query
+        :param max_pages: maximum number of pages fetched by a single poll
+        :param concurrency: maximum number of queries polled at the same time
+        :param emit_initial: report listings found by the first poll of each query as new
+        """
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("Intervals must be positive, min_interval <= max_interval")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in (0, 1] range")
+
+        self._mercapi = mercapi
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._target_per_poll = target_per_poll
+        self._smoothing = smoothing
+        self._max_seen = max_seen
+        self._max_pages = max_pages
+        self._concurrency = concurrency
+        self._emit_initial = emit_initial
+        self._queries: Dict[str, WatchedQuery] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+
+    @property
+    def queries(self) -> Dict[str, WatchedQuery]:
+        """Watched queries by their key."""
+        return dict(self._queries)
+
+    def add(self, query: str, *, key: Optional[str] = None, **search_parameters) -> str:
+        """Start watching a query.
+
+        :param query: string results should match
+        :param key: identifier of the watched query, `query` by default
+        :param search_parameters: any other keyword parameter accepted by :func:`~mercapi.Mercapi.search`
+            except for sorting
+        :return: key of the watched query
+        """
+        key = query if key is None else key
+        if key in self._queries:
+            raise ValueError(f"Query {key} is already watched")
+        self._queries[key] = WatchedQuery(query, self._min_interval, search_parameters)
+        self._wake_up()
+        return key
+
+    def remove(self, key: str) -> None:
+        """Stop watching a query."""
+        del self._queries[key]
+        self._wake_up()
+
+    def _wake_up(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def __aiter__(self) -> AsyncIterator[ListingEvent]:
+        return self.watch()
+
+    async def watch(self) -> AsyncIterator[ListingEvent]:
+        """Poll watched queries indefinitely and yield new and changed listings."""
+        events: asyncio.Queue = asyncio.Queue()
+        self._wakeup = asyncio.Event()
+        scheduler = asyncio.ensure_future(self._schedule(events))
+        try:
+            while True:
+                event = await events.get()
+                if isinstance(event, Exception):
+                    raise event
+                yield event
+        finally:
+            scheduler.cancel()
+            self._wakeup = None
+
+    async def _schedule(self, events: asyncio.Queue) -> None:
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self._concurrency)
+        tasks: Set[asyncio.Future] = set()
+        try:
+            while True:
+                self._wakeup.clear()
+                now = loop.time()
+                timeout = None
+                for key, state in self._queries.items():
+                    if state.polling:
+                        continue
+                    if state.next_poll <= now:
+                        state.polling = True
+                        task = asyncio.ensure_future(
+                            self._poll(key, state, semaphore, events)
+                        )
+                        tasks.add(task)
+                        task.add_done_callback(tasks.discard)
+                    else:
+                        wait = state.next_poll - now
+                        timeout = wait if timeout is None else min(timeout, wait)
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        except Exception as exc:
+            await events.put(exc)
+        finally:
+            for task in list(tasks):
+                task.cancel()
+
+    async def _poll(
+        self,
+        key: str,
+        state: WatchedQuery,
+        semaphore: asyncio.Semaphore,
+        events: asyncio.Queue,
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            async with semaphore:
+                found = await self._fetch(state, events.put_nowait)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            log.warning(f"Failed to poll watched query {key}: {exc!r}")
+            state.interval = min(state.interval * 2, self._max_interval)
+        else:
+            self._reschedule(state, found, loop.time())
+        finally:
+            state.polling = False
+            state.next_poll = loop.time() + state.interval
+            self._wake_up()
+
+    async def _fetch(
+        self, state: WatchedQuery, emit: Callable[[ListingEvent], None]
+    ) -> int:
+        """Fetch pages of a query until no new listings are found and pass events to `emit`.
+
+        :return: number of new listings
+        """
+        initial = state.high_water_mark is None
+        high_water_mark = state.high_water_mark
+        new = 0
+        request = self._mercapi._search_request(
+            state.query,
+            sort_by=SearchRequestData.SortBy.SORT_CREATED_TIME,
+            sort_order=SearchRequestData.SortOrder.ORDER_DESC,
+            **state.search_parameters,
+        )
+        page = await self._mercapi._search_impl(request)
+        for page_number in range(1, self._max_pages + 1):
+            reached_seen = False
+            for item in page.items:
+                event = self._diff(state, item, high_water_mark)
+                if event is None or not event.new:
+                    reached_seen = True
+                if event is None:
+                    continue
+                if event.new:
+                    new += 1
+                    if initial and not self._emit_initial:
+                        continue
+                emit(event)
+            if (
+                initial
+                or reached_seen
+                or page.meta.next_page_token == ""
+                or page_number == self._max_pages
+            ):
+                break
+            request = copy(request)
+            request.page_token = page.meta.next_page_token
+            page = await self._mercapi._search_impl(request)
+
+        state.polls += 1
+        return 0 if initial else new
+
+    def _diff(
+        self,
+        state: WatchedQuery,
+        item: SearchResultItem,
+        high_water_mark: Optional[datetime],
+    ) -> Optional[ListingEvent]:
+        previous = state.seen.get(item.id_)
+        state.seen[item.id_] = (item.price, item.status)
+        state.seen.move_to_end(item.id_)
+        if len(state.seen) > self._max_seen:
+            state.seen.popitem(last=False)
+        if item.created is not None and (
+            state.high_water_mark is None or item.created > state.high_water_mark
+        ):
+            state.high_water_mark = item.created
+
+        if previous is not None:
+            price, status = previous
+            if price == item.price and status == item.status:
+                return None
+            return ListingEvent(state.query, item, price, status, new=False)
+        if (
+            high_water_mark is None
+            or item.created is None
+            # creation times have one second resolution, listings created
+            # in the same second as the high-water mark may still be new
+            or item.created >= high_water_mark
+        ):
+            return ListingEvent(state.query, item)
+        return None
+
+    def _reschedule(self, state: WatchedQuery, found: int, now: float) -> None:
+        if state.last_poll is not None:
+            rate = found / max(now - state.last_poll, 1e-9)
+            state.rate = (
+                rate
+                if state.rate is None
+                else self._smoothing * rate + (1 - self._smoothing) * state.rate
+            )
+            interval = (
+                self._max_interval
+                if state.rate == 0
+                else self._target_per_poll / state.rate
+            )
+            state.interval = min(max(interval, self._min_interval), self._max_interval)
+        state.last_poll = now
@@ -0,0 +1,4 @@
+from .base import Sink, to_record
+from .ndjson import NDJSONSink
+from .parquet import ParquetSink, arrow_schema
+from .sqlite import SQLiteSink
@@ -0,0 +1,154 @@
+import asyncio
+import sys
+from abc import ABC, abstractmethod
+import typing
+from dataclasses import fields, is_dataclass
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    Union,
+)
+
+from mercapi.models import Items, SearchResults
+from mercapi.models.base import ResponseModel
+
+Record = Dict[str, Any]
+
+
+def to_plain(value: Any) -> Any:
+    """Convert a mapped value into JSON compatible data.
+
+    Models become dicts keyed by their (public) attribute names, projected results
+    (named tuples) dicts keyed by their fields, datetimes seconds since epoch.
+    """
+    if isinstance(value, ResponseModel):
+        return to_record(value)
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    if isinstance(value, tuple) and hasattr(value, "_asdict"):
+        return {k: to_plain(v) for k, v in value._asdict().items()}
+    if isinstance(value, (list, tuple)):
+        return [to_plain(v) for v in value]
+    return value
+
+
+def to_record(model: Union[ResponseModel, tuple]) -> Record:
+    """Convert a model (or a projected result) into a flat-keyed dict of plain values."""
+    if isinstance(model, tuple):
+        return to_plain(model)
+    return {
+        f.name: to_plain(getattr(model, f.name))
+        for f in fields(model)
+        if not f.name.startswith("_")
+    }
+
+
+def field_types(model: Type[ResponseModel]) -> Dict[str, Any]:
+    """Types of public attributes of a model class, with forward references resolved."""
+    annotations = {f.name: f.type for f in fields(model) if not f.name.startswith("_")}
+    holder = type("_Annotations", (), {"__annotations__": annotations})
+    return typing.get_type_hints(
+        holder,
+        globalns=vars(sys.modules[model.__module__]),
+        localns={model.__name__: model, **vars(model)},
+    )
+
+
+def unwrap_optional(type_: Any) -> Any:
+    if typing.get_origin(type_) is Union:
+        args = [a for a in typing.get_args(type_) if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return type_
+
+
+def is_model(type_: Any) -> bool:
+    return isinstance(type_, type) and is_dataclass(type_)
+
+
+class Sink(ABC):
+    """Destination of mapped results, written in batches.
+
+    Results are buffered until `batch_size` of them are collected, then the whole
+    batch is written by a worker thread, so the event loop is not blocked
+    and memory use stays bounded regardless of number of results written.
+
+    Sinks are async context managers, the last batch is written on exit::
+
+        async with NDJSONSink("sharpnel.ndjson.gz") as sink:
+            await sink.write_all(m.search_iter("sharpnel"))
+    """
+
+    def __init__(self, batch_size: int):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self._batch_size = batch_size
+        self._batch: List[Any] = []
+        self._lock: Optional[asyncio.Lock] = None
+        self.written = 0
+        """Number of results written so far."""
+
+    async def write(self, result: Any) -> None:
+        """Buffer a single result, pages of search results and seller items
+        (`SearchResults`, `Items`) are expanded into their items."""
+        if isinstance(result, (SearchResults, Items)):
+            self._batch.extend(result.items)
+        else:
+            self._batch.append(result)
+        if len(self._batch) >= self._batch_size:
+            await self.flush()
+
+    async def write_all(self, results: Union[Iterable[Any], AsyncIterable[Any]]) -> int:
+        """Write every result of a (async) iterable, e.g. :func:`~mercapi.Mercapi.search_iter`
+        or a crawler.
+
+        :return: number of results written
+        """
+        written = self.written
+        if hasattr(results, "__aiter__"):
+            async for result in results:
+                await self.write(result)
+        else:
+            for result in results:
+                await self.write(result)
+        await self.flush()
+        return self.written - written
+
+    async def flush(self) -> None:
+        """Write buffered results."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            batch, self._batch = self._batch, []
+            if batch:
+                await self._run(self._write_batch, batch)
+                self.written += len(batch)
+
+    async def close(self) -> None:
+        """Write buffered results and release the underlying file or connection."""
+        await self.flush()
+        await self._run(self._close)
+
+    async def __aenter__(self) -> "Sink":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    @staticmethod
+    async def _run(fn, *args) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+
+    @abstractmethod
+    def _write_batch(self, batch: List[Any]) -> None:
+        """Write a batch of results, called from a worker thread."""
+
+    @abstractmethod
+    def _close(self) -> None:
+        """Release the underlying file or connection, called from a worker thread."""
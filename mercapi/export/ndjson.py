@@ -0,0 +1,60 @@
+import gzip
+import json
+from pathlib import Path
+from typing import Any, List, Optional, Union
+
+from mercapi.export.base import Sink, to_record
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def _dumps(record: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf8")
+
+
+class NDJSONSink(Sink):
+    """Write results as newline-delimited JSON, one object per line.
+
+    Every batch is serialized (with orjson when installed) into a single buffer
+    and written with one call. Files whose name ends with `.gz` are gzip-compressed
+    unless `compression` says otherwise. Datetimes are written as seconds since epoch.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        compression: Optional[str] = "auto",
+        compresslevel: int = 6,
+        append: bool = False,
+        batch_size: int = 1000,
+    ):
+        """
+        :param path: file to write to
+        :param compression: `"gzip"`, None for plain text or `"auto"` to choose by suffix of `path`
+        :param compresslevel: gzip compression level, from 1 (fastest) to 9 (smallest)
+        :param append: append to an existing file instead of replacing it
+        :param batch_size: number of results serialized and written at once
+        """
+        super().__init__(batch_size)
+        path = Path(path)
+        if compression == "auto":
+            compression = "gzip" if path.suffix == ".gz" else None
+        mode = "ab" if append else "wb"
+        if compression == "gzip":
+            self._file = gzip.open(path, mode, compresslevel=compresslevel)
+        elif compression is None:
+            self._file = open(path, mode)
+        else:
+            raise ValueError(f"Unsupported compression {compression!r}")
+
+    def _write_batch(self, batch: List[Any]) -> None:
+        self._file.write(b"".join(_dumps(to_record(r)) for r in batch))
+
+    def _close(self) -> None:
+        self._file.close()
@@ -0,0 +1,136 @@
+import json
+import typing
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Type, Union
+
+from mercapi.export.base import Sink, field_types, is_model, to_record, unwrap_optional
+from mercapi.models.base import ResponseModel
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+Converter = Optional[Callable[[Any], Any]]
+
+_SCALARS = {
+    int: "int64",
+    float: "float64",
+    str: "string",
+    bool: "bool_",
+}
+
+
+def _to_json(value: Any) -> Optional[str]:
+    return None if value is None else json.dumps(value, ensure_ascii=False)
+
+
+def _to_millis(value: Optional[int]) -> Optional[int]:
+    return None if value is None else value * 1000
+
+
+def _list_of(convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    return lambda values: None if values is None else [convert(v) for v in values]
+
+
+def _struct_of(converters: Dict[str, Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    def convert(record: Optional[dict]) -> Optional[dict]:
+        if record is None:
+            return None
+        record = dict(record)
+        for name, fn in converters.items():
+            record[name] = fn(record.get(name))
+        return record
+
+    return convert
+
+
+def _arrow_type(
+    type_: Any, parents: FrozenSet[type]
+) -> Tuple["pyarrow.DataType", Converter]:
+    type_ = unwrap_optional(type_)
+    if type_ in _SCALARS:
+        return getattr(pyarrow, _SCALARS[type_])(), None
+    if type_ is datetime:
+        # Parquet has no second resolution, milliseconds survive a round trip
+        return pyarrow.timestamp("ms", tz="UTC"), _to_millis
+    if typing.get_origin(type_) in (list, List):
+        (element,) = typing.get_args(type_)
+        element_type, convert = _arrow_type(element, parents)
+        return pyarrow.list_(element_type), convert if convert is None else _list_of(
+            convert
+        )
+    if is_model(type_) and type_ not in parents:
+        fields, converters = _model_fields(type_, parents | {type_})
+        return pyarrow.struct(fields), _struct_of(converters) if converters else None
+    # free-form dicts and recursive models have no fixed structure
+    return pyarrow.string(), _to_json
+
+
+def _model_fields(
+    model: Type[ResponseModel], parents: FrozenSet[type]
+) -> Tuple[List["pyarrow.Field"], Dict[str, Callable[[Any], Any]]]:
+    fields = []
+    converters = {}
+    for name, type_ in field_types(model).items():
+        arrow_type, convert = _arrow_type(type_, parents)
+        fields.append(pyarrow.field(name, arrow_type))
+        if convert is not None:
+            converters[name] = convert
+    return fields, converters
+
+
+def arrow_schema(model: Type[ResponseModel]) -> "pyarrow.Schema":
+    """Arrow schema of a model class, requires pyarrow package.
+
+    Attributes become columns of the same name, nested models become structs,
+    lists become list columns and datetimes UTC timestamps in milliseconds.
+    Free-form dicts and recursive models are stored as JSON strings.
+    """
+    if pyarrow is None:
+        raise RuntimeError("pyarrow package is required for arrow_schema")
+    fields, _ = _model_fields(model, frozenset({model}))
+    return pyarrow.schema(fields)
+
+
+class ParquetSink(Sink):
+    """Write results of a single model class into a Parquet file, one row group per batch.
+
+    The schema is derived from the model class (see :func:`arrow_schema`),
+    so files written from different crawls of the same model can be read
+    as one dataset. Requires pyarrow package.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        model: Type[ResponseModel],
+        *,
+        compression: str = "zstd",
+        batch_size: int = 10_000,
+    ):
+        """
+        :param path: file to write to
+        :param model: class of written results, e.g. `SearchResultItem`
+        :param compression: Parquet compression codec, e.g. `"snappy"`, `"zstd"` or `"none"`
+        :param batch_size: number of results in a row group
+        """
+        if pyarrow is None:
+            raise RuntimeError("pyarrow package is required for ParquetSink")
+        super().__init__(batch_size)
+        fields, converters = _model_fields(model, frozenset({model}))
+        self.schema: "pyarrow.Schema" = pyarrow.schema(fields)
+        self._convert = _struct_of(converters)
+        self._writer = pyarrow.parquet.ParquetWriter(
+            str(path), self.schema, compression=compression
+        )
+
+    def _write_batch(self, batch: List[Any]) -> None:
+        records = [self._convert(to_record(r)) for r in batch]
+        table = pyarrow.Table.from_pylist(records, schema=self.schema)
+        self._writer.write_table(table, row_group_size=len(records))
+
+    def _close(self) -> None:
+        self._writer.close()
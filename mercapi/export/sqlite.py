@@ -0,0 +1,108 @@
+import json
+import re
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, List, Optional, Type, Union
+
+from mercapi.export.base import Sink, field_types, to_record, unwrap_optional
+from mercapi.models.base import ResponseModel
+
+_COLUMN_TYPES = {
+    int: "INTEGER",
+    bool: "INTEGER",
+    float: "REAL",
+    str: "TEXT",
+    datetime: "INTEGER",
+}
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _table_name(model: Type[ResponseModel]) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", model.__name__).lower()
+
+
+class SQLiteSink(Sink):
+    """Upsert results of a single model class into a SQLite table.
+
+    The table is created if it does not exist, with a column for every attribute
+    of the model and `key` as its primary key. Scalars are stored as they are,
+    datetimes as seconds since epoch and nested models, lists and dicts as JSON.
+    Every batch is written with a single `executemany` in one transaction,
+    rows whose key is already present are updated.
+    """
+
+    def __init__(
+        self,
+        database: Union[str, Path, sqlite3.Connection],
+        model: Type[ResponseModel],
+        *,
+        table: Optional[str] = None,
+        key: str = "id_",
+        batch_size: int = 5000,
+    ):
+        """
+        :param database: path of the database file or an open connection,
+            created with `check_same_thread=False`
+        :param model: class of written results, e.g. `SearchResultItem`
+        :param table: name of the table, snake-cased name of `model` by default
+        :param key: attribute identifying results
+        :param batch_size: number of results written in a single transaction
+        """
+        super().__init__(batch_size)
+        types = field_types(model)
+        if key not in types:
+            raise ValueError(f"{model.__name__} has no attribute {key}")
+
+        if isinstance(database, sqlite3.Connection):
+            self._connection = database
+            self._owns_connection = False
+        else:
+            # batches are written by worker threads, one at a time
+            self._connection = sqlite3.connect(str(database), check_same_thread=False)
+            self._owns_connection = True
+
+        self.table = table or _table_name(model)
+        self._columns: List[str] = list(types)
+        self._json_columns = [
+            c for c, t in types.items() if unwrap_optional(t) not in _COLUMN_TYPES
+        ]
+        definitions = ", ".join(
+            f"{_quote(c)} {_COLUMN_TYPES.get(unwrap_optional(t), 'TEXT')}"
+            + (" PRIMARY KEY" if c == key else "")
+            for c, t in types.items()
+        )
+        columns = ", ".join(_quote(c) for c in self._columns)
+        updates = ", ".join(
+            f"{_quote(c)} = excluded.{_quote(c)}" for c in self._columns if c != key
+        )
+        self._insert = (
+            f"INSERT INTO {_quote(self.table)} ({columns}) "
+            f"VALUES ({', '.join('?' for _ in self._columns)}) "
+            f"ON CONFLICT ({_quote(key)}) "
+            + (f"DO UPDATE SET {updates}" if updates else "DO NOTHING")
+        )
+        with self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {_quote(self.table)} ({definitions})"
+            )
+
+    def _row(self, result: Any) -> tuple:
+        record = to_record(result)
+        for column in self._json_columns:
+            value = record.get(column)
+            if value is not None:
+                record[column] = json.dumps(value, ensure_ascii=False)
+        return tuple(record.get(c) for c in self._columns)
+
+    def _write_batch(self, batch: List[Any]) -> None:
+        rows = [self._row(r) for r in batch]
+        with self._connection:
+            self._connection.executemany(self._insert, rows)
+
+    def _close(self) -> None:
+        if self._owns_connection:
+            self._connection.close()
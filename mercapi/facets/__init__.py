@@ -0,0 +1,2 @@
+from .catalog import FacetCatalog
+from .refresh import refresh_facets
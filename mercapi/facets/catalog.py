@@ -0,0 +1,412 @@
+import asyncio
+import hashlib
+import json
+import logging
+import marshal
+import os
+import sys
+import unicodedata
+from bisect import bisect_left
+from importlib import resources
+from pathlib import Path
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+log = logging.getLogger(__name__)
+
+# facet files shipped with the package
+DEFAULT_PATH = Path(str(resources.files("mercapi.facets") / "data"))
+
+# bump whenever structure of saved indexes changes
+_INDEX_VERSION = 2
+
+
+def default_cache_dir() -> Path:
+    """Per-user directory for precompiled facet indexes."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "mercapi" / "facets"
+
+
+def normalize(name: str) -> str:
+    """Normalize a facet name for lookups.
+
+    Width and case are folded, hiragana is converted to katakana,
+    whitespace and middle dots are removed.
+    """
+    name = unicodedata.normalize("NFKC", name).lower()
+    return "".join(
+        chr(ord(c) + 0x60) if "ぁ" <= c <= "ゖ" else c
+        for c in name
+        if not c.isspace() and c != "・"
+    )
+
+
+class Brand(NamedTuple):
+    id_: int
+    name: str
+    sub_name: str
+
+
+class BrandIndex:
+    """Brands with a prefix index of their normalized names and sub-names."""
+
+    def __init__(self, brands: List[Brand]):
+        self.brands: Dict[int, Brand] = {b.id_: b for b in brands}
+        keys = set()
+        for brand in brands:
+            for name in (brand.name, brand.sub_name):
+                if name:
+                    keys.add((normalize(name), brand.id_))
+        ordered = sorted(keys)
+        self._keys: List[str] = [k for k, _ in ordered]
+        self._ids: List[int] = [i for _, i in ordered]
+
+    @classmethod
+    def from_json(cls, data: dict) -> "BrandIndex":
+        return cls(
+            [
+                Brand(b["id"], b["name"], b.get("sub_name", ""))
+                for group in data["data"]
+                for b in group["brands"]
+            ]
+        )
+
+    def _to_state(self) -> tuple:
+        return tuple(tuple(b) for b in self.brands.values()), self._keys, self._ids
+
+    @classmethod
+    def _from_state(cls, state: tuple) -> "BrandIndex":
+        index = cls.__new__(cls)
+        brands, index._keys, index._ids = state
+        index.brands = {b[0]: Brand(*b) for b in brands}
+        return index
+
+    def __len__(self) -> int:
+        return len(self.brands)
+
+    def __getitem__(self, id_: int) -> Brand:
+        return self.brands[id_]
+
+    def search(self, prefix: str, limit: Optional[int] = 20) -> List[Brand]:
+        """Brands whose name or sub-name starts with `prefix`, shortest names first.
+
+        :param prefix: beginning of a brand name in any width, case or kana
+        :param limit: maximum number of brands returned
+        """
+        prefix = normalize(prefix)
+        found: Dict[int, int] = {}
+        i = bisect_left(self._keys, prefix)
+        while i < len(self._keys) and self._keys[i].startswith(prefix):
+            id_ = self._ids[i]
+            length = len(self._keys[i])
+            found[id_] = min(found.get(id_, length), length)
+            i += 1
+        ordered = sorted(found, key=lambda id_: (found[id_], id_))
+        return [self.brands[id_] for id_ in ordered[:limit]]
+
+    def find(self, name: str) -> Optional[Brand]:
+        """Brand whose name or sub-name equals `name` after normalization."""
+        key = normalize(name)
+        i = bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            return self.brands[self._ids[i]]
+        return None
+
+
+class Category(NamedTuple):
+    id_: int
+    name: str
+    parent_id: Optional[int]
+    children: Tuple[int, ...]
+
+
+class CategoryTree:
+    """Category tree with parent, children and descendant lookups.
+
+    Categories are kept in depth-first order, so descendants of every
+    category form a contiguous range.
+    """
+
+    def __init__(self, categories: List[Category]):
+        self._order: List[int] = []
+        self._ranges: Dict[int, Tuple[int, int]] = {}
+        self.categories: Dict[int, Category] = {c.id_: c for c in categories}
+        self.roots: Tuple[int, ...] = tuple(
+            c.id_ for c in categories if c.parent_id is None
+        )
+        for root in self.roots:
+            self._index(root)
+        self._by_name: Dict[str, Tuple[int, ...]] = {}
+        for category in categories:
+            key = normalize(category.name)
+            self._by_name[key] = self._by_name.get(key, ()) + (category.id_,)
+
+    def _index(self, id_: int) -> None:
+        start = len(self._order)
+        self._order.append(id_)
+        for child in self.categories[id_].children:
+            self._index(child)
+        self._ranges[id_] = (start, len(self._order))
+
+    @classmethod
+    def from_json(cls, data: dict) -> "CategoryTree":
+        categories = []
+
+        def add(node: dict, parent_id: Optional[int]) -> None:
+            children = node.get("child", [])
+            categories.append(
+                Category(
+                    node["id"],
+                    node["name"],
+                    parent_id,
+                    tuple(c["id"] for c in children),
+                )
+            )
+            for child in children:
+                add(child, node["id"])
+
+        for root in data["data"]:
+            add(root, None)
+        return cls(categories)
+
+    def _to_state(self) -> tuple:
+        return (
+            tuple(tuple(c) for c in self.categories.values()),
+            self._order,
+            self._ranges,
+            self.roots,
+            self._by_name,
+        )
+
+    @classmethod
+    def _from_state(cls, state: tuple) -> "CategoryTree":
+        tree = cls.__new__(cls)
+        categories, tree._order, tree._ranges, tree.roots, tree._by_name = state
+        tree.categories = {c[0]: Category(*c) for c in categories}
+        return tree
+
+    def __len__(self) -> int:
+        return len(self.categories)
+
+    def __getitem__(self, id_: int) -> Category:
+        return self.categories[id_]
+
+    def parent(self, id_: int) -> Optional[Category]:
+        parent_id = self.categories[id_].parent_id
+        return None if parent_id is None else self.categories[parent_id]
+
+    def children(self, id_: int) -> List[Category]:
+        return [self.categories[c] for c in self.categories[id_].children]
+
+    def descendants(self, id_: int) -> List[Category]:
+        """All categories below `id_`, in depth-first order."""
+        start, end = self._ranges[id_]
+        return [self.categories[c] for c in self._order[start + 1 : end]]
+
+    def ancestors(self, id_: int) -> List[Category]:
+        """Categories above `id_`, starting with its parent."""
+        result = []
+        parent = self.parent(id_)
+        while parent is not None:
+            result.append(parent)
+            parent = self.parent(parent.id_)
+        return result
+
+    def leaves(self, id_: int) -> List[Category]:
+        """Descendants of `id_` without any children (or `id_` itself if it has none)."""
+        start, end = self._ranges[id_]
+        return [
+            self.categories[c]
+            for c in self._order[start:end]
+            if not self.categories[c].children
+        ]
+
+    def find(self, name: str) -> List[Category]:
+        """Categories named `name` after normalization, names are not unique."""
+        return [self.categories[c] for c in self._by_name.get(normalize(name), ())]
+
+
+class Size(NamedTuple):
+    id_: int
+    name: str
+    group_id: int
+
+
+class SizeGroup(NamedTuple):
+    id_: int
+    name: str
+    sizes: Tuple[Size, ...]
+
+
+class SizeGroups:
+    """Sizes grouped by size system (clothes, shoes, etc.)."""
+
+    def __init__(self, sizes: List[Tuple[Size, str]]):
+        groups: Dict[int, Tuple[str, List[Size]]] = {}
+        for size, group_name in sizes:
+            groups.setdefault(size.group_id, (group_name, []))[1].append(size)
+        self.groups: Dict[int, SizeGroup] = {
+            id_: SizeGroup(id_, name, tuple(members))
+            for id_, (name, members) in groups.items()
+        }
+        self.sizes: Dict[int, Size] = {s.id_: s for s, _ in sizes}
+
+    @classmethod
+    def from_json(cls, data: dict) -> "SizeGroups":
+        return cls(
+            [
+                (Size(int(s["id"]), s["name"], int(s["groupId"])), s["group"])
+                for s in data["sizes"]
+            ]
+        )
+
+    def _to_state(self) -> tuple:
+        return tuple(
+            (tuple(s), group.name)
+            for group in self.groups.values()
+            for s in group.sizes
+        )
+
+    @classmethod
+    def _from_state(cls, state: tuple) -> "SizeGroups":
+        return cls([(Size(*s), group_name) for s, group_name in state])
+
+    def __len__(self) -> int:
+        return len(self.groups)
+
+    def __getitem__(self, group_id: int) -> SizeGroup:
+        return self.groups[group_id]
+
+    def __iter__(self) -> Iterator[SizeGroup]:
+        return iter(self.groups.values())
+
+    def find(self, group_id: int, name: str) -> Optional[Size]:
+        """Size named `name` within the group `group_id`."""
+        key = normalize(name)
+        for size in self.groups[group_id].sizes:
+            if normalize(size.name) == key:
+                return size
+        return None
+
+
+Index = Union[BrandIndex, CategoryTree, SizeGroups]
+
+
+class FacetCatalog:
+    """Lookups of facet ids used as search filters, e.g. `categories`, `brands` and `sizes`
+    of :func:`~mercapi.Mercapi.search`.
+
+    Facets are read from files shipped with the package (see `utils/fetch_facets.py`).
+    Every index is built on first use only and saved in `cache_dir`,
+    following loads skip JSON parsing until the source file changes::
+
+        catalog = FacetCatalog()
+        nike = catalog.brands.find("nike")
+        shoes = catalog.categories.find("スニーカー")
+        await m.search("air max", brands=[nike.id_], categories=[c.id_ for c in shoes])
+    """
+
+    _sources: Dict[str, Tuple[str, type]] = {
+        "brands": ("brands.json", BrandIndex),
+        "categories": ("categories.json", CategoryTree),
+        "sizes": ("sizes.json", SizeGroups),
+    }
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_PATH,
+        *,
+        cache_dir: Union[str, Path, None] = None,
+    ):
+        """
+        :param path: directory with facet files
+        :param cache_dir: directory for precompiled indexes, a per-user cache directory
+            (see :func:`default_cache_dir`) by default, indexes are not persisted
+            if it is not writable
+        """
+        self._path = Path(path)
+        self._cache_dir = (
+            Path(cache_dir) if cache_dir is not None else default_cache_dir()
+        )
+        self._indexes: Dict[str, Index] = {}
+
+    @property
+    def brands(self) -> BrandIndex:
+        return self._index("brands")
+
+    @property
+    def categories(self) -> CategoryTree:
+        return self._index("categories")
+
+    @property
+    def sizes(self) -> SizeGroups:
+        return self._index("sizes")
+
+    def reload(self, files: Iterable[str]) -> None:
+        """Rebuild indexes built from any of `files` (e.g. `"brands.json"`).
+
+        Indexes which have not been used yet are left to be built on first use.
+        """
+        self._indexes.update(self._rebuild(files))
+
+    async def areload(self, files: Iterable[str]) -> None:
+        """Like :meth:`reload`, but indexes are rebuilt by a worker thread
+        without blocking the event loop. Old indexes are used until new ones are built."""
+        indexes = await asyncio.get_running_loop().run_in_executor(
+            None, self._rebuild, list(files)
+        )
+        self._indexes.update(indexes)
+
+    def _rebuild(self, files: Iterable[str]) -> Dict[str, Index]:
+        files = set(files)
+        return {
+            name: self._load(name)
+            for name, (source_name, _) in self._sources.items()
+            if source_name in files and name in self._indexes
+        }
+
+    def _index(self, name: str) -> Index:
+        index = self._indexes.get(name)
+        if index is None:
+            index = self._indexes[name] = self._load(name)
+        return index
+
+    def _load(self, name: str) -> Index:
+        source_name, index_class = self._sources[name]
+        source = self._path / source_name
+        stat = source.stat()
+        signature = (_INDEX_VERSION, stat.st_size, stat.st_mtime_ns)
+        # indexes of facets stored in different directories must not collide
+        directory = hashlib.sha256(str(source.resolve()).encode("utf8")).hexdigest()
+        cache = self._cache_dir / f"{name}-{directory[:16]}.index"
+
+        try:
+            with open(cache, "rb") as file:
+                cached_signature, state = marshal.load(file)
+            if cached_signature == signature:
+                return index_class._from_state(state)
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+
+        with open(source, encoding="utf8") as file:
+            index = index_class.from_json(json.load(file))
+        try:
+            self._cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            tmp = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+            with open(tmp, "wb") as file:
+                marshal.dump((signature, index._to_state()), file)
+            os.replace(tmp, cache)
+        except OSError as exc:
+            log.debug(f"Could not save {name} index to {cache}: {exc!r}")
+        return index
@@ -0,0 +1,159 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+from httpx import Request
+
+if TYPE_CHECKING:
+    from mercapi import Mercapi
+from mercapi.facets.catalog import FacetCatalog
+
+log = logging.getLogger(__name__)
+
+FACET_ENDPOINTS = {
+    "categories.json": "https://api.mercari.jp/master/get_item_categories",
+    "brands.json": "https://api.mercari.jp/master/get_item_brands",
+    "sizes.json": "https://api.mercari.jp/services/master/v1/itemSizes",
+    "conditions.json": "https://api.mercari.jp/services/master/v1/itemConditions",
+    "shippingPayers.json": "https://api.mercari.jp/services/master/v1/shippingPayers",
+    "colors.json": "https://api.mercari.jp/services/master/v1/itemColors",
+    "shippingMethods.json": "https://api.mercari.jp/services/master/v1/shippingMethods",
+}
+
+# validators of previous responses and hashes of written facets
+STATE_FILE = ".facets.json"
+
+
+def content_hash(data: dict) -> str:
+    """Hash of facet data, ignoring the time the response was generated at."""
+    if isinstance(data.get("meta"), dict):
+        data = {
+            **data,
+            "meta": {k: v for k, v in data["meta"].items() if k != "requested"},
+        }
+    serialized = json.dumps(data, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(serialized.encode("utf8")).hexdigest()
+
+
+def write_atomic(path: Path, content: bytes) -> None:
+    """Replace file at `path` with `content`, readers never see a partial file."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as file:
+            file.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _file_hash(path: Path) -> Optional[str]:
+    try:
+        with open(path, encoding="utf8") as file:
+            return content_hash(json.load(file))
+    except (OSError, ValueError):
+        return None
+
+
+def _parse(content: bytes) -> Tuple[dict, str]:
+    data = json.loads(content)
+    return data, content_hash(data)
+
+
+def _write_facet(path: Path, data: dict) -> None:
+    write_atomic(path, json.dumps(data, ensure_ascii=False, indent=4).encode("utf8"))
+
+
+def _load_state(path: Path) -> Dict[str, dict]:
+    path.mkdir(parents=True, exist_ok=True)
+    try:
+        with open(path / STATE_FILE, encoding="utf8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+async def refresh_facets(
+    mercapi: "Mercapi",
+    path: Union[str, Path],
+    *,
+    catalog: Optional[FacetCatalog] = None,
+) -> List[str]:
+    """Download facets from all master endpoints concurrently and update changed files.
+
+    Responses are requested conditionally with validators (`ETag`, `Last-Modified`)
+    of previous responses. Files are rewritten (atomically) only when their content
+    changed, and indexes of `catalog` built from changed files are rebuilt.
+    Facets which could not be fetched are logged and left untouched.
+
+    Files are written and indexes rebuilt by worker threads, so it can be run
+    in the background of a long-running service::
+
+        catalog = FacetCatalog(path)
+        asyncio.create_task(refresh_facets(m, path, catalog=catalog))
+
+    :param mercapi: client used for sending requests
+    :param path: directory to store facet files in, e.g. a per-user data directory
+        (facets bundled with the package are read-only)
+    :param catalog: catalog of facets stored in `path` to rebuild indexes of
+    :return: names of files which changed
+    """
+    path = Path(path)
+    loop = asyncio.get_running_loop()
+    state_path = path / STATE_FILE
+    state = await loop.run_in_executor(None, _load_state, path)
+
+    async def refresh(name: str, url: str) -> bool:
+        previous = state.get(name, {})
+        request = Request("GET", url, headers=mercapi._headers)
+        if (path / name).exists():
+            if previous.get("etag"):
+                request.headers["If-None-Match"] = previous["etag"]
+            if previous.get("last_modified"):
+                request.headers["If-Modified-Since"] = previous["last_modified"]
+        res = await mercapi._dispatch(mercapi._sign_request(request))
+        if res.status_code == 304:
+            return False
+        if res.is_error:
+            log.error(f"Request for {url} failed with status code {res.status_code}")
+            return False
+
+        data, digest = await loop.run_in_executor(None, _parse, res.content)
+        current = {
+            "etag": res.headers.get("ETag"),
+            "last_modified": res.headers.get("Last-Modified"),
+            "sha256": digest,
+        }
+        if "sha256" not in previous and (path / name).exists():
+            previous = {
+                "sha256": await loop.run_in_executor(None, _file_hash, path / name)
+            }
+        if digest == previous.get("sha256") and (path / name).exists():
+            state[name] = current
+            return False
+
+        await loop.run_in_executor(None, _write_facet, path / name, data)
+        state[name] = current
+        return True
+
+    names = list(FACET_ENDPOINTS)
+    results = await asyncio.gather(
+        *(refresh(name, FACET_ENDPOINTS[name]) for name in names),
+        return_exceptions=True,
+    )
+    changed = []
+    for name, result in zip(names, results):
+        if isinstance(result, Exception):
+            log.error(f"Failed to refresh {name}: {result!r}")
+        elif result:
+            changed.append(name)
+
+    content = json.dumps(state, indent=4, sort_keys=True).encode("utf8")
+    await loop.run_in_executor(None, write_atomic, state_path, content)
+    if catalog is not None and changed:
+        await catalog.areload(changed)
+    return changed
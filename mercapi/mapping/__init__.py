@@ -1 +1,2 @@
 from .definitions import map_to_class
+from .lazy import map_lazy
@@ -0,0 +1,220 @@
+import importlib
+from array import array
+from functools import partial
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Union
+
+from mercapi.models import SearchResultItem
+from mercapi.util.errors import ParseAPIResponseError
+
+if TYPE_CHECKING:
+    import numpy
+    import pyarrow
+
+# marks a missing integer or timestamp, same bit pattern as numpy's NaT
+NULL = -(2**63)
+
+# column name -> key in API response
+STRING_COLUMNS = {
+    "id_": "id",
+    "name": "name",
+    "seller_id": "sellerId",
+    "status": "status",
+    "item_type": "itemType",
+}
+INT_COLUMNS = {
+    "price": "price",
+    "item_condition_id": "itemConditionId",
+    "shipping_payer_id": "shippingPayerId",
+    "shipping_method_id": "shippingMethodId",
+    "category_id": "categoryId",
+}
+DATETIME_COLUMNS = {
+    "created": "created",
+    "updated": "updated",
+}
+BOOL_COLUMNS = {
+    "is_no_price": "isNoPrice",
+}
+# columns of required SearchResultItem properties
+REQUIRED_COLUMNS = {"id_", "name", "price"}
+
+Column = Union[List[str], array]
+
+
+def _require(package: str, feature: str) -> ModuleType:
+    # imported on first use, optional packages are slow to import
+    try:
+        return importlib.import_module(package)
+    except ImportError:
+        raise RuntimeError(f"{package} package is required for {feature}") from None
+
+
+def _to_int64(value: Any) -> int:
+    value = int(value)
+    if not NULL < value < 2**63:
+        raise OverflowError("Value does not fit into int64")
+    return value
+
+
+def _to_timestamp(value: Any) -> int:
+    return _to_int64(float(value))
+
+
+def _to_str(value: Any) -> str:
+    return value
+
+
+def _optional(value: Any, parse: Callable[[Any], Any], missing: Any) -> Any:
+    if value is None:
+        return missing
+    try:
+        return parse(value)
+    except (TypeError, ValueError, OverflowError):
+        return missing
+
+
+def _required_column(
+    items: List[Dict[str, Any]], key: str, parse: Callable[[Any], Any]
+) -> list:
+    try:
+        values = [parse(x[key]) for x in items]
+        if None in values:
+            raise ValueError("Required property is None")
+        return values
+    except Exception as exc:
+        raise ParseAPIResponseError(
+            f"Failed to retrieve required {SearchResultItem.__name__} property {key} from the response"
+        ) from exc
+
+
+class SearchColumns:
+    """Search results stored column by column instead of as `SearchResultItem` objects.
+
+    Integer columns are stored as int64, timestamps as int64 seconds since epoch
+    and booleans as int8 in typed arrays, string columns as lists of strings.
+    Missing (or unparseable) integers and timestamps are stored as :data:`NULL`,
+    missing strings as empty strings and missing booleans as false.
+
+    Columns are named after `SearchResultItem` attributes, `thumbnails` are not included.
+    Use :meth:`to_numpy` or :meth:`to_arrow` to get arrays suitable for analytics.
+    """
+
+    def __init__(self, columns: Dict[str, Column] = None):
+        self.columns: Dict[str, Column] = columns or {
+            **{name: [] for name in STRING_COLUMNS},
+            **{name: array("q") for name in INT_COLUMNS},
+            **{name: array("q") for name in DATETIME_COLUMNS},
+            **{name: array("b") for name in BOOL_COLUMNS},
+        }
+
+    @classmethod
+    def from_response(cls, items: List[Dict[str, Any]]) -> "SearchColumns":
+        """Fill columns straight from `items` of a search response, without creating
+        intermediate objects for each item.
+
+        Like mapping to `SearchResultItem`, only missing or invalid required properties
+        (`id`, `name`, `price`) raise an error, other values which cannot be parsed
+        are stored as missing.
+
+        :param items: list of items as decoded from the API response
+        :raises ParseAPIResponseError: if a required property is missing or invalid
+        """
+        columns = {}
+        parsers = [
+            (STRING_COLUMNS, _to_str, "", list),
+            (INT_COLUMNS, _to_int64, NULL, partial(array, "q")),
+            (DATETIME_COLUMNS, _to_timestamp, NULL, partial(array, "q")),
+        ]
+        for mapping, parse, missing, column in parsers:
+            for name, key in mapping.items():
+                if name in REQUIRED_COLUMNS:
+                    values = _required_column(items, key, parse)
+                else:
+                    values = [_optional(x.get(key), parse, missing) for x in items]
+                columns[name] = column(values)
+        for name, key in BOOL_COLUMNS.items():
+            columns[name] = array("b", [bool(x.get(key)) for x in items])
+        return cls(columns)
+
+    @classmethod
+    def from_items(cls, items: Iterable[SearchResultItem]) -> "SearchColumns":
+        """Convert already mapped search results into columns."""
+        items = list(items)
+        columns = {}
+        for name in STRING_COLUMNS:
+            columns[name] = [getattr(i, name) or "" for i in items]
+        for name in INT_COLUMNS:
+            values = (getattr(i, name) for i in items)
+            columns[name] = array("q", [NULL if v is None else v for v in values])
+        for name in DATETIME_COLUMNS:
+            values = (getattr(i, name) for i in items)
+            columns[name] = array(
+                "q", [NULL if v is None else int(v.timestamp()) for v in values]
+            )
+        for name in BOOL_COLUMNS:
+            columns[name] = array("b", [bool(getattr(i, name)) for i in items])
+        return cls(columns)
+
+    @classmethod
+    def concat(cls, tables: Iterable["SearchColumns"]) -> "SearchColumns":
+        """Join columns of multiple pages into a single table."""
+        result = cls()
+        for table in tables:
+            result.extend(table)
+        return result
+
+    def extend(self, other: "SearchColumns") -> None:
+        """Append all rows of `other` to this table."""
+        for name, column in self.columns.items():
+            column.extend(other.columns[name])
+
+    def __len__(self) -> int:
+        return len(self.columns["id_"])
+
+    def __getitem__(self, name: str) -> Column:
+        return self.columns[name]
+
+    def __repr__(self) -> str:
+        return f"SearchColumns(rows={len(self)}, columns={list(self.columns)})"
+
+    def to_numpy(self) -> Dict[str, "numpy.ndarray"]:
+        """Return columns as numpy arrays, requires numpy package.
+
+        Integer columns are `int64`, timestamps `datetime64[s]` (missing values are `NaT`),
+        booleans `bool` and strings fixed-width unicode arrays.
+        Numeric arrays share memory with this table,
+        which cannot be extended for as long as they are referenced.
+        """
+        return self._to_numpy(_require("numpy", "SearchColumns.to_numpy"), copy=False)
+
+    def _to_numpy(self, numpy: ModuleType, copy: bool) -> Dict[str, "numpy.ndarray"]:
+        def numeric(name: str, dtype) -> "numpy.ndarray":
+            values = numpy.frombuffer(self.columns[name], dtype=dtype)
+            return values.copy() if copy else values
+
+        result = {}
+        for name in STRING_COLUMNS:
+            result[name] = numpy.array(self.columns[name], dtype=str)
+        for name in INT_COLUMNS:
+            result[name] = numeric(name, numpy.int64)
+        for name in DATETIME_COLUMNS:
+            result[name] = numeric(name, numpy.int64).view("datetime64[s]")
+        for name in BOOL_COLUMNS:
+            result[name] = numeric(name, numpy.int8).view(numpy.bool_)
+        return result
+
+    def to_arrow(self) -> "pyarrow.Table":
+        """Return columns as a pyarrow Table, requires pyarrow and numpy packages.
+
+        Missing integers and timestamps become nulls. The table holds a copy
+        of the columns, so this table can still be extended while it is referenced.
+        """
+        pyarrow = _require("pyarrow", "SearchColumns.to_arrow")
+        numpy = _require("numpy", "SearchColumns.to_arrow")
+        arrays = self._to_numpy(numpy, copy=True)
+        for name in INT_COLUMNS:
+            arrays[name] = pyarrow.array(arrays[name], mask=arrays[name] == NULL)
+        for name in DATETIME_COLUMNS:
+            arrays[name] = pyarrow.array(arrays[name], mask=numpy.isnat(arrays[name]))
+        return pyarrow.table(arrays)
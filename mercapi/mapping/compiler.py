@@ -0,0 +1,107 @@
+from typing import Any, Callable, Dict, NamedTuple, TypeVar
+
+T = TypeVar("T")
+
+
+class InlineSpec(NamedTuple):
+    """
+    Source-level description of an extractor.
+
+    `template` is a Python expression in which `{r}` stands for the response
+    object and every other placeholder refers to an entry in `bindings`.
+    String bindings are embedded as literals, anything else is bound
+    as a global of the generated function.
+    """
+
+    template: str
+    bindings: Dict[str, Any]
+
+
+def inline(extractor: Callable[[dict], T], template: str, **bindings: Any):
+    """Attach an :class:`InlineSpec` to an extractor so that compiled mappers
+    can evaluate it without an extra function call."""
+    extractor.inline_spec = InlineSpec(template, bindings)
+    return extractor
+
+
+def compile_mapping(
+    clazz: type,
+    mapping_definition,
+    fallback: Callable[[dict], Any],
+    required_error: Callable[[str], Exception],
+    report_optional: Callable[[str, dict, Exception], None],
+) -> Callable[[dict], Any]:
+    """Generate a single function mapping a response object to `clazz`.
+
+    The generated function evaluates all extractors of `mapping_definition`
+    one after another and calls `clazz` with keyword arguments. Errors are
+    handled property by property, like in the interpreted mapper: a required
+    property which is missing or cannot be extracted raises `required_error(name)`,
+    an optional one is passed to `report_optional(name, response, exc)` and set to None.
+    Extractors are never evaluated twice, so nested mappers report their errors once.
+    Definitions which cannot be compiled are mapped with `fallback`.
+    """
+    properties = [
+        *mapping_definition.required_properties,
+        *mapping_definition.optional_properties,
+    ]
+    if not all(p.model_property_name.isidentifier() for p in properties):
+        return fallback
+
+    namespace = {
+        "__cls": clazz,
+        "__required_error": required_error,
+        "__report_optional": report_optional,
+    }
+    required = len(mapping_definition.required_properties)
+    body = []
+    for i, prop in enumerate(properties):
+        expression = _expression(prop.extractor, i, namespace)
+        name = repr(prop.raw_property_name)
+        body.append("    try:")
+        body.append(f"        v{i} = {expression}")
+        if i < required:
+            body.append(f"        if v{i} is None:")
+            body.append('            raise ValueError("Extractor returned None value")')
+            body.append("    except Exception as exc:")
+            body.append(f"        raise __required_error({name}) from exc")
+        else:
+            body.append("    except Exception as exc:")
+            body.append(f"        __report_optional({name}, r, exc)")
+            body.append(f"        v{i} = None")
+
+    arguments = ", ".join(
+        f"{p.model_property_name}=v{i}" for i, p in enumerate(properties)
+    )
+    name = f"map_{clazz.__name__}"
+    source = "\n".join(
+        [
+            f"def {name}(r):",
+            *body,
+            f"    return __cls({arguments})",
+        ]
+    )
+
+    exec(compile(source, f"<mercapi mapper {clazz.__qualname__}>", "exec"), namespace)
+    mapper = namespace[name]
+    mapper.__qualname__ = name
+    mapper.source = source
+    return mapper
+
+
+def _expression(extractor: Callable[[dict], Any], index: int, namespace: dict) -> str:
+    spec: InlineSpec = getattr(extractor, "inline_spec", None)
+    if spec is None:
+        global_name = f"_extractor{index}"
+        namespace[global_name] = extractor
+        return f"{global_name}(r)"
+
+    names = {"r": "r"}
+    for key, value in spec.bindings.items():
+        if type(value) == str:
+            names[key] = repr(value)
+        else:
+            global_name = f"_{key}{index}"
+            namespace[global_name] = value
+            names[key] = global_name
+    return spec.template.format(**names)
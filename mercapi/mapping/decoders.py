@@ -0,0 +1,148 @@
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from mercapi.mapping.columnar import SearchColumns
+from mercapi.mapping.definitions import map_to_class
+from mercapi.models import SearchResults, SearchResultItem
+from mercapi.models.search import Meta
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+
+class JSONDecoder:
+    """Decoder of API response bodies using the standard library `json` module.
+
+    Subclasses may override :meth:`decode_search` to map search responses
+    without decoding them into intermediate dicts first.
+    """
+
+    name = "json"
+
+    def decode(self, content: bytes) -> Any:
+        return json.loads(content)
+
+    def decode_search(self, content: bytes) -> SearchResults:
+        return map_to_class(self.decode(content), SearchResults)
+
+    def decode_search_columns(self, content: bytes) -> Tuple[Meta, SearchColumns]:
+        response = self.decode(content)
+        return (
+            map_to_class(response["meta"], Meta),
+            SearchColumns.from_response(response["items"]),
+        )
+
+
+class OrjsonDecoder(JSONDecoder):
+    """Decoder using orjson, requires orjson package."""
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise RuntimeError("orjson package is required for OrjsonDecoder")
+
+    def decode(self, content: bytes) -> Any:
+        return orjson.loads(content)
+
+
+if msgspec is not None:
+
+    class _Meta(msgspec.Struct, rename="camel"):
+        next_page_token: str
+        previous_page_token: str
+        num_found: int
+
+    class _SearchResultItem(msgspec.Struct, rename="camel"):
+        id: str
+        name: str
+        price: int
+        seller_id: Optional[str] = None
+        status: Optional[str] = None
+        created: Optional[float] = None
+        updated: Optional[float] = None
+        thumbnails: Optional[List[str]] = None
+        item_type: Optional[str] = None
+        item_condition_id: Optional[int] = None
+        shipping_payer_id: Optional[int] = None
+        shipping_method_id: Optional[int] = None
+        category_id: Optional[int] = None
+        is_no_price: Optional[bool] = None
+
+    class _SearchResponse(msgspec.Struct):
+        meta: _Meta
+        items: List[_SearchResultItem]
+
+
+def _timestamp(value: Optional[float]) -> Optional[datetime]:
+    return None if value is None else datetime.fromtimestamp(value)
+
+
+class MsgspecDecoder(JSONDecoder):
+    """Decoder using msgspec, requires msgspec package.
+
+    Search responses are decoded straight into typed structs and converted
+    to `SearchResultItem` and `Meta` models, skipping intermediate dicts.
+    Responses not matching the expected schema are mapped the regular way,
+    so errors are reported the same as with other decoders.
+    """
+
+    name = "msgspec"
+
+    def __init__(self):
+        if msgspec is None:
+            raise RuntimeError("msgspec package is required for MsgspecDecoder")
+        self._decoder = msgspec.json.Decoder()
+        self._search_decoder = msgspec.json.Decoder(_SearchResponse, strict=False)
+
+    def decode(self, content: bytes) -> Any:
+        return self._decoder.decode(content)
+
+    def decode_search(self, content: bytes) -> SearchResults:
+        try:
+            response = self._search_decoder.decode(content)
+        except msgspec.ValidationError:
+            return super().decode_search(content)
+
+        meta = response.meta
+        res = SearchResults(
+            meta=Meta(
+                next_page_token=meta.next_page_token,
+                prev_page_token=meta.previous_page_token,
+                num_found=meta.num_found,
+            ),
+            items=[
+                SearchResultItem(
+                    id_=i.id,
+                    name=i.name,
+                    price=i.price,
+                    seller_id=i.seller_id,
+                    status=i.status,
+                    created=_timestamp(i.created),
+                    updated=_timestamp(i.updated),
+                    thumbnails=i.thumbnails,
+                    item_type=i.item_type,
+                    item_condition_id=i.item_condition_id,
+                    shipping_payer_id=i.shipping_payer_id,
+                    shipping_method_id=i.shipping_method_id,
+                    category_id=i.category_id,
+                    is_no_price=i.is_no_price,
+                )
+                for i in response.items
+            ],
+        )
+        res._fields = None
+        return res
+
+
+def default_decoder() -> JSONDecoder:
+    """Fastest decoder available, orjson if installed, standard library otherwise."""
+    return JSONDecoder() if orjson is None else OrjsonDecoder()
@@ -1,6 +1,17 @@
 import logging
 from datetime import datetime
-from typing import NamedTuple, List, Dict, TypeVar, Type, Any, Optional, Callable
+from functools import partial
+from typing import (
+    NamedTuple,
+    List,
+    Dict,
+    TypeVar,
+    Type,
+    Any,
+    Optional,
+    Callable,
+    Tuple,
+)
 
 from mercapi.models import Item, Items, Profile, SearchResults, SearchResultItem
 from mercapi.models.common import ItemCategory, ItemCategorySummary
@@ -15,6 +26,7 @@ from mercapi.models.item.data import (
     ShippingClass,
     Comment,
 )
+from mercapi.mapping.compiler import compile_mapping, inline
 from mercapi.util.errors import ParseAPIResponseError
 from mercapi.models.base import ResponseModel
 from mercapi.models.profile.items import SellerItem
@@ -35,6 +47,61 @@ class ResponseMappingDefinition(NamedTuple):
     optional_properties: List[ResponseProperty]
 
 
+RM = TypeVar("RM", bound=ResponseModel)
+
+# compiled mappers of registered definitions, by class
+_compiled_mappers: Dict[
+    Type[ResponseModel], Tuple[ResponseMappingDefinition, Callable]
+] = {}
+
+
+def get_mapper(
+    clazz: Type[RM],
+    mapping_definition: ResponseMappingDefinition = None,
+) -> Callable[[dict], RM]:
+    """Return a mapper for `clazz`.
+
+    Mappers of definitions registered in `mapping_definitions` are compiled once
+    and cached. Other definitions are usually one-off, so they are mapped
+    by the interpreted mapper instead of being compiled and kept forever,
+    use :func:`compile_mapper` for a definition the caller reuses.
+    Mapping definitions are treated as immutable once they have been used.
+    """
+    if clazz == ResponseModel:
+        raise TypeError(
+            "map_to_class() is supposed to be called with ResponseModel subclass as a parameter"
+        )
+
+    registered = mapping_definitions.get(clazz)
+    if mapping_definition is None:
+        mapping_definition = registered
+    if mapping_definition is None:
+        raise ValueError(f"Mapping definition is not provided for {clazz.__name__}")
+    if mapping_definition is not registered:
+        return partial(
+            _map_interpreted, clazz=clazz, mapping_definition=mapping_definition
+        )
+
+    cached = _compiled_mappers.get(clazz)
+    if cached is None or cached[0] is not mapping_definition:
+        mapper = compile_mapper(clazz, mapping_definition)
+        cached = _compiled_mappers[clazz] = (mapping_definition, mapper)
+    return cached[1]
+
+
+def compile_mapper(
+    clazz: Type[RM], mapping_definition: ResponseMappingDefinition
+) -> Callable[[dict], RM]:
+    """Generate a mapper of `clazz` responses, the result is not cached."""
+    return compile_mapping(
+        clazz,
+        mapping_definition,
+        partial(_map_interpreted, clazz=clazz, mapping_definition=mapping_definition),
+        partial(_required_error, clazz),
+        _report_incorrect_optional,
+    )
+
+
 class Extractors:
     """
     Collection of HOFs for parsing API responses in the most common ways.
@@ -45,13 +112,18 @@ class Extractors:
 
     @staticmethod
     def get(key: str) -> ExtractorDef[Any]:
-        return lambda x: x.get(key)
+        return inline(lambda x: x.get(key), "{r}.get({key})", key=key)
 
     S = TypeVar("S", int, float, str)
 
     @staticmethod
     def get_as(key: str, type_: Type[S]) -> ExtractorDef[S]:
-        return lambda x: type_(x[key]) if key in x else None
+        return inline(
+            lambda x: type_(x[key]) if key in x else None,
+            "({type_}({r}[{key}]) if {key} in {r} else None)",
+            key=key,
+            type_=type_,
+        )
 
     M = TypeVar("M", bound=ResponseModel)
 
@@ -61,25 +133,53 @@ class Extractors:
     ) -> ExtractorDef[M]:
         if type(model) == str:
             model = Extractors.__import_class(model)
-        return lambda x: map_to_class(x[key], model, map_def) if key in x else None
+        return inline(
+            lambda x: map_to_class(x[key], model, map_def) if key in x else None,
+            "({mapper}({model}, {map_def})({r}[{key}]) if {key} in {r} else None)",
+            key=key,
+            mapper=get_mapper,
+            model=model,
+            map_def=map_def,
+        )
 
     @staticmethod
     def get_with(key: str, mapper: Callable[[S], T]) -> ExtractorDef[T]:
-        return lambda x: mapper(x[key]) if key in x else None
+        return inline(
+            lambda x: mapper(x[key]) if key in x else None,
+            "({mapper}({r}[{key}]) if {key} in {r} else None)",
+            key=key,
+            mapper=mapper,
+        )
 
     @staticmethod
     def get_list_with(key: str, mapper: Callable[[Any], T]) -> ExtractorDef[List[T]]:
-        return lambda x: [mapper(i) for i in x[key]] if key in x else None
+        return inline(
+            lambda x: [mapper(i) for i in x[key]] if key in x else None,
+            "(list(map({mapper}, {r}[{key}])) if {key} in {r} else None)",
+            key=key,
+            mapper=mapper,
+        )
 
     @staticmethod
     def get_list_of_model(key: str, model: Type[M]) -> ExtractorDef[List[M]]:
         if type(model) == str:
             model = Extractors.__import_class(model)
-        return lambda x: [map_to_class(i, model) for i in x[key]] if key in x else None
+        return inline(
+            lambda x: [map_to_class(i, model) for i in x[key]] if key in x else None,
+            "(list(map({mapper}({model}), {r}[{key}])) if {key} in {r} else None)",
+            key=key,
+            mapper=get_mapper,
+            model=model,
+        )
 
     @staticmethod
     def get_datetime(key: str) -> ExtractorDef[datetime]:
-        return Extractors.get_with(key, lambda x: datetime.fromtimestamp(float(x)))
+        return inline(
+            lambda x: datetime.fromtimestamp(float(x[key])) if key in x else None,
+            "({fromtimestamp}(float({r}[{key}])) if {key} in {r} else None)",
+            key=key,
+            fromtimestamp=datetime.fromtimestamp,
+        )
 
     @staticmethod
     def __import_class(model: str) -> Type[ResponseModel]:
@@ -656,24 +756,20 @@ mapping_definitions: Dict[Type[ResponseModel], ResponseMappingDefinition] = {
     ),
 }
 
-RM = TypeVar("RM", bound=ResponseModel)
-
 
 def map_to_class(
     response: dict,
     clazz: Type[RM],
     mapping_definition: ResponseMappingDefinition = None,
 ) -> RM:
-    if clazz == ResponseModel:
-        raise TypeError(
-            "map_to_class() is supposed to be called with ResponseModel subclass as a parameter"
-        )
+    return get_mapper(clazz, mapping_definition)(response)
 
-    if mapping_definition is None:
-        mapping_definition = mapping_definitions.get(clazz)
-    if mapping_definition is None:
-        raise ValueError(f"Mapping definition is not provided for {clazz.__name__}")
 
+def _map_interpreted(
+    response: dict,
+    clazz: Type[RM],
+    mapping_definition: ResponseMappingDefinition,
+) -> RM:
     init_properties = {}
 
     for prop in mapping_definition.required_properties:
@@ -683,9 +779,7 @@ def map_to_class(
                 raise ValueError("Extractor returned None value")
             init_properties[prop.model_property_name] = raw_prop
         except Exception as exc:
-            raise ParseAPIResponseError(
-                f"Failed to retrieve required {clazz.__name__} property {prop.raw_property_name} from the response"
-            ) from exc
+            raise _required_error(clazz, prop.raw_property_name) from exc
 
     for prop in mapping_definition.optional_properties:
         raw_prop = None
@@ -698,6 +792,12 @@ def map_to_class(
     return clazz(**init_properties)
 
 
+def _required_error(clazz: type, prop: str) -> ParseAPIResponseError:
+    return ParseAPIResponseError(
+        f"Failed to retrieve required {clazz.__name__} property {prop} from the response"
+    )
+
+
 def _report_incorrect_optional(prop: str, response: dict, exc: Exception) -> None:
     logging.warning(
         f"Encountered optional response property {prop} that could not be parsed correctly."
@@ -0,0 +1,155 @@
+from dataclasses import MISSING, fields
+from typing import Any, Dict, Tuple, Type
+
+from mercapi.mapping.definitions import (
+    RM,
+    ResponseMappingDefinition,
+    ResponseProperty,
+    mapping_definitions,
+    _report_incorrect_optional,
+)
+from mercapi.models.base import ResponseModel
+from mercapi.util.errors import ParseAPIResponseError
+
+# lazy classes of registered definitions, by class
+_lazy_classes: Dict[Type[ResponseModel], Tuple[ResponseMappingDefinition, type]] = {}
+
+
+class LazyModel:
+    """Mixin of lazily mapped models.
+
+    Required properties are set when the model is created, optional ones
+    are extracted from the kept response object on first access and cached.
+    """
+
+    __slots__ = ()
+
+    _response: dict
+    _model_class: Type[ResponseModel]
+    _required_properties: Tuple[ResponseProperty, ...]
+    _optional_properties: Dict[str, ResponseProperty]
+    _compared_fields: Tuple[str, ...]
+
+    def __getattr__(self, name: str) -> Any:
+        prop = self._optional_properties.get(name)
+        if prop is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        value = None
+        try:
+            value = prop.extractor(self._response)
+        except Exception as exc:
+            _report_incorrect_optional(prop.raw_property_name, self._response, exc)
+        setattr(self, name, value)
+        return value
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, self._model_class):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name)
+            for name in self._compared_fields
+        )
+
+    __hash__ = None
+
+    def __reduce__(self) -> Any:
+        # lazy classes are generated, so models are pickled as instances of their model class
+        return _restore, (self._model_class, self._state())
+
+    def _state(self) -> Dict[str, Any]:
+        # every property mapped, unset private fields get their defaults
+        state = {}
+        for f in fields(self._model_class):
+            try:
+                state[f.name] = getattr(self, f.name)
+            except AttributeError:
+                if f.default is not MISSING:
+                    state[f.name] = f.default
+                elif f.default_factory is not MISSING:
+                    state[f.name] = f.default_factory()
+        return state
+
+
+def _restore(clazz: Type[RM], state: Dict[str, Any]) -> RM:
+    model = object.__new__(clazz)
+    for name, value in state.items():
+        object.__setattr__(model, name, value)
+    return model
+
+
+def lazy_class(
+    clazz: Type[RM], mapping_definition: ResponseMappingDefinition = None
+) -> Type[RM]:
+    """Return a subclass of `clazz` whose optional properties are mapped on first access.
+
+    Classes of definitions registered in `mapping_definitions` are created once
+    and cached, classes of other (one-off) definitions are not kept.
+    """
+    registered = mapping_definitions.get(clazz)
+    if mapping_definition is None:
+        mapping_definition = registered
+    if mapping_definition is None:
+        raise ValueError(f"Mapping definition is not provided for {clazz.__name__}")
+    if mapping_definition is not registered:
+        return _create_lazy_class(clazz, mapping_definition)
+
+    cached = _lazy_classes.get(clazz)
+    if cached is None or cached[0] is not mapping_definition:
+        lazy = _create_lazy_class(clazz, mapping_definition)
+        cached = _lazy_classes[clazz] = (mapping_definition, lazy)
+    return cached[1]
+
+
+def _create_lazy_class(
+    clazz: Type[RM], mapping_definition: ResponseMappingDefinition
+) -> Type[RM]:
+    return type(
+        f"Lazy{clazz.__name__}",
+        (LazyModel, clazz),
+        {
+            "__slots__": ("_response",),
+            "__module__": clazz.__module__,
+            "__qualname__": f"Lazy{clazz.__qualname__}",
+            "_model_class": clazz,
+            "_required_properties": tuple(mapping_definition.required_properties),
+            "_optional_properties": {
+                p.model_property_name: p for p in mapping_definition.optional_properties
+            },
+            "_compared_fields": tuple(f.name for f in fields(clazz) if f.compare),
+        },
+    )
+
+
+def map_lazy(
+    response: dict,
+    clazz: Type[RM],
+    mapping_definition: ResponseMappingDefinition = None,
+) -> RM:
+    """Map `response` to a lazy instance of `clazz`.
+
+    Works like :func:`~mercapi.mapping.map_to_class`, required properties
+    are validated immediately, but optional properties (including nested models)
+    are mapped only when they are accessed for the first time.
+    The response object is kept by the model for as long as it exists.
+    """
+    if clazz == ResponseModel:
+        raise TypeError(
+            "map_lazy() is supposed to be called with ResponseModel subclass as a parameter"
+        )
+    lazy = lazy_class(clazz, mapping_definition)
+    model = object.__new__(lazy)
+    model._response = response
+
+    for prop in lazy._required_properties:
+        try:
+            value = prop.extractor(response)
+            if value is None:
+                raise ValueError("Extractor returned None value")
+        except Exception as exc:
+            raise ParseAPIResponseError(
+                f"Failed to retrieve required {clazz.__name__} property {prop.raw_property_name} from the response"
+            ) from exc
+        setattr(model, prop.model_property_name, value)
+    return model
@@ -0,0 +1,92 @@
+from collections import namedtuple
+from typing import Callable, Dict, Iterable, NamedTuple, Tuple, Type
+
+from mercapi.mapping.compiler import inline
+from mercapi.mapping.definitions import (
+    ResponseMappingDefinition,
+    ResponseProperty,
+    compile_mapper,
+    mapping_definitions,
+)
+from mercapi.models.base import ResponseModel
+
+_projections: Dict[Tuple[Type[ResponseModel], Tuple[str, ...]], Callable] = {}
+_containers: Dict[Tuple[Type[ResponseModel], str, Callable], Callable] = {}
+
+
+def project(
+    clazz: Type[ResponseModel], fields: Iterable[str]
+) -> Callable[[dict], NamedTuple]:
+    """Return a mapper of `clazz` responses extracting only the listed fields.
+
+    Mapped objects are named tuples (named after `clazz`) with `fields` in the given order.
+    Only extractors of these fields are run, so only those of them which are required
+    properties of `clazz` are validated.
+
+    :param clazz: model whose mapping definition should be used
+    :param fields: names of `clazz` attributes to map, e.g. `["id_", "price"]`
+    """
+    fields = tuple(fields)
+    key = (clazz, fields)
+    mapper = _projections.get(key)
+    if mapper is None:
+        definition = mapping_definitions.get(clazz)
+        if definition is None:
+            raise ValueError(f"Mapping definition is not provided for {clazz.__name__}")
+
+        required = {p.model_property_name: p for p in definition.required_properties}
+        optional = {p.model_property_name: p for p in definition.optional_properties}
+        unknown = [f for f in fields if f not in required and f not in optional]
+        if not fields or unknown:
+            raise ValueError(
+                f"Fields to map must be a non-empty list of {clazz.__name__} properties, "
+                f"unknown: {', '.join(unknown)}"
+            )
+
+        projected = ResponseMappingDefinition(
+            required_properties=[required[f] for f in fields if f in required],
+            optional_properties=[optional[f] for f in fields if f in optional],
+        )
+        mapper = _projections[key] = compile_mapper(
+            namedtuple(clazz.__name__, fields), projected
+        )
+    return mapper
+
+
+def project_container(
+    container: Type[ResponseModel],
+    list_property: str,
+    mapper: Callable[[dict], NamedTuple],
+) -> Callable[[dict], ResponseModel]:
+    """Return a mapper of `container` whose `list_property` is mapped with `mapper`,
+    e.g. :class:`~mercapi.models.SearchResults` with projected items.
+    """
+    key = (container, list_property, mapper)
+    container_mapper = _containers.get(key)
+    if container_mapper is None:
+        definition = mapping_definitions[container]
+        container_mapper = _containers[key] = compile_mapper(
+            container,
+            ResponseMappingDefinition(
+                required_properties=[
+                    _with_mapper(p, mapper)
+                    if p.model_property_name == list_property
+                    else p
+                    for p in definition.required_properties
+                ],
+                optional_properties=definition.optional_properties,
+            ),
+        )
+    return container_mapper
+
+
+def _with_mapper(prop: ResponseProperty, mapper: Callable) -> ResponseProperty:
+    key = prop.raw_property_name
+    return prop._replace(
+        extractor=inline(
+            lambda x: list(map(mapper, x[key])) if key in x else None,
+            "(list(map({mapper}, {r}[{key}])) if {key} in {r} else None)",
+            key=key,
+            mapper=mapper,
+        )
+    )
@@ -1,17 +1,43 @@
-import random
-import uuid
-from typing import Optional, List
+import asyncio
+from copy import copy
+from typing import (
+    Optional,
+    List,
+    Iterable,
+    AsyncIterator,
+    Tuple,
+    Callable,
+    Awaitable,
+    Any,
+    Sequence,
+    Hashable,
+)
 
 import httpx
 from httpx._types import ProxiesTypes
-from ecdsa import SigningKey, NIST256p
-from httpx import Request
+from httpx import Request, Response
 
-from mercapi.mapping import map_to_class
-from mercapi.models import SearchResults, Item, Profile, Items
+from mercapi.cache import ResponseCache, ModelCache
+from mercapi.cache.http import canonical_body
+from mercapi.mapping import map_to_class, map_lazy
+from mercapi.mapping.columnar import SearchColumns
+from mercapi.mapping.decoders import JSONDecoder, default_decoder
+from mercapi.mapping.projection import project, project_container
+from mercapi.models import SearchResults, SearchResultItem, Item, Profile, Items
 from mercapi.models.base import ResponseModel
+from mercapi.models.profile.items import SellerItem
 from mercapi.requests import SearchRequestData
 from mercapi.util import jwt
+from mercapi.util.concurrency import bounded_as_completed
+from mercapi.util.errors import ResponseStatusError
+from mercapi.util.identity import IdentityPool
+from mercapi.util.proxies import ProxyPool
+from mercapi.util.singleflight import SingleFlight
+from mercapi.util.ratelimit import (
+    AdaptiveRateLimiter,
+    is_retryable,
+    parse_retry_after,
+)
 
 
 class Mercapi:
@@ -20,6 +46,7 @@ class Mercapi:
 
     A random key-pair will be generated during the class instantiation.
     It is used for signing all HTTP requests sent in the course of methods execution.
+    Requests can be spread over many identities (key-pairs) with `identities` instead.
 
     **Avoid instantiating this class more than once in a single runtime.**
     """
@@ -29,12 +56,38 @@ class Mercapi:
         *,
         proxies: Optional[ProxiesTypes] = None,
         user_agent: Optional[str] = None,
+        signing_backend: Optional[jwt.SigningBackend] = None,
+        cache: Optional[ResponseCache] = None,
+        model_cache: Optional[ModelCache] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        decoder: Optional[JSONDecoder] = None,
+        lazy_models: bool = False,
+        proxy_pool: Optional[ProxyPool] = None,
+        identities: Optional[IdentityPool] = None,
+        coalesce: bool = True,
     ):
         """initialize
 
         :param proxies: Once the proxy is configured, the IP address of the access source can be changed. (e.g. {"http://": "http://example.com:1234", "https://": "http://example.com:1234"})
         :param user_agent: User-Agent
+        :param signing_backend: library used for signing requests, OpenSSL-backed cryptography is used by default when available
+        :param cache: cache of raw API responses, nothing is cached by default
+        :param model_cache: cache of mapped items, profiles and seller items, nothing is cached by default
+        :param rate_limiter: adaptive limit of requests in flight with retries of throttled requests, requests are not limited by default
+        :param transport: custom httpx transport, e.g. :class:`mercapi.testing.StubTransport` serving requests locally
+        :param decoder: decoder of response bodies, orjson is used by default when available
+        :param lazy_models: map optional properties of items, profiles and seller items on first access instead of up front
+        :param proxy_pool: spread requests over many proxies, each with its own client, cannot be combined with `proxies` or `transport`
+        :param identities: identities requests are signed with in turns, a single new identity is used by default
+        :param coalesce: share a single request between concurrent identical calls of `item`, `profile`, `items` and searches
         """
+        if proxy_pool is not None and (proxies is not None or transport is not None):
+            raise ValueError("proxy_pool cannot be combined with proxies or transport")
+        if identities is not None and signing_backend is not None:
+            raise ValueError(
+                "signing_backend cannot be combined with identities, set it on the pool instead"
+            )
         if not user_agent:
             user_agent = (
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 "
@@ -46,22 +99,117 @@ class Mercapi:
             "X-Platform": "web",
         }
 
-        self._uuid = str(uuid.UUID(int=random.getrandbits(128)))
-        self._key = SigningKey.generate(NIST256p)
-        self._client = httpx.AsyncClient(proxies=proxies)
+        self._identities = identities or IdentityPool(backend=signing_backend)
+        # every proxy of a pool has its own client
+        self._client: Optional[httpx.AsyncClient] = (
+            httpx.AsyncClient(proxies=proxies, transport=transport)
+            if proxy_pool is None
+            else None
+        )
+        self._cache = cache
+        self._model_cache = model_cache
+        self._rate_limiter = rate_limiter
+        self._proxy_pool = proxy_pool
+        self._decoder = decoder or default_decoder()
+        self._map = map_lazy if lazy_models else map_to_class
+        self._single_flight = SingleFlight() if coalesce else None
         ResponseModel.set_mercapi(self)
 
+    @property
+    def decoder(self) -> JSONDecoder:
+        """Decoder of response bodies."""
+        return self._decoder
+
+    @property
+    def signing_backend(self) -> jwt.SigningBackend:
+        """Library used for signing requests."""
+        return self._identities.backend
+
+    @property
+    def identities(self) -> IdentityPool:
+        """Identities requests are signed with."""
+        return self._identities
+
+    @property
+    def single_flight(self) -> Optional[SingleFlight]:
+        """Coalescer of concurrent identical calls with counters
+        of started (`calls`) and joined (`coalesced`) calls, None if disabled."""
+        return self._single_flight
+
     def _sign_request(self, request: Request) -> Request:
-        request.headers["DPoP"] = jwt.generate_dpop(
-            str(request.url),
-            request.method,
-            self._key,
-            {
-                "uuid": self._uuid,
-            },
+        index = self._identities.next()
+        request.headers["DPoP"] = self._identities.identities[index].generate_dpop(
+            str(request.url), request.method
         )
+        request.extensions["mercapi_identity"] = index
         return request
 
+    async def _send(self, request: Request) -> Response:
+        if self._cache is not None:
+            cached = await self._cache.aget(request)
+            if cached is not None:
+                return cached
+
+        if self._rate_limiter is None:
+            res = await self._dispatch(request)
+        else:
+            res = await self._send_limited(request, self._rate_limiter)
+
+        if res.status_code == 429 or res.status_code >= 500:
+            raise ResponseStatusError(
+                f"Request to {request.url} failed with status code {res.status_code}",
+                res.status_code,
+            )
+        if self._cache is not None:
+            await self._cache.aput(request, res)
+        return res
+
+    async def _dispatch(self, request: Request) -> Response:
+        if self._proxy_pool is None:
+            return await self._client.send(request)
+        return await self._proxy_pool.send(request)
+
+    async def _send_limited(
+        self, request: Request, limiter: AdaptiveRateLimiter
+    ) -> Response:
+        attempt = 0
+        while True:
+            await limiter.acquire()
+            try:
+                res = await self._dispatch(request)
+            except BaseException:
+                limiter.release()
+                raise
+            retry_after = parse_retry_after(res.headers.get("Retry-After"))
+            limiter.release(res.status_code, retry_after)
+
+            if not is_retryable(res.status_code) or attempt >= limiter.max_retries:
+                return res
+            if retry_after is None:
+                await asyncio.sleep(limiter.backoff(attempt))
+            attempt += 1
+            request = self._sign_request(request)
+
+    async def _memoized(
+        self,
+        kind: str,
+        id_: str,
+        fetch: Callable[[str], Awaitable[Optional[ResponseModel]]],
+    ) -> Optional[ResponseModel]:
+        async def coalesced(id_: str) -> Optional[ResponseModel]:
+            return await self._coalesced(kind, id_, lambda: fetch(id_))
+
+        if self._model_cache is None:
+            return await coalesced(id_)
+        return await self._model_cache.get(kind, id_, coalesced)
+
+    async def _coalesced(
+        self, kind: str, key: Hashable, call: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        if self._single_flight is None:
+            return await call()
+        return await self._single_flight.do(kind, key, call)
+
     async def search(
         self,
         query: str,
@@ -80,15 +228,17 @@ class Mercapi:
         status: List[SearchRequestData.Status] = [],
         page_token: str = None,
         exclude: str = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> SearchResults:
         """Perform basic search and return list of items and metadata.
         This method reflects the action of using search bar at the top of the website.
 
         All parameters except for `query` must be provided as lists of ints
         referencing facets IDs supplied by Mercari API. Refer to files in
-        `docs/facets` directory enumerating available facets and their identifiers.
+        `mercapi/facets/data` directory enumerating available facets and their identifiers.
 
-        These files can be updated at any time by running `utils/fetch_facets.py`.
+        These files can be updated at any time by running `utils/fetch_facets.py`
+        or :func:`mercapi.facets.refresh_facets`, see :class:`mercapi.facets.FacetCatalog` for lookups of the ids.
 
         :param query: string results should match (e.g. what you type in top search bar)
         :param categories: filter results by categories (カテゴリー)
@@ -105,9 +255,143 @@ class Mercapi:
         :param status: filter results by listing statuses (販売状況)
         :param page_token: used for paging results, provided in the response data
         :param exclude: Exclude items matching to string (除外キーワード)
+        :param fields: map only these properties of search results (e.g. `["id_", "price"]`),
+            results are then named tuples instead of :class:`~mercapi.models.SearchResultItem`,
+            the same fields are mapped on subsequent pages
         :return: List of search results (items) and metadata (e.g. total count)
         """
-        request = SearchRequestData(
+        request = self._search_request(
+            query,
+            categories=categories,
+            brands=brands,
+            sizes=sizes,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            price_min=price_min,
+            price_max=price_max,
+            item_conditions=item_conditions,
+            shipping_payer=shipping_payer,
+            colors=colors,
+            shipping_methods=shipping_methods,
+            status=status,
+            page_token=page_token,
+            exclude=exclude,
+        )
+        res = await self._search_impl(request, fields)
+        res._request = request
+        return res
+
+    async def search_iter(
+        self,
+        query: str,
+        *,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        **search_parameters,
+    ) -> AsyncIterator[SearchResultItem]:
+        """Iterate over search results across all pages.
+
+        Next page is requested in the background as soon as its token is known,
+        while previously fetched results are still being consumed.
+        At most `prefetch` pages are kept in memory ahead of the consumer.
+
+        :param query: string results should match
+        :param prefetch: number of pages fetched ahead of the consumer
+        :param max_items: stop after yielding this many results
+        :param fields: map only these properties of search results, see :func:`~mercapi.Mercapi.search`
+        :param search_parameters: any other keyword parameter accepted by :func:`~mercapi.Mercapi.search`
+        :return: async iterator of search results (items)
+        """
+        if prefetch < 1:
+            raise ValueError("At least one page has to be prefetched")
+
+        request = self._search_request(query, **search_parameters)
+        pages: asyncio.Queue = asyncio.Queue(maxsize=prefetch)
+
+        async def fetch_pages() -> None:
+            nonlocal request
+            fetched = 0
+            try:
+                while True:
+                    page = await self._search_impl(request, fields)
+                    await pages.put(page)
+                    fetched += len(page.items)
+                    if page.meta.next_page_token == "" or (
+                        max_items is not None and fetched >= max_items
+                    ):
+                        break
+                    request = copy(request)
+                    request.page_token = page.meta.next_page_token
+            except Exception as exc:
+                await pages.put(exc)
+            await pages.put(None)
+
+        producer = asyncio.ensure_future(fetch_pages())
+        yielded = 0
+        try:
+            while max_items is None or yielded < max_items:
+                page = await pages.get()
+                if page is None:
+                    break
+                if isinstance(page, Exception):
+                    raise page
+                for item in page.items:
+                    if max_items is not None and yielded >= max_items:
+                        break
+                    yield item
+                    yielded += 1
+        finally:
+            producer.cancel()
+
+    async def search_columns(
+        self, query: str, *, max_pages: Optional[int] = None, **search_parameters
+    ) -> SearchColumns:
+        """Fetch search results across pages into a single columnar table.
+
+        Items are never mapped to `SearchResultItem` objects, columns are filled
+        straight from response bodies, which makes this method suitable
+        for collecting large amounts of results for analysis.
+
+        :param query: string results should match
+        :param max_pages: stop after fetching this many pages
+        :param search_parameters: any other keyword parameter accepted by :func:`~mercapi.Mercapi.search`
+        :return: results of all fetched pages, see :class:`~mercapi.mapping.columnar.SearchColumns`
+        """
+        request = self._search_request(query, **search_parameters)
+        table = SearchColumns()
+        pages = 0
+        while max_pages is None or pages < max_pages:
+            res = await self._send(self._search(request))
+            meta, columns = self._decoder.decode_search_columns(res.content)
+            table.extend(columns)
+            pages += 1
+            if meta.next_page_token == "":
+                break
+            request = copy(request)
+            request.page_token = meta.next_page_token
+        return table
+
+    @staticmethod
+    def _search_request(
+        query: str,
+        *,
+        categories: List[int] = [],
+        brands: List[int] = [],
+        sizes: List[int] = [],
+        sort_by: SearchRequestData.SortBy = SearchRequestData.SortBy.SORT_SCORE,
+        sort_order: SearchRequestData.SortOrder = SearchRequestData.SortOrder.ORDER_DESC,
+        price_min: int = None,
+        price_max: int = None,
+        item_conditions: List[int] = [],
+        shipping_payer: List[int] = [],
+        colors: List[int] = [],
+        shipping_methods: List[SearchRequestData.ShippingMethod] = [],
+        status: List[SearchRequestData.Status] = [],
+        page_token: str = None,
+        exclude: str = None,
+    ) -> SearchRequestData:
+        return SearchRequestData(
             SearchRequestData.SearchConditions(
                 query,
                 categories,
@@ -126,14 +410,30 @@ class Mercapi:
             ),
             page_token,
         )
-        res = await self._search_impl(request)
-        res._request = request
-        return res
 
-    async def _search_impl(self, request: SearchRequestData) -> SearchResults:
-        res = await self._client.send(self._search(request))
-        body = res.json()
-        res = map_to_class(body, SearchResults)
+    async def _search_impl(
+        self, request: SearchRequestData, fields: Optional[Sequence[str]] = None
+    ) -> SearchResults:
+        if fields is not None:
+            fields = tuple(fields)
+        return await self._coalesced(
+            "search",
+            (canonical_body(request.data), fields),
+            lambda: self._fetch_search(request, fields),
+        )
+
+    async def _fetch_search(
+        self, request: SearchRequestData, fields: Optional[Tuple[str, ...]]
+    ) -> SearchResults:
+        res = await self._send(self._search(request))
+        if fields is None:
+            res = self._decoder.decode_search(res.content)
+        else:
+            mapper = project_container(
+                SearchResults, "items", project(SearchResultItem, fields)
+            )
+            res = mapper(self._decoder.decode(res.content))
+        res._fields = fields
         res._request = request
         return res
 
@@ -146,19 +446,53 @@ class Mercapi:
         )
         return self._sign_request(req)
 
-    async def item(self, id_: str) -> Optional[Item]:
+    async def item(
+        self, id_: str, *, fields: Optional[Sequence[str]] = None
+    ) -> Optional[Item]:
         """Fetch details of a single listing (item).
         This method reflects the action of loading single item view.
 
         :param id_: id of a listing (item)
+        :param fields: map only these properties (e.g. `["id_", "price"]`),
+            a named tuple is returned instead of :class:`~mercapi.models.Item`
+            and the model cache is bypassed
         :return: all available listing (item) properties
         """
-        res = await self._client.send(self._item(id_))
+        if fields is not None:
+            fields = tuple(fields)
+            return await self._coalesced(
+                "item",
+                (id_, fields),
+                lambda: self._fetch_item(id_, project(Item, fields)),
+            )
+        return await self._memoized("item", id_, self._fetch_item)
+
+    async def _fetch_item(
+        self, id_: str, mapper: Optional[Callable[[dict], Any]] = None
+    ) -> Optional[Item]:
+        res = await self._send(self._item(id_))
         if res.status_code == 404:
             return None
 
-        body = res.json()
-        return map_to_class(body["data"], Item)
+        body = self._decoder.decode(res.content)
+        if mapper is not None:
+            return mapper(body["data"])
+        return self._map(body["data"], Item)
+
+    async def items_bulk(
+        self, ids: Iterable[str], *, concurrency: int = 8
+    ) -> AsyncIterator[Tuple[str, Optional[Item]]]:
+        """Fetch details of many listings (items) concurrently.
+
+        Results are yielded as soon as they are available, so their order
+        does not have to match the order of `ids`.
+
+        :param ids: ids of listings (items)
+        :param concurrency: maximum number of requests in flight
+        :return: async iterator of (id, item) pairs, item is None if the listing was not found
+        """
+        async for pair in bounded_as_completed(self.item, ids, concurrency):
+            yield pair
 
     def _item(self, id_: str) -> Request:
         req = Request(
@@ -176,12 +510,30 @@ class Mercapi:
         :param id_: id of a seller (profile)
         :return: all available seller (profile) properties
         """
-        res = await self._client.send(self._profile(id_))
+        return await self._memoized("profile", id_, self._fetch_profile)
+
+    async def _fetch_profile(self, id_: str) -> Optional[Profile]:
+        res = await self._send(self._profile(id_))
         if res.status_code == 404:
             return None
 
-        body = res.json()
-        return map_to_class(body["data"], Profile)
+        body = self._decoder.decode(res.content)
+        return self._map(body["data"], Profile)
+
+    async def profiles_bulk(
+        self, ids: Iterable[str], *, concurrency: int = 8
+    ) -> AsyncIterator[Tuple[str, Optional[Profile]]]:
+        """Fetch details of many sellers concurrently.
+
+        Results are yielded as soon as they are available, so their order
+        does not have to match the order of `ids`.
+
+        :param ids: ids of sellers (profiles)
+        :param concurrency: maximum number of requests in flight
+        :return: async iterator of (id, profile) pairs, profile is None if the seller was not found
+        """
+        async for pair in bounded_as_completed(self.profile, ids, concurrency):
+            yield pair
 
     def _profile(self, id_: str) -> Request:
         req = Request(
@@ -192,19 +544,39 @@ class Mercapi:
         )
         return self._sign_request(req)
 
-    async def items(self, profile_id: str) -> Optional[Items]:
+    async def items(
+        self, profile_id: str, *, fields: Optional[Sequence[str]] = None
+    ) -> Optional[Items]:
         """Fetch all items sold by specified seller.
         This method reflects the action of loading single seller profile view.
 
         :param profile_id: ID of a seller
+        :param fields: map only these properties of seller items (e.g. `["id_", "price"]`),
+            items are then named tuples instead of :class:`~mercapi.models.profile.items.SellerItem`
+            and the model cache is bypassed
         :return: list of items sold by specified seller
         """
-        res = await self._client.send(self._items(profile_id))
+        if fields is not None:
+            fields = tuple(fields)
+            mapper = project_container(Items, "items", project(SellerItem, fields))
+            return await self._coalesced(
+                "items",
+                (profile_id, fields),
+                lambda: self._fetch_items(profile_id, mapper),
+            )
+        return await self._memoized("items", profile_id, self._fetch_items)
+
+    async def _fetch_items(
+        self, profile_id: str, mapper: Optional[Callable[[dict], Any]] = None
+    ) -> Optional[Items]:
+        res = await self._send(self._items(profile_id))
         if res.status_code == 404:
             return None
 
-        body = res.json()
-        return map_to_class(body, Items)
+        body = self._decoder.decode(res.content)
+        if mapper is not None:
+            return mapper(body)
+        return self._map(body, Items)
 
     def _items(self, profile_id: str) -> Request:
         req = Request(
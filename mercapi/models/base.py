@@ -1,3 +1,6 @@
+import sys
+from dataclasses import MISSING, dataclass, fields
+from functools import wraps
 from datetime import datetime
 from typing import (
     NamedTuple,
@@ -25,6 +28,7 @@ class ResponseProperty(NamedTuple):
 
 
 class ResponseModel:
+    __slots__ = ()
 
     _mercapi: "Mercapi"
 
@@ -33,6 +37,50 @@ class ResponseModel:
         cls._mercapi = mercapi
 
 
+def slots_dataclass(cls: Type[T]) -> Type[T]:
+    """Equivalent of `@dataclass(slots=True)` working on all supported Python versions.
+
+    Instances of slotted models have no per-instance `__dict__`,
+    which considerably reduces their memory footprint.
+    """
+    if sys.version_info >= (3, 10):
+        return dataclass(cls, slots=True)
+    return _slots_dataclass_backport(cls)
+
+
+def _slots_dataclass_backport(cls: Type[T]) -> Type[T]:
+    cls = dataclass(cls)
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    # `__init__` of older dataclasses leaves defaults of `init=False` fields
+    # to class attributes, which are replaced by slots
+    defaults = {
+        f.name: f.default
+        for f in fields(cls)
+        if not f.init and f.default is not MISSING
+    }
+    if defaults:
+        init = cls_dict["__init__"]
+
+        @wraps(init)
+        def __init__(self, *args, **kwargs):
+            for name, value in defaults.items():
+                object.__setattr__(self, name, value)
+            init(self, *args, **kwargs)
+
+        cls_dict["__init__"] = __init__
+
+    slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
 class Extractors:
     """
     Collection of HOFs for parsing API responses in the most common ways.
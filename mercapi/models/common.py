@@ -1,10 +1,9 @@
-from dataclasses import dataclass
 from typing import List
 
-from mercapi.models.base import ResponseModel
+from mercapi.models.base import ResponseModel, slots_dataclass
 
 
-@dataclass
+@slots_dataclass
 class ItemCategory(ResponseModel):
     id_: int
     name: str
@@ -19,7 +18,7 @@ class ItemCategory(ResponseModel):
     children: List["ItemCategory"]
 
 
-@dataclass
+@slots_dataclass
 class ItemCategorySummary(ResponseModel):
     id_: int
     name: str
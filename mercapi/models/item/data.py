@@ -1,12 +1,11 @@
-from dataclasses import dataclass
 from datetime import datetime
 
-from mercapi.models.base import ResponseModel
+from mercapi.models.base import ResponseModel, slots_dataclass
 
 
-@dataclass
+@slots_dataclass
 class Seller(ResponseModel):
-    @dataclass
+    @slots_dataclass
     class Ratings(ResponseModel):
         good: int
         normal: int
@@ -28,13 +27,13 @@ class Seller(ResponseModel):
     star_rating_score: int
 
 
-@dataclass
+@slots_dataclass
 class ItemCondition(ResponseModel):
     id_: int
     name: str
 
 
-@dataclass
+@slots_dataclass
 class Color(ResponseModel):
     id_: int
     name: str
@@ -45,27 +44,27 @@ class Color(ResponseModel):
         return hex(self.rgb)
 
 
-@dataclass
+@slots_dataclass
 class ShippingPayer(ResponseModel):
     id_: int
     name: str
     code: str
 
 
-@dataclass
+@slots_dataclass
 class ShippingMethod(ResponseModel):
     id_: int
     name: str
     is_deprecated: str
 
 
-@dataclass
+@slots_dataclass
 class ShippingFromArea(ResponseModel):
     id_: int
     name: str
 
 
-@dataclass
+@slots_dataclass
 class ShippingDuration(ResponseModel):
     id_: int
     name: str
@@ -73,7 +72,7 @@ class ShippingDuration(ResponseModel):
     max_days: int
 
 
-@dataclass
+@slots_dataclass
 class ShippingClass(ResponseModel):
     id_: int
     fee: int
@@ -84,9 +83,9 @@ class ShippingClass(ResponseModel):
     is_pickup: bool
 
 
-@dataclass
+@slots_dataclass
 class Comment(ResponseModel):
-    @dataclass
+    @slots_dataclass
     class User(ResponseModel):
         id_: int
         name: str
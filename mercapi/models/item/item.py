@@ -1,8 +1,7 @@
-from dataclasses import dataclass
 from datetime import datetime
 from typing import List
 
-from mercapi.models.base import ResponseModel
+from mercapi.models.base import ResponseModel, slots_dataclass
 from mercapi.models.common import ItemCategorySummary
 from mercapi.models.item.data import (
     ItemCondition,
@@ -21,7 +20,7 @@ from mercapi.models.item.data import (
 #
 # consider nesting all the properties in data submodel
 # if the original response gets more verbose
-@dataclass
+@slots_dataclass
 class Item(ResponseModel):
     id_: str
     seller: Seller
@@ -1,14 +1,13 @@
-from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional
 
 from mercapi.models import Item
-from mercapi.models.base import ResponseModel
+from mercapi.models.base import ResponseModel, slots_dataclass
 from mercapi.models.common import ItemCategorySummary
 from mercapi.models.item.data import ShippingFromArea
 
 
-@dataclass
+@slots_dataclass
 class SellerItem(ResponseModel):
     id_: str
     seller_id: str
@@ -32,6 +31,6 @@ class SellerItem(ResponseModel):
         return await self._mercapi.item(self.id_)
 
 
-@dataclass
+@slots_dataclass
 class Items(ResponseModel):
     items: List[SellerItem]
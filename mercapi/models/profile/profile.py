@@ -1,21 +1,20 @@
-from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from mercapi.models import Items
-from mercapi.models.base import ResponseModel
+from mercapi.models.base import ResponseModel, slots_dataclass
 
 
-@dataclass
+@slots_dataclass
 class Profile(ResponseModel):
-    @dataclass
+    @slots_dataclass
     class Ratings(ResponseModel):
         good: int
         normal: int
         bad: int
 
-    @dataclass
+    @slots_dataclass
     class PolarizedRatings(ResponseModel):
         good: int
         bad: int
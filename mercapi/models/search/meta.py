@@ -1,9 +1,7 @@
-from dataclasses import dataclass
+from mercapi.models.base import ResponseModel, slots_dataclass
 
-from mercapi.models.base import ResponseModel
 
-
-@dataclass
+@slots_dataclass
 class Meta(ResponseModel):
     next_page_token: str
     prev_page_token: str
@@ -1,13 +1,12 @@
-from dataclasses import dataclass
 from datetime import datetime
 from typing import List, TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from mercapi.models import Item, Profile
-from mercapi.models.base import ResponseModel
+from mercapi.models.base import ResponseModel, slots_dataclass
 
 
-@dataclass
+@slots_dataclass
 class SearchResultItem(ResponseModel):
     id_: str
     name: str
@@ -1,18 +1,24 @@
 from copy import copy
-from dataclasses import dataclass, field
-from typing import List
+from dataclasses import field
+from typing import List, Optional, Tuple, TYPE_CHECKING
 
-from mercapi.models.base import ResponseModel
+from mercapi.models.base import ResponseModel, slots_dataclass
 from mercapi.models.search import SearchResultItem, Meta
 from mercapi.requests import SearchRequestData
 from mercapi.util.errors import IncorrectRequestError
 
+if TYPE_CHECKING:
+    from mercapi.mapping.columnar import SearchColumns
 
-@dataclass
+
+@slots_dataclass
 class SearchResults(ResponseModel):
     meta: Meta
     items: List[SearchResultItem]
     _request: SearchRequestData = field(init=False, compare=False, repr=False)
+    _fields: Optional[Tuple[str, ...]] = field(
+        default=None, init=False, compare=False, repr=False
+    )
 
     async def next_page(self) -> "SearchResults":
         if self.meta.next_page_token == "":
@@ -21,7 +27,7 @@ class SearchResults(ResponseModel):
             )
         new_request = copy(self._request)
         new_request.page_token = self.meta.next_page_token
-        return await self._mercapi._search_impl(new_request)
+        return await self._mercapi._search_impl(new_request, self._fields)
 
     async def prev_page(self) -> "SearchResults":
         if self.meta.prev_page_token == "":
@@ -30,4 +36,10 @@ class SearchResults(ResponseModel):
             )
         new_request = copy(self._request)
         new_request.page_token = self.meta.prev_page_token
-        return await self._mercapi._search_impl(new_request)
+        return await self._mercapi._search_impl(new_request, self._fields)
+
+    def to_columns(self) -> "SearchColumns":
+        """Return results of this page as columns, see :class:`~mercapi.mapping.columnar.SearchColumns`."""
+        from mercapi.mapping.columnar import SearchColumns
+
+        return SearchColumns.from_items(self.items)
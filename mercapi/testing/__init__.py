@@ -0,0 +1,8 @@
+"""
+Local stand-in for Mercari API for load testing and benchmarking.
+
+`StubTransport` can be passed to `mercapi.mercapi.Mercapi` as `transport`
+to serve all requests locally, without any network traffic.
+"""
+from .fixtures import Fixtures
+from .transport import StubTransport
@@ -0,0 +1,127 @@
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, List, Tuple, Union
+from urllib.parse import urlsplit
+
+from mercapi.cache.http import ENDPOINTS
+
+
+def _default_search_item() -> dict:
+    return {
+        "id": "m00000000000",
+        "sellerId": "100000000",
+        "buyerId": "",
+        "status": "ITEM_STATUS_ON_SALE",
+        "name": "item",
+        "price": "1000",
+        "created": "1700000000",
+        "updated": "1700000000",
+        "thumbnails": [],
+        "itemType": "ITEM_TYPE_MERCARI",
+        "itemConditionId": "1",
+        "shippingPayerId": "2",
+        "shippingMethodId": "14",
+        "categoryId": "700",
+        "isNoPrice": False,
+    }
+
+
+def _default_item() -> dict:
+    return {
+        "id": "m00000000000",
+        "seller": {"id": 100000000, "name": "seller"},
+        "status": "on_sale",
+        "name": "item",
+        "price": 1000,
+        "description": "",
+        "photos": [],
+        "photo_paths": [],
+        "thumbnails": [],
+        "item_condition": {"id": 1, "name": "新品、未使用"},
+        "colors": [],
+        "num_likes": 0,
+        "num_comments": 0,
+        "comments": [],
+        "updated": 1700000000,
+        "created": 1700000000,
+    }
+
+
+def _default_profile() -> dict:
+    return {
+        "id": 100000000,
+        "name": "seller",
+        "ratings": {"good": 0, "normal": 0, "bad": 0},
+        "polarized_ratings": {"good": 0, "bad": 0},
+        "num_ratings": 0,
+        "created": 1700000000,
+    }
+
+
+def _default_seller_item() -> dict:
+    return {
+        "id": "m00000000000",
+        "seller": {"id": 100000000, "name": "seller"},
+        "status": "on_sale",
+        "name": "item",
+        "price": 1000,
+        "thumbnails": [],
+        "root_category_id": 5,
+        "num_likes": 0,
+        "num_comments": 0,
+        "created": 1700000000,
+        "updated": 1700000000,
+        "shipping_from_area": {"id": 13, "name": "東京都"},
+    }
+
+
+@dataclass
+class Fixtures:
+    """Templates of response objects the stand-in server generates data from."""
+
+    search_items: List[dict] = field(default_factory=lambda: [_default_search_item()])
+    items: List[dict] = field(default_factory=lambda: [_default_item()])
+    profiles: List[dict] = field(default_factory=lambda: [_default_profile()])
+    seller_items: List[dict] = field(default_factory=lambda: [_default_seller_item()])
+
+    @classmethod
+    def from_cassettes(cls, directory: Union[str, Path]) -> "Fixtures":
+        """Collect templates from successful responses recorded in VCR cassettes.
+
+        Requires PyYAML.
+        """
+        fixtures = cls([], [], [], [])
+        for request, response in cassette_interactions(directory):
+            if response["status_code"] != 200:
+                continue
+            endpoint = ENDPOINTS.get(urlsplit(request["uri"]).path)
+            body = json.loads(response["content"])
+            if endpoint == "search":
+                fixtures.search_items.extend(body["items"])
+            elif endpoint == "item":
+                fixtures.items.append(body["data"])
+            elif endpoint == "profile":
+                fixtures.profiles.append(body["data"])
+            elif endpoint == "items":
+                fixtures.seller_items.extend(body["data"])
+
+        defaults = cls()
+        for name in ["search_items", "items", "profiles", "seller_items"]:
+            if not getattr(fixtures, name):
+                setattr(fixtures, name, getattr(defaults, name))
+        return fixtures
+
+
+def cassette_interactions(directory: Union[str, Path]) -> Iterator[Tuple[dict, dict]]:
+    """Yield (request, response) pairs recorded in VCR cassettes in `directory`."""
+    try:
+        import yaml
+    except ImportError as exc:
+        raise ImportError("PyYAML is required for loading cassettes") from exc
+
+    for path in sorted(Path(directory).glob("*.yml")):
+        with open(path, encoding="utf8") as file:
+            cassette = yaml.safe_load(file)
+        for interaction in cassette["interactions"]:
+            yield interaction["request"], interaction["response"]
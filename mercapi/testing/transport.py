@@ -0,0 +1,237 @@
+import asyncio
+import json
+import random
+import zlib
+from collections import Counter
+from copy import deepcopy
+from typing import Dict, List, Optional, Set
+
+import httpx
+
+from mercapi.cache.http import ENDPOINTS
+from mercapi.testing.fixtures import Fixtures
+
+PAGE_TOKEN_PREFIX = "v1:"
+
+
+class StubTransport(httpx.AsyncBaseTransport):
+    """httpx transport imitating Mercari API endpoints used by mercapi.
+
+    Serves `v2/entities:search`, `items/get`, `users/get_profile` and `items/get_items`
+    with data generated from :class:`~mercapi.testing.Fixtures` templates.
+
+    Every search keyword has its own deterministic catalog of `num_found` listings
+    with prices spread over `price_range`. Search requests are filtered by price
+    and paginated with `v1:<page>` tokens; pagination stops after `max_pages`
+    pages, like the real API does for broad queries.
+
+    Latency, server errors and throttling (429 with `Retry-After`) can be injected
+    with configurable probabilities. All randomness comes from `seed`.
+    """
+
+    def __init__(
+        self,
+        fixtures: Optional[Fixtures] = None,
+        *,
+        num_found: int = 360,
+        price_range: tuple = (300, 100_000),
+        max_pages: Optional[int] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: float = 0.0,
+        missing_ids: Set[str] = frozenset(),
+        seed: int = 0,
+    ):
+        """
+        :param fixtures: templates of generated objects, minimal built-in ones by default
+        :param num_found: number of listings matching every search keyword
+        :param price_range: lowest and highest price of generated listings
+        :param max_pages: number of pages a single search can be paged through, unlimited by default
+        :param latency: delay of every response in seconds
+        :param jitter: upper bound of random delay added to `latency`
+        :param error_rate: probability of responding with 500
+        :param throttle_rate: probability of responding with 429
+        :param retry_after: value of `Retry-After` header sent with 429 responses
+        :param missing_ids: ids of items and profiles answered with 404
+        :param seed: seed of the random number generator
+        """
+        self._fixtures = fixtures or Fixtures()
+        self._num_found = num_found
+        self._price_range = price_range
+        self._max_pages = max_pages
+        self._latency = latency
+        self._jitter = jitter
+        self._error_rate = error_rate
+        self._throttle_rate = throttle_rate
+        self._retry_after = retry_after
+        self._missing_ids = missing_ids
+        self._seed = seed
+        self._random = random.Random(seed)
+        self._catalogs: Dict[str, List[dict]] = {}
+        self._listings: Dict[str, dict] = {}
+        self.requests: Counter = Counter()
+        """Number of requests received per endpoint (search, item, profile, items)."""
+        self.in_flight = 0
+        """Number of requests currently being handled."""
+        self.max_in_flight = 0
+        """Highest number of requests handled at the same time."""
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await request.aread()
+            delay = self._latency + self._random.uniform(0, self._jitter)
+            if delay:
+                await asyncio.sleep(delay)
+            return self._respond(request)
+        finally:
+            self.in_flight -= 1
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        endpoint = ENDPOINTS.get(request.url.path)
+        self.requests[endpoint] += 1
+        if endpoint is None:
+            return self._error(request, 404)
+
+        draw = self._random.random()
+        if draw < self._throttle_rate:
+            return httpx.Response(
+                429,
+                headers={"Retry-After": str(self._retry_after)},
+                json={"code": 8, "message": "Too Many Requests"},
+                request=request,
+            )
+        if draw < self._throttle_rate + self._error_rate:
+            return self._error(request, 500)
+
+        if endpoint == "search":
+            return self._search(request)
+        if endpoint == "item":
+            return self._item(request)
+        if endpoint == "profile":
+            return self._profile(request)
+        return self._seller_items(request)
+
+    @staticmethod
+    def _error(request: httpx.Request, status_code: int) -> httpx.Response:
+        return httpx.Response(
+            status_code,
+            json={"result": "error", "errors": [], "meta": {}},
+            request=request,
+        )
+
+    def _catalog(self, keyword: str) -> List[dict]:
+        catalog = self._catalogs.get(keyword)
+        if catalog is not None:
+            return catalog
+
+        rng = random.Random(f"{self._seed}:{keyword}")
+        prefix = zlib.crc32(keyword.encode("utf8")) % 100_000
+        templates = self._fixtures.search_items
+        catalog = []
+        for i in range(self._num_found):
+            listing = deepcopy(templates[i % len(templates)])
+            created = 1_700_000_000 - i * 60
+            listing.update(
+                {
+                    "id": f"m{prefix:05d}{i:06d}",
+                    "name": f"{keyword} {i}",
+                    "price": str(rng.randint(*self._price_range)),
+                    "created": str(created),
+                    "updated": str(created),
+                    "isNoPrice": False,
+                }
+            )
+            catalog.append(listing)
+            self._listings[listing["id"]] = listing
+        self._catalogs[keyword] = catalog
+        return catalog
+
+    def _search(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        condition = body.get("searchCondition", {})
+        page_size = body.get("pageSize") or 120
+        page_token = body.get("pageToken") or ""
+        page = int(page_token[len(PAGE_TOKEN_PREFIX) :]) if page_token else 0
+
+        price_min = condition.get("priceMin") or 0
+        price_max = condition.get("priceMax") or 0
+        matching = [
+            i
+            for i in self._catalog(condition.get("keyword", ""))
+            if int(i["price"]) >= price_min
+            and (not price_max or int(i["price"]) <= price_max)
+        ]
+
+        last_page = (len(matching) - 1) // page_size
+        if self._max_pages is not None:
+            last_page = min(last_page, self._max_pages - 1)
+        return httpx.Response(
+            200,
+            json={
+                "meta": {
+                    "nextPageToken": f"{PAGE_TOKEN_PREFIX}{page + 1}"
+                    if page < last_page
+                    else "",
+                    "previousPageToken": f"{PAGE_TOKEN_PREFIX}{page - 1}"
+                    if page > 0
+                    else "",
+                    "numFound": str(len(matching)),
+                },
+                "items": matching[page * page_size : (page + 1) * page_size]
+                if page <= last_page
+                else [],
+            },
+            request=request,
+        )
+
+    def _item(self, request: httpx.Request) -> httpx.Response:
+        id_ = request.url.params.get("id", "")
+        if id_ in self._missing_ids:
+            return self._error(request, 404)
+
+        templates = self._fixtures.items
+        data = deepcopy(templates[zlib.crc32(id_.encode()) % len(templates)])
+        data["id"] = id_
+        listing = self._listings.get(id_)
+        if listing is not None:
+            data["name"] = listing["name"]
+            data["price"] = int(listing["price"])
+            data["created"] = data["updated"] = int(listing["created"])
+        return httpx.Response(
+            200, json={"result": "OK", "data": data, "meta": {}}, request=request
+        )
+
+    def _profile(self, request: httpx.Request) -> httpx.Response:
+        id_ = request.url.params.get("user_id", "")
+        if id_ in self._missing_ids:
+            return self._error(request, 404)
+
+        templates = self._fixtures.profiles
+        data = deepcopy(templates[zlib.crc32(id_.encode()) % len(templates)])
+        data["id"] = int(id_) if id_.isdigit() else id_
+        return httpx.Response(
+            200, json={"result": "OK", "data": data, "meta": {}}, request=request
+        )
+
+    def _seller_items(self, request: httpx.Request) -> httpx.Response:
+        id_ = request.url.params.get("seller_id", "")
+        if id_ in self._missing_ids:
+            return self._error(request, 404)
+
+        limit = int(request.url.params.get("limit", 30))
+        templates = self._fixtures.seller_items
+        data = []
+        for i in range(limit):
+            item = deepcopy(templates[i % len(templates)])
+            item["id"] = f"m{zlib.crc32(id_.encode()) % 100_000:05d}{i:06d}"
+            item["seller"] = {**item.get("seller", {}), "id": id_}
+            data.append(item)
+        return httpx.Response(
+            200,
+            json={"result": "OK", "meta": {"has_next": False}, "data": data},
+            request=request,
+        )
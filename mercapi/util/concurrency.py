@@ -0,0 +1,44 @@
+import asyncio
+from itertools import islice
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Tuple, TypeVar
+
+A = TypeVar("A")
+T = TypeVar("T")
+
+
+async def bounded_as_completed(
+    fn: Callable[[A], Awaitable[T]],
+    args: Iterable[A],
+    limit: int,
+) -> AsyncIterator[Tuple[A, T]]:
+    """Call `fn` for every element of `args` with at most `limit` calls in flight.
+
+    Results are yielded as (argument, result) pairs in order of completion.
+    `args` is consumed lazily, so only `limit` tasks exist at any time.
+    Remaining tasks are cancelled if the consumer stops early or a call fails.
+    """
+    if limit < 1:
+        raise ValueError("Concurrency limit must be a positive integer")
+
+    args = iter(args)
+    pending = {}
+
+    def schedule(n: int) -> None:
+        for arg in islice(args, n):
+            pending[asyncio.ensure_future(fn(arg))] = arg
+
+    try:
+        schedule(limit)
+        while pending:
+            done, _ = await asyncio.wait(
+                pending.keys(), return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                arg = pending.pop(task)
+                yield arg, task.result()
+            schedule(limit - len(pending))
+    finally:
+        for task in pending:
+            task.cancel()
+        # retrieve results of cancelled (or already failed) tasks
+        await asyncio.gather(*pending, return_exceptions=True)
@@ -8,3 +8,9 @@ class ParseAPIResponseError(MercapiError):
 
 class IncorrectRequestError(MercapiError):
     pass
+
+
+class ResponseStatusError(MercapiError):
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
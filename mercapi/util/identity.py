@@ -0,0 +1,132 @@
+import json
+import os
+import random
+import tempfile
+import uuid
+from itertools import count
+from typing import Iterable, List, Optional
+
+from ecdsa import SigningKey, NIST256p
+
+from mercapi.util.jwt import DPoPSigner, SigningBackend
+
+
+class Identity:
+    """Client identity, a random uuid and a key-pair signing DPoP proofs."""
+
+    def __init__(
+        self,
+        uuid_: str,
+        key: SigningKey,
+        backend: Optional[SigningBackend] = None,
+    ):
+        self.uuid = uuid_
+        self.signer = DPoPSigner(key, backend)
+
+    @classmethod
+    def generate(cls, backend: Optional[SigningBackend] = None) -> "Identity":
+        return cls(
+            str(uuid.UUID(int=random.getrandbits(128))),
+            SigningKey.generate(NIST256p),
+            backend,
+        )
+
+    @property
+    def key(self) -> SigningKey:
+        return self.signer.key
+
+    def generate_dpop(self, url: str, method: str) -> str:
+        return self.signer.generate_dpop(url, method, {"uuid": self.uuid})
+
+    def __repr__(self) -> str:
+        return f"Identity({self.uuid!r})"
+
+
+class IdentityPool:
+    """Identities requests are spread over in round-robin order.
+
+    Keys of all identities are generated (or loaded) when the pool is created,
+    sending a request only signs a proof with an already prepared key.
+
+    Pools can be saved to a file and loaded back, so that restarted clients
+    keep their identities::
+
+        identities = IdentityPool.load_or_create("identities.json", size=8)
+        m = Mercapi(identities=identities)
+    """
+
+    def __init__(
+        self,
+        identities: Iterable[Identity] = None,
+        *,
+        size: int = 1,
+        backend: Optional[SigningBackend] = None,
+    ):
+        """
+        :param identities: identities to use, `size` new identities are generated if not given
+        :param size: number of identities to generate
+        :param backend: library used for signing requests of generated identities
+        """
+        if identities is None:
+            identities = [Identity.generate(backend) for _ in range(size)]
+        self.identities: List[Identity] = list(identities)
+        if not self.identities:
+            raise ValueError("At least one identity is required")
+        self._counter = count()
+
+    def __len__(self) -> int:
+        return len(self.identities)
+
+    @property
+    def backend(self) -> SigningBackend:
+        return self.identities[0].signer.backend
+
+    def next(self) -> int:
+        """Return index of the identity the next request should be signed with."""
+        return next(self._counter) % len(self.identities)
+
+    def save(self, path: str) -> None:
+        """Write identities including their private keys to `path`.
+
+        The file is readable by its owner only and replaced atomically.
+        """
+        data = {
+            "identities": [
+                {"uuid": i.uuid, "key": i.key.to_pem().decode("ascii")}
+                for i in self.identities
+            ]
+        }
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".identities")
+        try:
+            with os.fdopen(fd, "w", encoding="utf8") as file:
+                json.dump(data, file)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load(
+        cls, path: str, *, backend: Optional[SigningBackend] = None
+    ) -> "IdentityPool":
+        """Read identities written by :meth:`save`."""
+        with open(path, encoding="utf8") as file:
+            data = json.load(file)
+        return cls(
+            Identity(i["uuid"], SigningKey.from_pem(i["key"]), backend)
+            for i in data["identities"]
+        )
+
+    @classmethod
+    def load_or_create(
+        cls, path: str, *, size: int = 1, backend: Optional[SigningBackend] = None
+    ) -> "IdentityPool":
+        """Read identities from `path`, generating and saving `size` new ones
+        if the file does not exist."""
+        if os.path.exists(path):
+            return cls.load(path, backend=backend)
+        pool = cls(size=size, backend=backend)
+        pool.save(path)
+        return pool
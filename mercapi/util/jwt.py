@@ -1,12 +1,126 @@
+import hashlib
+import json
 import random
+from enum import Enum
 from time import time
 from typing import Dict, Optional
 from uuid import UUID
 
 from ecdsa import SigningKey
-from jose import jws
+from ecdsa.util import sigencode_string
 from jose.backends.ecdsa_backend import ECDSAECKey
 from jose.constants import ALGORITHMS
+from jose.utils import base64url_encode
+
+try:
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.hazmat.primitives.asymmetric.utils import (
+        decode_dss_signature,
+    )
+except ImportError:  # pragma: no cover
+    ec = None
+
+
+class SigningBackend(Enum):
+    CRYPTOGRAPHY = "cryptography"  # OpenSSL-backed, requires cryptography package
+    ECDSA = "ecdsa"  # pure Python
+
+    @classmethod
+    def default(cls) -> "SigningBackend":
+        return cls.ECDSA if ec is None else cls.CRYPTOGRAPHY
+
+
+class _EcdsaSigner:
+    def __init__(self, key: SigningKey):
+        self._key = key
+
+    def sign(self, message: bytes) -> bytes:
+        return self._key.sign(
+            message,
+            hashfunc=hashlib.sha256,
+            sigencode=sigencode_string,
+            allow_truncate=False,
+        )
+
+
+class _CryptographySigner:
+    def __init__(self, key: SigningKey):
+        if ec is None:
+            raise RuntimeError(
+                "cryptography package is required for the cryptography signing backend"
+            )
+        self._key = ec.derive_private_key(key.privkey.secret_multiplier, ec.SECP256R1())
+        self._algorithm = ec.ECDSA(hashes.SHA256())
+
+    def sign(self, message: bytes) -> bytes:
+        r, s = decode_dss_signature(self._key.sign(message, self._algorithm))
+        return r.to_bytes(32, "big") + s.to_bytes(32, "big")
+
+
+_signers = {
+    SigningBackend.CRYPTOGRAPHY: _CryptographySigner,
+    SigningBackend.ECDSA: _EcdsaSigner,
+}
+
+
+class DPoPSigner:
+    """Generator of DPoP proofs signed with a single key.
+
+    The signing key is prepared and the protected header (including
+    the public JWK) is encoded once, so generating a proof only serializes
+    the payload and computes the ECDSA signature.
+
+    Signatures are computed with OpenSSL through the cryptography package
+    when it is available, otherwise with the pure Python ecdsa package.
+    """
+
+    def __init__(self, key: SigningKey, backend: Optional[SigningBackend] = None):
+        self._key = key
+        self._backend = backend or SigningBackend.default()
+        self._signer = _signers[self._backend](key)
+
+        public_jwk = ECDSAECKey(key, ALGORITHMS.ES256).to_dict()
+        header = {
+            "typ": "dpop+jwt",
+            "alg": "ES256",
+            "jwk": {k: public_jwk[k] for k in ["crv", "kty", "x", "y"]},
+        }
+        self._encoded_header = base64url_encode(
+            json.dumps(header, separators=(",", ":"), sort_keys=True).encode("utf-8")
+        )
+
+    @property
+    def key(self) -> SigningKey:
+        return self._key
+
+    @property
+    def backend(self) -> SigningBackend:
+        return self._backend
+
+    def sign(self, payload: Dict[str, str]) -> str:
+        encoded_payload = base64url_encode(
+            json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        )
+        signing_input = self._encoded_header + b"." + encoded_payload
+        signature = self._signer.sign(signing_input)
+        return (signing_input + b"." + base64url_encode(signature)).decode("utf-8")
+
+    def generate_dpop(
+        self,
+        url: str,
+        method: str,
+        extra_payload: Optional[Dict[str, str]] = None,
+    ) -> str:
+        return self.sign(
+            {
+                "iat": int(time()),
+                "jti": str(UUID(int=random.getrandbits(128))),
+                "htu": url,
+                "htm": method,
+                **(extra_payload or {}),
+            }
+        )
 
 
 def generate_dpop(
@@ -15,19 +129,4 @@ def generate_dpop(
     key: SigningKey,
     extra_payload: Optional[Dict[str, str]] = None,
 ) -> str:
-    payload = {
-        "iat": int(time()),
-        "jti": str(UUID(int=random.getrandbits(128))),
-        "htu": url,
-        "htm": method,
-        **extra_payload,
-    }
-
-    ec_key = ECDSAECKey(key, ALGORITHMS.ES256)
-    headers = {
-        "typ": "dpop+jwt",
-        "alg": "ES256",
-        "jwk": {k: ec_key.to_dict()[k] for k in ["crv", "kty", "x", "y"]},
-    }
-
-    return jws.sign(payload, key, headers, ALGORITHMS.ES256)
+    return DPoPSigner(key).generate_dpop(url, method, extra_payload)
@@ -0,0 +1,169 @@
+import asyncio
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable, Deque, Iterable, List, Optional
+
+import httpx
+from httpx import Request, Response
+from httpx._types import ProxiesTypes
+
+from mercapi.util.ratelimit import is_retryable, parse_retry_after
+
+
+class Proxy:
+    """Egress proxy of a :class:`ProxyPool` with its own client and statistics."""
+
+    def __init__(self, proxy: ProxiesTypes, client: httpx.AsyncClient, samples: int):
+        self.proxy = proxy
+        self.client = client
+        self.in_flight = 0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.health = 1.0
+        """Exponentially weighted ratio of successful requests."""
+        self.ejected_until = 0.0
+        self.latencies: Deque[float] = deque(maxlen=samples)
+        """Latencies of the most recent requests in seconds."""
+
+    @property
+    def ejected(self) -> bool:
+        return self.ejected_until > time.monotonic()
+
+    @property
+    def mean_latency(self) -> Optional[float]:
+        if not self.latencies:
+            return None
+        return sum(self.latencies) / len(self.latencies)
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """Latency of recent requests at `percentile` (0-100) in seconds."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        index = round(percentile / 100 * (len(ordered) - 1))
+        return ordered[index]
+
+    def __repr__(self) -> str:
+        return (
+            f"Proxy({self.proxy!r}, in_flight={self.in_flight}, requests={self.requests}, "
+            f"failures={self.failures}, health={self.health:.2f}, ejected={self.ejected})"
+        )
+
+
+class ProxyPool:
+    """Pool of egress proxies, each with its own pooled HTTP client.
+
+    Every request is routed to one of the proxies that are not ejected,
+    according to the chosen :class:`ProxyPool.Strategy`. Proxies responding
+    with 429 are ejected for `Retry-After` or `ejection` seconds, proxies failing
+    `max_failures` requests in a row (5xx responses or connection errors) are
+    ejected for `ejection` seconds. When all proxies are ejected, the one
+    returning soonest is used.
+
+    With `pair_identities`, requests signed by the n-th identity of the client
+    (see :class:`~mercapi.util.identity.IdentityPool`) are sent through the n-th
+    proxy (modulo number of proxies), unless it is ejected.
+    """
+
+    class Strategy(Enum):
+        LEAST_LOADED = 1
+        """fewest requests in flight, then lowest mean latency"""
+        HEALTH = 2
+        """highest ratio of successful requests per request in flight"""
+
+    def __init__(
+        self,
+        proxies: Iterable[ProxiesTypes],
+        *,
+        strategy: Strategy = Strategy.LEAST_LOADED,
+        ejection: float = 30.0,
+        max_failures: int = 3,
+        smoothing: float = 0.2,
+        latency_samples: int = 100,
+        pair_identities: bool = False,
+        client_factory: Optional[Callable[[ProxiesTypes], httpx.AsyncClient]] = None,
+    ):
+        """
+        :param proxies: proxies accepted by `httpx.AsyncClient`, e.g. "http://example.com:1234"
+        :param strategy: how to choose proxy for a request
+        :param ejection: time in seconds a failing proxy is not used for
+        :param max_failures: number of consecutive failures ejecting a proxy
+        :param smoothing: weight of the latest request in proxy health
+        :param latency_samples: number of recent latencies kept per proxy
+        :param pair_identities: send requests of each client identity through the same proxy
+        :param client_factory: function creating client for a proxy, `httpx.AsyncClient(proxies=proxy)` by default
+        """
+        if client_factory is None:
+            client_factory = lambda proxy: httpx.AsyncClient(proxies=proxy)
+        self.proxies: List[Proxy] = [
+            Proxy(p, client_factory(p), latency_samples) for p in proxies
+        ]
+        if not self.proxies:
+            raise ValueError("At least one proxy is required")
+        self._strategy = strategy
+        self._ejection = ejection
+        self._max_failures = max_failures
+        self._smoothing = smoothing
+        self._pair_identities = pair_identities
+
+    def choose(self) -> Proxy:
+        """Return proxy the next request should be sent through."""
+        now = time.monotonic()
+        available = [p for p in self.proxies if p.ejected_until <= now]
+        if not available:
+            return min(self.proxies, key=lambda p: p.ejected_until)
+        if self._strategy == ProxyPool.Strategy.HEALTH:
+            return max(available, key=lambda p: p.health / (1 + p.in_flight))
+        return min(
+            available,
+            key=lambda p: (p.in_flight, p.mean_latency or 0.0),
+        )
+
+    async def send(self, request: Request) -> Response:
+        """Send request through the most suitable proxy and record the outcome."""
+        proxy = None
+        identity = request.extensions.get("mercapi_identity")
+        if self._pair_identities and identity is not None:
+            proxy = self.proxies[identity % len(self.proxies)]
+            if proxy.ejected:
+                proxy = None
+        if proxy is None:
+            proxy = self.choose()
+        proxy.in_flight += 1
+        proxy.requests += 1
+        started = time.monotonic()
+        try:
+            res = await proxy.client.send(request)
+        except (httpx.TransportError, asyncio.TimeoutError):
+            self._record_failure(proxy)
+            raise
+        finally:
+            proxy.in_flight -= 1
+
+        proxy.latencies.append(time.monotonic() - started)
+        if res.status_code == 429:
+            retry_after = parse_retry_after(res.headers.get("Retry-After"))
+            self._record_failure(proxy, eject_for=retry_after or self._ejection)
+        elif is_retryable(res.status_code):
+            self._record_failure(proxy)
+        else:
+            proxy.consecutive_failures = 0
+            proxy.health += self._smoothing * (1 - proxy.health)
+        return res
+
+    def _record_failure(self, proxy: Proxy, eject_for: Optional[float] = None) -> None:
+        proxy.failures += 1
+        proxy.consecutive_failures += 1
+        proxy.health -= self._smoothing * proxy.health
+        if eject_for is None and proxy.consecutive_failures >= self._max_failures:
+            eject_for = self._ejection
+        if eject_for is not None:
+            proxy.ejected_until = time.monotonic() + eject_for
+            proxy.consecutive_failures = 0
+
+    async def aclose(self) -> None:
+        """Close clients of all proxies."""
+        for proxy in self.proxies:
+            await proxy.client.aclose()
@@ -0,0 +1,141 @@
+import asyncio
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Deque, Optional
+
+# status codes signalling that the server is overloaded or throttling requests
+THROTTLING_STATUS_CODES = {429, 503}
+
+
+def is_retryable(status_code: int) -> bool:
+    return status_code == 429 or status_code >= 500
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Return number of seconds to wait according to a `Retry-After` header value."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveRateLimiter:
+    """Limit of concurrent requests adapted with AIMD (additive increase, multiplicative decrease).
+
+    Every successful response increases the limit by `increase / limit`,
+    i.e. by `increase` per full window of requests. Every throttling response
+    (429, 503) multiplies the limit by `decrease`. `Retry-After` headers pause
+    sending of all requests for the given time.
+
+    Responses with 429 or 5xx status codes are retried up to `max_retries` times.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+    ):
+        """
+        :param initial_limit: number of requests allowed in flight initially
+        :param min_limit: lower bound of the limit
+        :param max_limit: upper bound of the limit
+        :param increase: limit increase per window of successful requests
+        :param decrease: factor the limit is multiplied by after a throttling response
+        :param max_retries: number of retries of failed requests
+        :param backoff: initial delay between retries without `Retry-After`, doubled with every retry
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                "Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit"
+            )
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._increase = increase
+        self._decrease = decrease
+        self.max_retries = max_retries
+        self._backoff = backoff
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> int:
+        """Number of requests currently allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def backoff(self, attempt: int) -> float:
+        return self._backoff * 2**attempt
+
+    async def acquire(self) -> None:
+        while self._in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # a free slot was handed to this waiter, pass it on
+                if waiter.done() and not waiter.cancelled():
+                    self._wake_up()
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self._in_flight += 1
+
+        delay = self._paused_until - time.monotonic()
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self._in_flight -= 1
+                self._wake_up()
+                raise
+
+    def release(
+        self, status_code: Optional[int] = None, retry_after: Optional[float] = None
+    ) -> None:
+        """Release a slot taken by :meth:`acquire` and adapt the limit.
+
+        :param status_code: status code of the response, None if the request failed without one
+        :param retry_after: number of seconds the server asked to wait
+        """
+        self._in_flight -= 1
+        if status_code in THROTTLING_STATUS_CODES:
+            self._limit = max(self._min_limit, self._limit * self._decrease)
+        elif status_code is not None and status_code < 500:
+            self._limit = min(
+                self._max_limit, self._limit + self._increase / self._limit
+            )
+
+        if retry_after:
+            self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+        self._wake_up()
+
+    def _wake_up(self) -> None:
+        free = self.limit - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
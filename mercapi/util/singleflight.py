@@ -0,0 +1,65 @@
+import asyncio
+from collections import Counter
+from typing import Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into a single call.
+
+    The first caller of a key starts the call, callers arriving while it is
+    in flight wait for the same result (or exception) instead of starting their own.
+    Once the call completes the key is forgotten, results are not cached.
+    The call is cancelled only when every caller waiting for it is cancelled.
+
+    Results are shared between callers and should be treated as read-only.
+    """
+
+    def __init__(self):
+        self._flights: Dict[Tuple[str, Hashable], _Flight] = {}
+        self.calls: Counter = Counter()
+        """Number of calls started per kind."""
+        self.coalesced: Counter = Counter()
+        """Number of calls which joined a call already in flight per kind."""
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    async def do(self, kind: str, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """Return result of `call()`, shared with concurrent callers of the same `kind` and `key`."""
+        flight_key = (kind, key)
+        flight = self._flights.get(flight_key)
+        if flight is None:
+            self.calls[kind] += 1
+            flight = self._flights[flight_key] = _Flight(asyncio.ensure_future(call()))
+            flight.task.add_done_callback(lambda task: self._finish(flight_key, flight))
+        else:
+            self.coalesced[kind] += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+                self._forget(flight_key, flight)
+
+    def _forget(self, flight_key: Tuple[str, Hashable], flight: _Flight) -> None:
+        if self._flights.get(flight_key) is flight:
+            del self._flights[flight_key]
+
+    def _finish(self, flight_key: Tuple[str, Hashable], flight: _Flight) -> None:
+        self._forget(flight_key, flight)
+        if not flight.task.cancelled():
+            # retrieved by waiters, marks the exception as handled if all of them left
+            flight.task.exception()
@@ -0,0 +1,172 @@
+import asyncio
+
+import pytest
+from httpx import Request, Response
+
+from mercapi import Mercapi
+from mercapi.cache import ResponseCache
+from mercapi.cache import http
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(tmp_path / "cache.sqlite")
+
+
+@pytest.fixture
+def m_cached(cache):
+    return Mercapi(cache=cache)
+
+
+def _item_request(id_: str, dpop: str = "a") -> Request:
+    return Request(
+        "GET",
+        "https://api.mercari.jp/items/get",
+        params={"id": id_},
+        headers={"DPoP": dpop},
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.vcr
+async def test_item_cached(m_cached, cache):
+    first = await m_cached.item("m12871737078")
+    second = await m_cached.item("m12871737078")
+
+    assert first == second
+    assert cache.misses["item"] == 1
+    assert cache.hits["item"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.vcr
+async def test_search_cached(m_cached, cache):
+    first = await m_cached.search("cyclick", categories=[75])
+    second = await m_cached.search("cyclick", categories=[75])
+
+    assert first.items == second.items
+    assert cache.hits["search"] == 1
+
+
+def test_key_ignores_headers():
+    assert ResponseCache.key(_item_request("m1", "a")) == ResponseCache.key(
+        _item_request("m1", "b")
+    )
+    assert ResponseCache.key(_item_request("m1")) != ResponseCache.key(
+        _item_request("m2")
+    )
+
+
+def test_key_ignores_search_session_id():
+    def search_request(session_id: str, keyword: str = "foo") -> Request:
+        return Request(
+            "POST",
+            "https://api.mercari.jp/v2/entities:search",
+            json={"searchSessionId": session_id, "keyword": keyword},
+        )
+
+    assert ResponseCache.key(search_request("a")) == ResponseCache.key(
+        search_request("b")
+    )
+    assert ResponseCache.key(search_request("a")) != ResponseCache.key(
+        search_request("a", "bar")
+    )
+
+
+def test_cache_persists_between_instances(tmp_path):
+    request = _item_request("m1")
+    ResponseCache(tmp_path / "cache.sqlite").put(
+        request, Response(200, json={"data": {}})
+    )
+
+    cached = ResponseCache(tmp_path / "cache.sqlite").get(request)
+    assert cached.status_code == 200
+    assert cached.json() == {"data": {}}
+
+
+def test_cache_expires_entries(cache, monkeypatch):
+    request = _item_request("m1")
+    cache.put(request, Response(200, json={}))
+
+    now = http.time.time()
+    monkeypatch.setattr(http.time, "time", lambda: now + 301)
+    assert cache.get(request) is None
+    assert cache.misses["item"] == 1
+
+
+def test_cache_skips_endpoints_without_ttl(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite", ttl={"item": 0})
+    request = _item_request("m1")
+    cache.put(request, Response(200, json={}))
+
+    assert cache.get(request) is None
+    assert len(cache) == 0
+
+
+def test_cache_does_not_store_errors(cache):
+    request = _item_request("m1")
+    cache.put(request, Response(503, json={}))
+
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite", max_entries=2)
+    for id_ in ["m1", "m2"]:
+        cache.put(_item_request(id_), Response(200, json={}))
+    assert cache.get(_item_request("m1")) is not None
+
+    cache.put(_item_request("m3"), Response(200, json={}))
+
+    assert len(cache) == 2
+    assert cache.get(_item_request("m1")) is not None
+    assert cache.get(_item_request("m2")) is None
+
+
+def test_cache_replacing_entry_does_not_evict(tmp_path, monkeypatch):
+    cache = ResponseCache(tmp_path / "cache.sqlite", max_entries=2)
+    for id_ in ["m1", "m2"]:
+        cache.put(_item_request(id_), Response(200, json={}))
+
+    def fail():
+        raise AssertionError("nothing should be evicted")
+
+    monkeypatch.setattr(cache, "_evict", fail)
+    cache.put(_item_request("m1"), Response(200, json={"replaced": True}))
+
+    assert len(cache) == 2
+    assert cache.get(_item_request("m1")).json() == {"replaced": True}
+
+
+@pytest.mark.asyncio
+async def test_cache_async_access(cache):
+    request = _item_request("m1")
+    await cache.aput(request, Response(200, json={"id": "m1"}))
+
+    assert (await cache.aget(request)).json() == {"id": "m1"}
+    assert cache.hits["item"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_async_access_skips_endpoints_without_ttl(tmp_path, monkeypatch):
+    cache = ResponseCache(tmp_path / "cache.sqlite", ttl={"item": 0})
+
+    def fail(*args):
+        raise AssertionError("uncached requests should not reach the database")
+
+    monkeypatch.setattr(cache, "get", fail)
+    monkeypatch.setattr(cache, "put", fail)
+    request = _item_request("m1")
+    await cache.aput(request, Response(200, json={}))
+
+    assert await cache.aget(request) is None
+
+
+@pytest.mark.asyncio
+async def test_cache_counts_concurrent_hits(cache):
+    request = _item_request("m1")
+    cache.put(request, Response(200, json={}))
+
+    await asyncio.gather(*(cache.aget(request) for _ in range(200)))
+
+    assert cache.hits["item"] == 200
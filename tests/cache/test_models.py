@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from mercapi import Mercapi
+from mercapi.cache import ModelCache
+from mercapi.cache import models
+
+
+class Fetcher:
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, id_):
+        self.calls.append(id_)
+        return f"{id_}:{len(self.calls)}"
+
+
+@pytest.mark.asyncio
+@pytest.mark.vcr
+async def test_full_item_memoized():
+    cache = ModelCache()
+    m = Mercapi(model_cache=cache)
+    res = await m.search("完全網羅は無理でしたMix", categories=[75])
+
+    first = await res.items[0].full_item()
+    second = await res.items[0].full_item()
+
+    assert first is second
+    assert cache.misses["item"] == 1
+    assert cache.hits["item"] == 1
+
+
+@pytest.mark.asyncio
+async def test_model_cache_returns_fresh_entries():
+    cache = ModelCache()
+    fetch = Fetcher()
+
+    assert await cache.get("item", "m1", fetch) == "m1:1"
+    assert await cache.get("item", "m1", fetch) == "m1:1"
+    assert await cache.get("profile", "m1", fetch) == "m1:2"
+    assert fetch.calls == ["m1", "m1"]
+
+
+@pytest.mark.asyncio
+async def test_model_cache_evicts_least_recently_used():
+    cache = ModelCache(maxsize=2)
+    fetch = Fetcher()
+    for id_ in ["m1", "m2", "m1", "m3"]:
+        await cache.get("item", id_, fetch)
+
+    assert len(cache) == 2
+    assert ("item", "m1") in cache
+    assert ("item", "m2") not in cache
+
+
+@pytest.mark.asyncio
+async def test_model_cache_does_not_store_none():
+    cache = ModelCache()
+    calls = []
+
+    async def fetch(id_):
+        calls.append(id_)
+        return None
+
+    assert await cache.get("item", "m1", fetch) is None
+    assert await cache.get("item", "m1", fetch) is None
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_model_cache_refetches_expired_entries(monkeypatch):
+    cache = ModelCache(ttl=10)
+    fetch = Fetcher()
+    await cache.get("item", "m1", fetch)
+
+    now = models.time.monotonic()
+    monkeypatch.setattr(models.time, "monotonic", lambda: now + 11)
+
+    assert await cache.get("item", "m1", fetch) == "m1:2"
+
+
+@pytest.mark.asyncio
+async def test_model_cache_stale_while_revalidate(monkeypatch):
+    cache = ModelCache(ttl=10, stale_while_revalidate=True)
+    fetch = Fetcher()
+    await cache.get("item", "m1", fetch)
+
+    now = models.time.monotonic()
+    monkeypatch.setattr(models.time, "monotonic", lambda: now + 11)
+
+    assert await cache.get("item", "m1", fetch) == "m1:1"
+    assert await cache.get("item", "m1", fetch) == "m1:1"
+    await asyncio.sleep(0)
+
+    assert fetch.calls == ["m1", "m1"]
+    assert cache.stale_hits["item"] == 2
+    assert await cache.get("item", "m1", fetch) == "m1:2"
@@ -0,0 +1,85 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from mercapi.mapping import map_to_class
+from mercapi.models import SearchResults
+from mercapi.requests import SearchRequestData
+
+_SORT_KEYS = {
+    SearchRequestData.SortBy.SORT_PRICE: lambda i: int(i["price"]),
+    SearchRequestData.SortBy.SORT_CREATED_TIME: lambda i: int(i["created"]),
+}
+
+
+class SearchStub:
+    """Replacement of `Mercapi._search_impl` serving `listings` (raw search result items).
+
+    Results are filtered by categories (`categoryId` of listings) and price range,
+    sorted by price or creation time and split into pages of `page_size` items.
+    """
+
+    def __init__(self, listings: List[dict], page_size: int):
+        self.listings = listings
+        self.page_size = page_size
+        self.requests: List[SearchRequestData] = []
+        """Received requests, in order."""
+        self.times: List[float] = []
+        """Event loop time of every received request."""
+
+    def _matching(self, conditions: SearchRequestData.SearchConditions) -> List[dict]:
+        matching = [
+            i
+            for i in self.listings
+            if (
+                not conditions.categories
+                or int(i.get("categoryId", 0)) in conditions.categories
+            )
+            and (not conditions.price_min or conditions.price_min <= int(i["price"]))
+            and (not conditions.price_max or int(i["price"]) <= conditions.price_max)
+        ]
+        key = _SORT_KEYS.get(conditions.sort_by)
+        if key is not None:
+            matching.sort(
+                key=key,
+                reverse=conditions.sort_order == SearchRequestData.SortOrder.ORDER_DESC,
+            )
+        return matching
+
+    async def __call__(self, request: SearchRequestData, fields=None) -> SearchResults:
+        self.requests.append(request)
+        self.times.append(asyncio.get_running_loop().time())
+        matching = self._matching(request.search_conditions)
+        page = int(request.page_token or 0)
+        end = (page + 1) * self.page_size
+        res = map_to_class(
+            {
+                "meta": {
+                    "nextPageToken": str(page + 1) if end < len(matching) else "",
+                    "previousPageToken": str(page - 1) if page else "",
+                    "numFound": str(len(matching)),
+                },
+                "items": matching[page * self.page_size : end],
+            },
+            SearchResults,
+        )
+        res._request = request
+        return res
+
+
+@pytest.fixture
+def listings() -> List[dict]:
+    return []
+
+
+@pytest.fixture
+def page_size() -> int:
+    return 5
+
+
+@pytest.fixture
+def searches(m, monkeypatch, listings, page_size) -> SearchStub:
+    stub = SearchStub(listings, page_size)
+    monkeypatch.setattr(m, "_search_impl", stub)
+    return stub
@@ -0,0 +1,182 @@
+import json
+from datetime import datetime
+from typing import List
+
+import pytest
+
+from mercapi.crawl import CategoryCrawler
+from mercapi.crawl.category import sort_key
+from mercapi.facets import FacetCatalog
+from mercapi.models import SearchResultItem, SearchResults
+from mercapi.requests import SearchRequestData
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    tree = {
+        "data": [
+            {
+                "id": 1,
+                "name": "root",
+                "child": [
+                    {"id": 10, "name": "a", "child": [{"id": 100, "name": "a1"}]},
+                    {"id": 11, "name": "b"},
+                    {"id": 12, "name": "c"},
+                ],
+            },
+            {"id": 2, "name": "other"},
+        ]
+    }
+    with open(tmp_path / "categories.json", "w", encoding="utf8") as file:
+        json.dump(tree, file)
+    return FacetCatalog(tmp_path)
+
+
+def _listings(category_id: int, count: int) -> List[dict]:
+    return [
+        {
+            "id": f"m{category_id:03}{i:08}",
+            "name": f"item {i}",
+            "price": str(300 + (i * 7919 + category_id * 31) % 1000),
+            "created": str(1718383194 + (i * 104729 + category_id) % 100000),
+            "updated": "1719548737",
+            "categoryId": str(category_id),
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def listings():
+    return _listings(100, 9) + _listings(11, 3) + _listings(12, 14)
+
+
+@pytest.fixture
+def page_size():
+    return 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "sort_by,sort_order,key,reverse",
+    [
+        (
+            SearchRequestData.SortBy.SORT_PRICE,
+            SearchRequestData.SortOrder.ORDER_ASC,
+            lambda i: i.price,
+            False,
+        ),
+        (
+            SearchRequestData.SortBy.SORT_PRICE,
+            SearchRequestData.SortOrder.ORDER_DESC,
+            lambda i: i.price,
+            True,
+        ),
+        (
+            SearchRequestData.SortBy.SORT_CREATED_TIME,
+            SearchRequestData.SortOrder.ORDER_DESC,
+            lambda i: i.created,
+            True,
+        ),
+    ],
+)
+async def test_category_crawler_merges_leaves_in_sort_order(
+    m, catalog, searches, listings, sort_by, sort_order, key, reverse
+):
+    crawler = CategoryCrawler(
+        m,
+        "sharpnel",
+        1,
+        catalog=catalog,
+        concurrency=2,
+        buffer=2,
+        sort_by=sort_by,
+        sort_order=sort_order,
+    )
+    items = [i async for i in crawler]
+
+    assert crawler.leaves == [100, 11, 12]
+    assert sorted(i.id_ for i in items) == sorted(i["id"] for i in listings)
+    assert items == sorted(items, key=key, reverse=reverse)
+    assert crawler.num_found == {100: 9, 11: 3, 12: 14}
+    assert crawler.items_found == 26
+    assert {tuple(r.search_conditions.categories) for r in searches.requests} == {
+        (100,),
+        (11,),
+        (12,),
+    }
+
+
+@pytest.mark.asyncio
+async def test_category_crawler_interleaves_relevance_by_rank(m, catalog, searches):
+    crawler = CategoryCrawler(m, "sharpnel", 1, catalog=catalog, max_pages=1)
+    items = [i async for i in crawler]
+
+    assert [i.category_id for i in items[:6]] == [100, 11, 12, 100, 11, 12]
+    assert len(items) == 3 * 1 + 4 * 2
+    assert len(searches.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_category_crawler_deduplicates_results(m, catalog, searches, listings):
+    listings.append({**listings[0], "categoryId": "11"})
+    items = [i async for i in CategoryCrawler(m, "sharpnel", 1, catalog=catalog)]
+
+    assert len(items) == 26
+    assert len({i.id_ for i in items}) == 26
+
+
+@pytest.mark.asyncio
+async def test_category_crawler_searches_leaf_category_itself(m, catalog, searches):
+    items = [i async for i in CategoryCrawler(m, "sharpnel", 12, catalog=catalog)]
+
+    assert len(items) == 14
+    assert [r.search_conditions.categories for r in searches.requests] == [[12]] * 4
+    assert [r.page_token or "" for r in searches.requests] == ["", "1", "2", "3"]
+
+
+@pytest.mark.asyncio
+async def test_category_crawler_raises_search_errors(m, catalog, monkeypatch):
+    async def search_impl(request: SearchRequestData, fields=None) -> SearchResults:
+        raise RuntimeError("failed")
+
+    monkeypatch.setattr(m, "_search_impl", search_impl)
+    with pytest.raises(RuntimeError):
+        [i async for i in CategoryCrawler(m, "sharpnel", 1, catalog=catalog)]
+
+
+def test_category_crawler_rejects_invalid_parameters(m, catalog):
+    with pytest.raises(ValueError):
+        CategoryCrawler(m, "sharpnel", 999, catalog=catalog)
+    with pytest.raises(ValueError):
+        CategoryCrawler(m, "sharpnel", 1, catalog=catalog, categories=[11])
+
+
+def test_sort_key_puts_items_missing_sorted_property_last():
+    def item(id_, created):
+        return SearchResultItem(
+            id_, "", 300, "", "", created, None, [], "", 0, 0, 0, 0, False
+        )
+
+    items = [
+        item("m1", None),
+        item("m2", datetime.fromtimestamp(1700000000)),
+        item("m3", datetime.fromtimestamp(1700000100)),
+    ]
+    for order in SearchRequestData.SortOrder:
+        key = sort_key(SearchRequestData.SortBy.SORT_CREATED_TIME, order)
+        assert sorted(items, key=key)[-1].id_ == "m1"
+
+    key = sort_key(
+        SearchRequestData.SortBy.SORT_CREATED_TIME,
+        SearchRequestData.SortOrder.ORDER_DESC,
+    )
+    assert [i.id_ for i in sorted(items, key=key)] == ["m3", "m2", "m1"]
+
+
+def test_category_crawler_uses_bundled_category_tree(m):
+    crawler = CategoryCrawler(m, "sharpnel", 1)
+
+    assert 11 not in crawler.leaves
+    assert 119 in crawler.leaves
+    assert len(crawler.leaves) > 100
@@ -0,0 +1,52 @@
+from typing import List
+
+import pytest
+
+from mercapi.crawl import PriceShardCrawler
+
+
+def _listings(count: int) -> List[dict]:
+    return [
+        {
+            "id": f"m{i:011}",
+            "name": f"item {i}",
+            "price": str(300 + i * 37),
+            "created": "1718383194",
+            "updated": "1719548737",
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def listings():
+    return _listings(100)
+
+
+@pytest.mark.asyncio
+async def test_price_shard_crawler_covers_all_results(m, searches, listings):
+    crawler = PriceShardCrawler(m, "sharpnel", window=20, concurrency=3)
+    items = [i async for i in crawler]
+
+    assert sorted(i.id_ for i in items) == [i["id"] for i in listings]
+    assert crawler.num_found == 100
+    assert crawler.coverage == 1.0
+    assert all(s.num_found <= 20 for s in crawler.shards)
+    assert sum(s.num_found for s in crawler.shards) == 100
+
+
+@pytest.mark.asyncio
+async def test_price_shard_crawler_does_not_split_small_result_sets(m, searches):
+    crawler = PriceShardCrawler(m, "sharpnel", price_max=500, window=20)
+    items = [i async for i in crawler]
+
+    assert len(items) == 6
+    assert len(crawler.shards) == 1
+    assert crawler.shards[0].pages == 2
+    assert all(r.search_conditions.query == "sharpnel" for r in searches.requests)
+    assert [r.page_token or "" for r in searches.requests] == ["", "1"]
+
+
+def test_price_shard_crawler_rejects_empty_price_range(m):
+    with pytest.raises(ValueError):
+        PriceShardCrawler(m, "sharpnel", price_min=1000, price_max=500)
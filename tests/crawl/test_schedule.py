@@ -0,0 +1,84 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from mercapi.crawl import SearchScheduler, ScheduledSearch
+
+
+async def _collect(scheduler: SearchScheduler, count: int) -> List[ScheduledSearch]:
+    results = []
+    stream = scheduler.run()
+    try:
+        async for result in stream:
+            results.append(result)
+            if len(results) == count:
+                break
+    finally:
+        await stream.aclose()
+    return results
+
+
+@pytest.mark.asyncio
+async def test_scheduler_combines_duplicate_queries(m, searches):
+    scheduler = SearchScheduler(m, budget=100)
+    scheduler.add("a", "sharpnel", interval=60, categories=[75])
+    scheduler.add("b", m._search_request("sharpnel", categories=[75]), interval=10)
+    scheduler.add("c", "cyclick", interval=60)
+    assert len(scheduler.queries) == 2
+
+    results = await asyncio.wait_for(_collect(scheduler, 3), 1)
+
+    assert sorted(r.name for r in results) == ["a", "b", "c"]
+    assert len(searches.requests) == 2
+    assert scheduler.queries[SearchScheduler.key(searches.requests[0])].interval == 10
+
+
+@pytest.mark.asyncio
+async def test_scheduler_spreads_requests_over_budget(m, searches):
+    scheduler = SearchScheduler(m, budget=50, concurrency=8)
+    for i in range(5):
+        scheduler.add(f"q{i}", f"query {i}", interval=60)
+
+    await asyncio.wait_for(_collect(scheduler, 5), 1)
+
+    times = searches.times
+    assert all(b - a >= 0.015 for a, b in zip(times, times[1:]))
+
+
+@pytest.mark.asyncio
+async def test_scheduler_serves_higher_priority_first(m, searches):
+    scheduler = SearchScheduler(m, budget=100, concurrency=1)
+    scheduler.add("low", "low", interval=60)
+    scheduler.add("high", "high", interval=60, priority=5)
+    scheduler.add("medium", "medium", interval=60, priority=2)
+
+    assert scheduler.queue_depth == 3
+    results = await asyncio.wait_for(_collect(scheduler, 3), 1)
+
+    assert [r.name for r in results] == ["high", "medium", "low"]
+    assert scheduler.queue_depth == 0
+    assert scheduler.lag("low") == 0.0
+    assert scheduler.queries[SearchScheduler.key(searches.requests[2])].last_lag > 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_refreshes_in_intervals(m, searches):
+    scheduler = SearchScheduler(m, budget=100)
+    scheduler.add("a", "sharpnel", interval=0.05)
+
+    await asyncio.wait_for(_collect(scheduler, 3), 1)
+
+    times = searches.times
+    assert all(b - a >= 0.045 for a, b in zip(times, times[1:]))
+
+
+def test_scheduler_remove(m):
+    scheduler = SearchScheduler(m)
+    scheduler.add("a", "sharpnel", interval=60)
+    scheduler.add("b", "sharpnel", interval=60)
+
+    scheduler.remove("a")
+    assert len(scheduler.queries) == 1
+    scheduler.remove("b")
+    assert scheduler.queries == {}
@@ -0,0 +1,120 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from mercapi.crawl import ListingWatcher
+from mercapi.mapping import map_to_class
+from mercapi.models import SearchResultItem
+from mercapi.requests import SearchRequestData
+
+
+def _listing(i: int, price: int = 300) -> dict:
+    return {
+        "id": f"m{i:011}",
+        "name": f"item {i}",
+        "price": str(price),
+        "status": "ITEM_STATUS_ON_SALE",
+        "created": str(1718383194 + i),
+        "updated": str(1718383194 + i),
+    }
+
+
+@pytest.fixture
+def listings():
+    return [_listing(i) for i in range(12)]
+
+
+async def _collect(watcher: ListingWatcher, count: int) -> List:
+    events = []
+    stream = watcher.watch()
+    try:
+        async for event in stream:
+            events.append(event)
+            if len(events) == count:
+                break
+    finally:
+        await stream.aclose()
+    return events
+
+
+@pytest.mark.asyncio
+async def test_watcher_emits_new_listings(m, searches, listings):
+    watcher = ListingWatcher(m, min_interval=0.01, max_interval=0.05)
+    watcher.add("sharpnel")
+    await watcher._fetch(watcher.queries["sharpnel"], lambda e: None)
+    assert len(searches.requests) == 1
+
+    listings.extend(_listing(i) for i in range(12, 19))
+    events = await asyncio.wait_for(_collect(watcher, 7), 1)
+
+    assert all(e.new for e in events)
+    assert sorted(e.item.id_ for e in events) == [f"m{i:011}" for i in range(12, 19)]
+    # two pages with new listings were fetched, the second one ended the poll
+    assert [r.page_token or "" for r in searches.requests] == ["", "", "1"]
+    assert all(
+        r.search_conditions.sort_by == SearchRequestData.SortBy.SORT_CREATED_TIME
+        for r in searches.requests
+    )
+
+
+@pytest.mark.asyncio
+async def test_watcher_emits_changed_listings(m, searches, listings):
+    watcher = ListingWatcher(m, min_interval=0.01, max_interval=0.05)
+    watcher.add("sharpnel")
+    await watcher._fetch(watcher.queries["sharpnel"], lambda e: None)
+
+    listings[11] = _listing(11, price=250)
+    (event,) = await asyncio.wait_for(_collect(watcher, 1), 1)
+
+    assert not event.new
+    assert event.price_changed and not event.status_changed
+    assert event.previous_price == 300
+    assert event.item.price == 250
+
+
+@pytest.mark.asyncio
+async def test_watcher_emit_initial(m, searches):
+    watcher = ListingWatcher(m, min_interval=0.01, emit_initial=True)
+    watcher.add("sharpnel")
+    events = await asyncio.wait_for(_collect(watcher, 5), 1)
+
+    assert [e.item.id_ for e in events] == [f"m{i:011}" for i in range(11, 6, -1)]
+
+
+@pytest.mark.asyncio
+async def test_watcher_emits_listings_created_in_same_second(m, searches, listings):
+    watcher = ListingWatcher(m, min_interval=0.01, max_interval=0.05)
+    watcher.add("sharpnel")
+    await watcher._fetch(watcher.queries["sharpnel"], lambda e: None)
+
+    listings.append({**_listing(12), "created": listings[11]["created"]})
+    (event,) = await asyncio.wait_for(_collect(watcher, 1), 1)
+
+    assert event.new
+    assert event.item.id_ == f"m{12:011}"
+
+
+def test_watcher_seen_ids_are_bounded(m, listings):
+    watcher = ListingWatcher(m, max_seen=3)
+    watcher.add("sharpnel")
+    state = watcher.queries["sharpnel"]
+    for listing in listings:
+        watcher._diff(state, map_to_class(listing, SearchResultItem), None)
+
+    assert list(state.seen) == [f"m{i:011}" for i in range(9, 12)]
+
+
+def test_watcher_interval_follows_rate_of_new_listings(m):
+    watcher = ListingWatcher(m, min_interval=1, max_interval=100, target_per_poll=10)
+    watcher.add("sharpnel")
+    state = watcher.queries["sharpnel"]
+
+    watcher._reschedule(state, 0, 0.0)
+    watcher._reschedule(state, 20, 10.0)
+    assert state.interval == pytest.approx(5.0)
+    watcher._reschedule(state, 0, 15.0)
+    assert state.interval == pytest.approx(10 / (0.7 * 2.0))
+    for i in range(50):
+        watcher._reschedule(state, 0, 20.0 + i)
+    assert state.interval == 100
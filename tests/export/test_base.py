@@ -0,0 +1,37 @@
+from typing import Any, List
+
+import pytest
+
+from mercapi.export import Sink
+
+
+class ListSink(Sink):
+    def __init__(self, batch_size: int):
+        super().__init__(batch_size)
+        self.batches: List[List[Any]] = []
+        self.closed = False
+
+    def _write_batch(self, batch: List[Any]) -> None:
+        self.batches.append(batch)
+
+    def _close(self) -> None:
+        self.closed = True
+
+
+def test_sink_requires_write_batch_and_close():
+    class IncompleteSink(Sink):
+        def _write_batch(self, batch: List[Any]) -> None:
+            pass
+
+    with pytest.raises(TypeError):
+        IncompleteSink(10)
+
+
+@pytest.mark.asyncio
+async def test_sink_writes_in_batches():
+    async with ListSink(batch_size=2) as sink:
+        assert await sink.write_all(range(5)) == 5
+
+    assert sink.batches == [[0, 1], [2, 3], [4]]
+    assert sink.written == 5
+    assert sink.closed
@@ -0,0 +1,66 @@
+import gzip
+import json
+
+import pytest
+
+from mercapi import Mercapi
+from mercapi.export import NDJSONSink
+from mercapi.testing import StubTransport
+
+
+@pytest.fixture
+def m():
+    return Mercapi(transport=StubTransport(num_found=300))
+
+
+@pytest.mark.asyncio
+async def test_ndjson_sink_writes_search_results_in_batches(m, tmp_path):
+    path = tmp_path / "results.ndjson.gz"
+    async with NDJSONSink(path, batch_size=50) as sink:
+        written = await sink.write_all(m.search_iter("sharpnel"))
+
+    assert written == 300
+    with gzip.open(path, "rt", encoding="utf8") as file:
+        records = [json.loads(line) for line in file]
+    assert len(records) == 300
+    assert len({r["id_"] for r in records}) == 300
+    first = (await m.search("sharpnel")).items[0]
+    assert records[0]["id_"] == first.id_
+    assert records[0]["price"] == first.price
+    assert records[0]["created"] == int(first.created.timestamp())
+    assert not any(k.startswith("_") for k in records[0])
+
+
+@pytest.mark.asyncio
+async def test_ndjson_sink_expands_pages_and_appends(m, tmp_path):
+    path = tmp_path / "results.ndjson"
+    page = await m.search("sharpnel")
+    async with NDJSONSink(path) as sink:
+        await sink.write(page)
+    async with NDJSONSink(path, append=True) as sink:
+        await sink.write(page.items[0])
+        assert sink.written == 0
+    assert sink.written == 1
+
+    with open(path, encoding="utf8") as file:
+        lines = file.read().splitlines()
+    assert len(lines) == len(page.items) + 1
+    assert json.loads(lines[-1])["id_"] == page.items[0].id_
+
+
+@pytest.mark.asyncio
+async def test_ndjson_sink_writes_nested_models(m, tmp_path):
+    path = tmp_path / "items.ndjson"
+    item = await m.item("m00000000000")
+    async with NDJSONSink(path) as sink:
+        await sink.write(item)
+
+    with open(path, encoding="utf8") as file:
+        record = json.loads(file.read())
+    assert record["seller"]["id_"] == item.seller.id_
+    assert record["item_condition"]["name"] == item.item_condition.name
+
+
+def test_ndjson_sink_rejects_unknown_compression(tmp_path):
+    with pytest.raises(ValueError):
+        NDJSONSink(tmp_path / "results.ndjson", compression="lz4")
@@ -0,0 +1,54 @@
+import pytest
+
+from mercapi import Mercapi
+from mercapi.export import ParquetSink, arrow_schema
+from mercapi.models import Item, SearchResultItem
+from mercapi.testing import StubTransport
+
+pyarrow = pytest.importorskip("pyarrow")
+pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+
+
+@pytest.fixture
+def m():
+    return Mercapi(transport=StubTransport(num_found=300))
+
+
+def test_arrow_schema_follows_model():
+    schema = arrow_schema(Item)
+
+    assert schema.field("price").type == pyarrow.int64()
+    assert schema.field("created").type == pyarrow.timestamp("ms", tz="UTC")
+    assert schema.field("photos").type == pyarrow.list_(pyarrow.string())
+    assert pyarrow.types.is_struct(schema.field("seller").type)
+    assert schema.field("application_attributes").type == pyarrow.string()
+    assert arrow_schema(Item) == schema
+
+
+@pytest.mark.asyncio
+async def test_parquet_sink_writes_row_groups(m, tmp_path):
+    path = tmp_path / "results.parquet"
+    async with ParquetSink(path, SearchResultItem, batch_size=100) as sink:
+        await sink.write_all(m.search_iter("sharpnel"))
+
+    file = pyarrow_parquet.ParquetFile(path)
+    assert file.metadata.num_rows == 300
+    assert file.metadata.num_row_groups == 3
+    assert file.schema_arrow == arrow_schema(SearchResultItem)
+    table = file.read()
+    first = (await m.search("sharpnel")).items[0]
+    assert table.column("id_")[0].as_py() == first.id_
+    assert table.column("price")[0].as_py() == first.price
+    assert table.column("created")[0].as_py().timestamp() == first.created.timestamp()
+
+
+@pytest.mark.asyncio
+async def test_parquet_sink_writes_nested_models(m, tmp_path):
+    path = tmp_path / "items.parquet"
+    item = await m.item("m00000000000")
+    async with ParquetSink(path, Item) as sink:
+        await sink.write(item)
+
+    row = pyarrow_parquet.read_table(path).to_pylist()[0]
+    assert row["seller"]["id_"] == item.seller.id_
+    assert row["item_condition"]["name"] == item.item_condition.name
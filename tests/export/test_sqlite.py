@@ -0,0 +1,52 @@
+import json
+import sqlite3
+
+import pytest
+
+from mercapi import Mercapi
+from mercapi.export import SQLiteSink
+from mercapi.models import Item, SearchResultItem
+from mercapi.testing import StubTransport
+
+
+@pytest.fixture
+def m():
+    return Mercapi(transport=StubTransport(num_found=300))
+
+
+@pytest.mark.asyncio
+async def test_sqlite_sink_upserts_results(m, tmp_path):
+    path = tmp_path / "results.db"
+    page = await m.search("sharpnel")
+    async with SQLiteSink(path, SearchResultItem, batch_size=100) as sink:
+        assert await sink.write_all(m.search_iter("sharpnel")) == 300
+        page.items[0].price = 1
+        await sink.write(page.items[0])
+
+    connection = sqlite3.connect(path)
+    assert connection.execute("SELECT COUNT(*) FROM search_result_item").fetchone() == (
+        300,
+    )
+    price, created, thumbnails = connection.execute(
+        "SELECT price, created, thumbnails FROM search_result_item WHERE id_ = ?",
+        (page.items[0].id_,),
+    ).fetchone()
+    assert price == 1
+    assert created == int(page.items[0].created.timestamp())
+    assert json.loads(thumbnails) == page.items[0].thumbnails
+
+
+@pytest.mark.asyncio
+async def test_sqlite_sink_stores_nested_models_as_json(m):
+    connection = sqlite3.connect(":memory:", check_same_thread=False)
+    item = await m.item("m00000000000")
+    async with SQLiteSink(connection, Item, table="items") as sink:
+        await sink.write(item)
+
+    (seller,) = connection.execute("SELECT seller FROM items").fetchone()
+    assert json.loads(seller)["id_"] == item.seller.id_
+
+
+def test_sqlite_sink_rejects_unknown_key(tmp_path):
+    with pytest.raises(ValueError):
+        SQLiteSink(tmp_path / "results.db", SearchResultItem, key="uuid")
@@ -0,0 +1,101 @@
+import json
+import stat
+import sys
+
+import pytest
+
+from mercapi.facets import FacetCatalog
+from mercapi.facets.catalog import DEFAULT_PATH, default_cache_dir, normalize
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    return FacetCatalog(cache_dir=tmp_path)
+
+
+def test_normalize():
+    assert normalize("ﾅｲｷ") == "ナイキ"
+    assert normalize("ないき") == "ナイキ"
+    assert normalize("Ｎｉｋｅ SB") == "nikesb"
+    assert normalize("ア・ベイシング・エイプ") == "アベイシングエイプ"
+
+
+def test_brand_search(catalog):
+    assert catalog.brands.find("nike").id_ == 857
+    assert catalog.brands.find("ナイキ").sub_name == "NIKE"
+    assert catalog.brands.find("nonexistent brand") is None
+
+    found = catalog.brands.search("ないき", limit=3)
+    assert found[0].id_ == 857
+    assert all(b.name.startswith("ナイキ") for b in found)
+
+
+def test_category_tree(catalog):
+    categories = catalog.categories
+
+    assert categories[75].name == "CD"
+    assert categories.parent(75).id_ == 5
+    assert [c.id_ for c in categories.ancestors(119)] == [11, 1]
+    assert [c.id_ for c in categories.children(75)] == list(categories[75].children)
+    assert 119 in {c.id_ for c in categories.descendants(1)}
+    assert 75 not in {c.id_ for c in categories.descendants(1)}
+    assert all(not c.children for c in categories.leaves(5))
+    assert {c.parent_id for c in categories.find("スニーカー")} >= {16, 33}
+
+
+def test_size_groups(catalog):
+    assert catalog.sizes[1].name == "洋服のサイズ"
+    assert catalog.sizes.find(1, "m").id_ == 3
+    assert all(s.group_id == 1 for s in catalog.sizes[1].sizes)
+
+
+def test_indexes_are_loaded_lazily_and_cached(tmp_path, monkeypatch):
+    catalog = FacetCatalog(cache_dir=tmp_path)
+    assert list(tmp_path.iterdir()) == []
+
+    catalog.sizes
+    assert [p.name.split("-")[0] for p in tmp_path.iterdir()] == ["sizes"]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("JSON should not be parsed")
+
+    monkeypatch.setattr(json, "load", fail)
+    assert FacetCatalog(cache_dir=tmp_path).sizes.find(1, "M").id_ == 3
+
+
+def test_indexes_are_cached_in_user_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(sys, "platform", "linux")
+    assert FacetCatalog().sizes.find(1, "M").id_ == 3
+
+    cache_dir = tmp_path / "mercapi" / "facets"
+    assert default_cache_dir() == cache_dir
+    assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+    assert [p.name.split("-")[0] for p in cache_dir.iterdir()] == ["sizes"]
+    assert not any(p.name.endswith(".index") for p in DEFAULT_PATH.iterdir())
+
+
+def test_indexes_of_different_directories_do_not_collide(tmp_path):
+    for name, size in [("a", "S"), ("b", "L")]:
+        (tmp_path / name).mkdir()
+        with open(tmp_path / name / "sizes.json", "w", encoding="utf8") as file:
+            json.dump(
+                {"sizes": [{"id": "1", "name": size, "groupId": "1", "group": "g"}]},
+                file,
+            )
+    cache_dir = tmp_path / "cache"
+
+    assert (
+        FacetCatalog(tmp_path / "a", cache_dir=cache_dir).sizes[1].sizes[0].name == "S"
+    )
+    assert (
+        FacetCatalog(tmp_path / "b", cache_dir=cache_dir).sizes[1].sizes[0].name == "L"
+    )
+
+
+def test_corrupted_index_is_rebuilt(tmp_path):
+    FacetCatalog(cache_dir=tmp_path).brands
+    (cache,) = tmp_path.iterdir()
+    cache.write_bytes(b"garbage")
+
+    assert FacetCatalog(cache_dir=tmp_path).brands.find("nike").id_ == 857
@@ -0,0 +1,123 @@
+import json
+import threading
+
+import httpx
+import pytest
+
+from mercapi import Mercapi
+from mercapi.facets import FacetCatalog, refresh_facets
+from mercapi.facets.refresh import FACET_ENDPOINTS
+
+SIZES = {
+    "sizes": [{"id": "2", "name": "S", "groupId": "1", "group": "洋服のサイズ"}],
+    "nextPageToken": "",
+}
+
+
+@pytest.fixture
+def server():
+    """Master endpoints responding with `server["bodies"][file name]`."""
+    state = {
+        "bodies": {name: {"data": [], "meta": {}} for name in FACET_ENDPOINTS},
+        "etags": False,
+        "requests": [],
+    }
+    state["bodies"]["sizes.json"] = SIZES
+    urls = {url: name for name, url in FACET_ENDPOINTS.items()}
+
+    def handler(request):
+        name = urls[str(request.url)]
+        state["requests"].append(request)
+        body = state["bodies"][name]
+        if body is None:
+            return httpx.Response(500)
+        etag = f'"{hash(json.dumps(body))}"'
+        if state["etags"] and request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        headers = {"ETag": etag} if state["etags"] else {}
+        return httpx.Response(200, json=body, headers=headers)
+
+    state["mercapi"] = Mercapi(transport=httpx.MockTransport(handler))
+    return state
+
+
+@pytest.mark.asyncio
+async def test_refresh_writes_only_changed_facets(server, tmp_path):
+    m = server["mercapi"]
+    assert sorted(await refresh_facets(m, tmp_path)) == sorted(FACET_ENDPOINTS)
+    assert json.loads((tmp_path / "sizes.json").read_text("utf8")) == SIZES
+    assert all("DPoP" in r.headers for r in server["requests"])
+
+    server["bodies"]["brands.json"] = {"data": [], "meta": {"requested": 1}}
+    assert await refresh_facets(m, tmp_path) == []
+
+    server["bodies"]["colors.json"] = {"colors": []}
+    assert await refresh_facets(m, tmp_path) == ["colors.json"]
+
+
+@pytest.mark.asyncio
+async def test_refresh_sends_conditional_requests(server, tmp_path):
+    server["etags"] = True
+    m = server["mercapi"]
+    await refresh_facets(m, tmp_path)
+    server["requests"].clear()
+
+    assert await refresh_facets(m, tmp_path) == []
+    assert all("If-None-Match" in r.headers for r in server["requests"])
+
+
+@pytest.mark.asyncio
+async def test_refresh_skips_failed_facets(server, tmp_path):
+    server["bodies"]["brands.json"] = None
+    changed = await refresh_facets(server["mercapi"], tmp_path)
+
+    assert "brands.json" not in changed
+    assert not (tmp_path / "brands.json").exists()
+    assert (tmp_path / "sizes.json").exists()
+
+
+@pytest.mark.asyncio
+async def test_refresh_rebuilds_changed_indexes(server, tmp_path):
+    m = server["mercapi"]
+    await refresh_facets(m, tmp_path)
+    catalog = FacetCatalog(tmp_path)
+    assert catalog.sizes.find(1, "M") is None
+
+    server["bodies"]["sizes.json"] = {
+        "sizes": [*SIZES["sizes"], {**SIZES["sizes"][0], "id": "3", "name": "M"}]
+    }
+    await refresh_facets(m, tmp_path, catalog=catalog)
+
+    assert catalog.sizes.find(1, "M").id_ == 3
+
+
+@pytest.mark.asyncio
+async def test_refresh_rebuilds_indexes_off_the_event_loop(
+    server, tmp_path, monkeypatch
+):
+    m = server["mercapi"]
+    await refresh_facets(m, tmp_path)
+    catalog = FacetCatalog(tmp_path)
+    catalog.sizes
+    threads = []
+    load = catalog._load
+    monkeypatch.setattr(
+        catalog,
+        "_load",
+        lambda name: threads.append(threading.get_ident()) or load(name),
+    )
+
+    server["bodies"]["sizes.json"] = {
+        "sizes": [{**SIZES["sizes"][0], "name": "L"}],
+        "nextPageToken": "",
+    }
+    await refresh_facets(m, tmp_path, catalog=catalog)
+
+    assert len(threads) == 1
+    assert threads[0] != threading.get_ident()
+    assert catalog.sizes.find(1, "L").id_ == 2
+
+
+def test_refresh_requires_path(server):
+    with pytest.raises(TypeError):
+        refresh_facets(server["mercapi"])
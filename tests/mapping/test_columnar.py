@@ -0,0 +1,108 @@
+from datetime import datetime
+
+import pytest
+
+from mercapi.mapping import map_to_class
+from mercapi.mapping.columnar import NULL, SearchColumns
+from mercapi.models import SearchResultItem
+from mercapi.util.errors import ParseAPIResponseError
+
+ITEMS = [
+    {
+        "id": "m1",
+        "name": "foo",
+        "price": "300",
+        "sellerId": "1",
+        "created": "1652715351",
+        "updated": "1661206795",
+        "categoryId": "75",
+        "isNoPrice": True,
+    },
+    {"id": "m2", "name": "bar", "price": "9999999"},
+]
+
+
+def test_from_response():
+    table = SearchColumns.from_response(ITEMS)
+
+    assert len(table) == 2
+    assert table["id_"] == ["m1", "m2"]
+    assert list(table["price"]) == [300, 9999999]
+    assert list(table["category_id"]) == [75, NULL]
+    assert list(table["created"]) == [1652715351, NULL]
+    assert list(table["is_no_price"]) == [1, 0]
+    assert table["seller_id"] == ["1", ""]
+
+
+def test_from_items_matches_from_response():
+    items = [map_to_class(i, SearchResultItem) for i in ITEMS]
+
+    expected = SearchColumns.from_response(ITEMS).columns
+    assert SearchColumns.from_items(items).columns == expected
+
+
+def test_concat():
+    table = SearchColumns.concat(
+        [SearchColumns.from_response(ITEMS), SearchColumns.from_response(ITEMS[:1])]
+    )
+
+    assert table["id_"] == ["m1", "m2", "m1"]
+    assert list(table["price"]) == [300, 9999999, 300]
+
+
+def test_to_numpy():
+    numpy = pytest.importorskip("numpy")
+    arrays = SearchColumns.from_response(ITEMS).to_numpy()
+
+    assert arrays["price"].dtype == numpy.int64
+    assert arrays["price"].tolist() == [300, 9999999]
+    assert arrays["created"][0] == numpy.datetime64(
+        datetime.utcfromtimestamp(1652715351)
+    )
+    assert numpy.isnat(arrays["created"][1])
+    assert arrays["is_no_price"].tolist() == [True, False]
+    assert arrays["id_"].tolist() == ["m1", "m2"]
+
+
+def test_from_response_stores_invalid_optional_values_as_missing():
+    items = [
+        {**ITEMS[1], "created": "1652715351.5", "categoryId": "x", "updated": "1e30"},
+        {**ITEMS[1], "sellerId": None, "itemConditionId": None, "created": "?"},
+    ]
+    table = SearchColumns.from_response(items)
+
+    assert list(table["created"]) == [1652715351, NULL]
+    assert list(table["updated"]) == [NULL, NULL]
+    assert list(table["category_id"]) == [NULL, NULL]
+    assert list(table["item_condition_id"]) == [NULL, NULL]
+    assert table["seller_id"] == ["", ""]
+
+
+@pytest.mark.parametrize(
+    "item",
+    [
+        {"name": "foo", "price": "300"},
+        {"id": "m1", "name": None, "price": "300"},
+        {"id": "m1", "name": "foo", "price": "free"},
+    ],
+)
+def test_from_response_raises_on_invalid_required_values(item):
+    with pytest.raises(ParseAPIResponseError):
+        SearchColumns.from_response([ITEMS[0], item])
+
+
+def test_to_arrow():
+    pyarrow = pytest.importorskip("pyarrow")
+    table = SearchColumns.from_response(ITEMS)
+    arrow = table.to_arrow()
+
+    assert arrow.num_rows == 2
+    assert arrow.column("price").to_pylist() == [300, 9999999]
+    assert arrow.column("category_id").to_pylist() == [75, None]
+    assert arrow.column("created").type == pyarrow.timestamp("s")
+    assert arrow.column("created").null_count == 1
+
+    # the arrow table does not share memory with the columns
+    table.extend(SearchColumns.from_response(ITEMS))
+    assert len(table) == 4
+    assert arrow.column("price").to_pylist() == [300, 9999999]
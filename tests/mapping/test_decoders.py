@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+from mercapi.mapping.decoders import (
+    JSONDecoder,
+    MsgspecDecoder,
+    OrjsonDecoder,
+    default_decoder,
+)
+from mercapi.testing.fixtures import cassette_interactions
+from mercapi.util.errors import ParseAPIResponseError
+
+
+def _search_bodies():
+    return [
+        response["content"].encode("utf8")
+        for request, response in cassette_interactions("tests/cassettes")
+        if request["uri"].endswith("/v2/entities:search")
+    ]
+
+
+def _decoders():
+    decoders = [JSONDecoder]
+    for decoder, module in [(OrjsonDecoder, "orjson"), (MsgspecDecoder, "msgspec")]:
+        decoders.append(
+            pytest.param(
+                decoder,
+                marks=pytest.mark.skipif(
+                    not _installed(module), reason=f"{module} is not installed"
+                ),
+            )
+        )
+    return decoders
+
+
+def _installed(module: str) -> bool:
+    try:
+        __import__(module)
+    except ImportError:
+        return False
+    return True
+
+
+@pytest.mark.parametrize("decoder", _decoders())
+def test_decoders_map_search_responses_identically(decoder):
+    reference = JSONDecoder()
+    decoder = decoder()
+    for body in _search_bodies():
+        assert decoder.decode(body) == reference.decode(body)
+        assert decoder.decode_search(body) == reference.decode_search(body)
+        assert decoder.decode_search(body)._fields is None
+
+
+@pytest.mark.parametrize("decoder", _decoders())
+def test_decoders_report_missing_required_properties(decoder):
+    body = json.dumps(
+        {
+            "meta": {"nextPageToken": "", "previousPageToken": "", "numFound": "1"},
+            "items": [{"id": "m1", "name": "foo"}],
+        }
+    ).encode()
+
+    with pytest.raises(ParseAPIResponseError):
+        decoder().decode_search(body)
+
+
+def test_default_decoder():
+    expected = OrjsonDecoder if _installed("orjson") else JSONDecoder
+    assert type(default_decoder()) == expected
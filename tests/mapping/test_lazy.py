@@ -0,0 +1,92 @@
+import logging
+import pickle
+
+import pytest
+
+import mercapi.mapping.lazy
+from mercapi.mapping import map_to_class, map_lazy
+from mercapi.mapping.definitions import ResponseMappingDefinition, ResponseProperty
+from mercapi.models import SearchResultItem, SearchResults
+from mercapi.util.errors import ParseAPIResponseError
+
+ITEM = {
+    "id": "m1",
+    "name": "foo",
+    "price": "300",
+    "created": "1652715351",
+    "itemConditionId": "3",
+}
+
+
+def test_lazy_model_equals_eager_model():
+    model = map_lazy(ITEM, SearchResultItem)
+
+    assert isinstance(model, SearchResultItem)
+    assert model == map_to_class(ITEM, SearchResultItem)
+    assert map_to_class(ITEM, SearchResultItem) == model
+
+
+def test_optional_properties_are_mapped_once_on_access():
+    calls = []
+    definition = ResponseMappingDefinition(
+        [ResponseProperty("id", "id_", lambda x: x["id"])],
+        [ResponseProperty("name", "name", lambda x: calls.append(1) or x["name"])],
+    )
+    model = map_lazy(ITEM, SearchResultItem, definition)
+    assert calls == []
+
+    assert model.name == "foo"
+    assert model.name == "foo"
+    assert calls == [1]
+
+
+def test_required_properties_are_validated_eagerly():
+    with pytest.raises(ParseAPIResponseError, match="SearchResultItem property id"):
+        map_lazy({"name": "foo", "price": "300"}, SearchResultItem)
+
+
+def test_incorrect_optional_property_is_none(caplog):
+    model = map_lazy({**ITEM, "itemConditionId": "new"}, SearchResultItem)
+
+    with caplog.at_level(logging.WARNING):
+        assert model.item_condition_id is None
+    assert "itemConditionId" in caplog.text
+
+
+def test_unknown_attribute():
+    model = map_lazy(ITEM, SearchResultItem)
+
+    with pytest.raises(AttributeError):
+        model.foo
+
+
+def test_lazy_model_is_pickled_as_eager_model():
+    model = map_lazy(ITEM, SearchResultItem)
+    restored = pickle.loads(pickle.dumps(model))
+
+    assert type(restored) is SearchResultItem
+    assert restored == map_to_class(ITEM, SearchResultItem)
+
+
+def test_lazy_search_results_are_pickled_with_default_private_fields():
+    response = {
+        "meta": {"nextPageToken": "", "previousPageToken": "", "numFound": "1"},
+        "items": [ITEM],
+    }
+    model = map_lazy(response, SearchResults)
+    restored = pickle.loads(pickle.dumps(model))
+
+    assert type(restored) is SearchResults
+    assert restored.items == [map_to_class(ITEM, SearchResultItem)]
+    assert restored._fields is None
+
+
+def test_lazy_classes_of_one_off_definitions_are_not_cached():
+    cached = dict(mercapi.mapping.lazy._lazy_classes)
+    definition = ResponseMappingDefinition(
+        [ResponseProperty("id", "id_", lambda x: x["id"])], []
+    )
+    model = map_lazy(ITEM, SearchResultItem, definition)
+
+    assert model.id_ == "m1"
+    assert mercapi.mapping.lazy._lazy_classes == cached
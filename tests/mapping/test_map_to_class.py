@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+import logging
+from dataclasses import dataclass, field
 from typing import Optional, Dict, Type, List, Any
 
 import pytest
@@ -8,9 +9,11 @@ from mercapi.mapping.definitions import (
     ResponseMappingDefinition,
     ResponseProperty,
     map_to_class,
+    get_mapper,
     Extractors,
 )
-from mercapi.models.base import ResponseModel
+from mercapi.models import SearchResultItem
+from mercapi.models.base import ResponseModel, _slots_dataclass_backport
 from mercapi.util.errors import ParseAPIResponseError
 
 
@@ -161,3 +164,132 @@ def test_mapping_list_of_nested_objects(monkeypatch):
     model = map_to_class(r, ModelTestD)
     assert len(model.list_nested) == 1
     assert model.list_nested[0] == ModelTest(field_1="foo", field_2="bar")
+
+
+def test_mapping_object_with_incorrect_optional():
+    definition = ResponseMappingDefinition(
+        [ResponseProperty("field1", "field_1", Extractors.get("field1"))],
+        [ResponseProperty("field2", "field_2", Extractors.get_as("field2", int))],
+    )
+    r = {
+        "field1": "foo",
+        "field2": "bar",
+    }
+    model = map_to_class(r, ModelTest, definition)
+
+    assert model.field_1 == "foo"
+    assert model.field_2 is None
+
+
+def test_mapping_error_names_missing_property():
+    r = {
+        "field2": "bar",
+    }
+    with pytest.raises(ParseAPIResponseError, match="ModelTest property field1"):
+        map_to_class(r, ModelTest, mapping_definitions[ModelTest])
+
+
+def test_mapping_with_custom_extractor():
+    definition = ResponseMappingDefinition(
+        [ResponseProperty("field1", "field_1", lambda x: x["field1"].upper())],
+        [ResponseProperty("field2", "field_2", lambda x: x.get("field2"))],
+    )
+    model = map_to_class({"field1": "foo"}, ModelTest, definition)
+
+    assert model == ModelTest(field_1="FOO", field_2=None)
+
+
+def test_mapper_is_compiled_once(monkeypatch):
+    definition = mapping_definitions[ModelTest]
+    monkeypatch.setitem(
+        mercapi.mapping.definitions.mapping_definitions, ModelTest, definition
+    )
+    mapper = get_mapper(ModelTest)
+
+    assert hasattr(mapper, "source")
+    assert get_mapper(ModelTest, definition) is mapper
+    assert mapper({"field1": "foo"}) == ModelTest(field_1="foo", field_2=None)
+
+
+def test_one_off_definitions_are_not_compiled():
+    compiled = dict(mercapi.mapping.definitions._compiled_mappers)
+    definition = ResponseMappingDefinition(
+        [ResponseProperty("field1", "field_1", Extractors.get("field1"))],
+        [ResponseProperty("field2", "field_2", Extractors.get("field2"))],
+    )
+    mapper = get_mapper(ModelTest, definition)
+
+    assert not hasattr(mapper, "source")
+    assert mapper({"field1": "foo"}) == ModelTest(field_1="foo", field_2=None)
+    assert mercapi.mapping.definitions._compiled_mappers == compiled
+
+
+def test_incorrect_nested_optional_is_reported_once(monkeypatch, caplog):
+    definitions = mercapi.mapping.definitions.mapping_definitions
+    monkeypatch.setitem(
+        definitions,
+        ModelTestBNested,
+        ResponseMappingDefinition(
+            [ResponseProperty("fieldA", "field_a", Extractors.get("fieldA"))],
+            [ResponseProperty("fieldB", "field_b", Extractors.get_as("fieldB", int))],
+        ),
+    )
+    monkeypatch.setitem(
+        definitions,
+        ModelTest,
+        ResponseMappingDefinition(
+            [
+                ResponseProperty(
+                    "field1",
+                    "field_1",
+                    Extractors.get_as_model("field1", ModelTestBNested),
+                )
+            ],
+            [ResponseProperty("field2", "field_2", Extractors.get_as("field2", int))],
+        ),
+    )
+    r = {"field1": {"fieldA": "foo", "fieldB": "bar"}, "field2": "baz"}
+    with caplog.at_level(logging.WARNING):
+        model = map_to_class(r, ModelTest)
+
+    assert model == ModelTest(
+        field_1=ModelTestBNested(field_a="foo", field_b=None), field_2=None
+    )
+    assert [
+        record.getMessage().split()[4]
+        for record in caplog.records
+        if record.levelno == logging.WARNING
+    ] == ["fieldB", "field2"]
+
+
+def test_mapped_models_are_slotted(monkeypatch):
+    mercapi = object()
+    monkeypatch.setattr(ResponseModel, "_mercapi", mercapi, raising=False)
+    r = {"id": "m1", "name": "foo", "price": "300"}
+    model = map_to_class(r, SearchResultItem)
+
+    assert not hasattr(model, "__dict__")
+    assert model.id_ == "m1"
+    assert model._mercapi is mercapi
+
+
+def test_slots_dataclass_backport_sets_defaults_of_non_init_fields():
+    class Model(ResponseModel):
+        id_: str
+        name: str = "foo"
+        _hidden: Optional[str] = field(default=None, init=False)
+        _tags: List[str] = field(default_factory=list, init=False)
+
+    Model = _slots_dataclass_backport(Model)
+    model = Model("m1")
+
+    assert not hasattr(model, "__dict__")
+    assert (model.id_, model.name, model._hidden, model._tags) == (
+        "m1",
+        "foo",
+        None,
+        [],
+    )
+    assert Model("m1", "bar").name == "bar"
+    model._hidden = "bar"
+    assert model._hidden == "bar"
@@ -0,0 +1,43 @@
+import pytest
+
+from mercapi.mapping.projection import project, project_container
+from mercapi.models import SearchResultItem, SearchResults
+from mercapi.util.errors import ParseAPIResponseError
+
+ITEM = {"id": "m1", "name": "foo", "price": "300", "categoryId": "75"}
+
+
+def test_project():
+    mapper = project(SearchResultItem, ["price", "category_id", "id_"])
+    result = mapper(ITEM)
+
+    assert result == (300, 75, "m1")
+    assert result.price == 300
+    assert project(SearchResultItem, ("price", "category_id", "id_")) is mapper
+
+
+def test_project_validates_only_projected_required_properties():
+    assert project(SearchResultItem, ["price"])({"price": "300"}) == (300,)
+
+    with pytest.raises(ParseAPIResponseError, match="SearchResultItem property id"):
+        project(SearchResultItem, ["id_", "price"])({"price": "300"})
+
+
+def test_project_unknown_field():
+    with pytest.raises(ValueError, match="unknown: foo"):
+        project(SearchResultItem, ["id_", "foo"])
+
+
+def test_project_container():
+    mapper = project_container(
+        SearchResults, "items", project(SearchResultItem, ["id_"])
+    )
+    result = mapper(
+        {
+            "meta": {"nextPageToken": "", "previousPageToken": "", "numFound": "1"},
+            "items": [ITEM],
+        }
+    )
+
+    assert result.meta.num_found == 1
+    assert result.items == [("m1",)]
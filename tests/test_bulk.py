@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from mercapi import Mercapi
+from mercapi.testing import StubTransport
+from mercapi.util.concurrency import bounded_as_completed
+
+
+@pytest.mark.asyncio
+@pytest.mark.vcr
+async def test_items_bulk(m):
+    ids = ["m12871737078", "m00000000000", "m70888717210"]
+    res = {id_: item async for id_, item in m.items_bulk(ids, concurrency=2)}
+
+    assert res.keys() == set(ids)
+    assert res["m00000000000"] is None
+    assert res["m12871737078"].name == "DJ Sharpnel / PPPH!"
+    assert len(res["m70888717210"].comments) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.vcr
+async def test_profiles_bulk(m):
+    res = [pair async for pair in m.profiles_bulk(iter(["362164700"]))]
+
+    assert len(res) == 1
+    id_, profile = res[0]
+    assert id_ == "362164700"
+    assert profile.name == "nananao"
+
+
+@pytest.mark.asyncio
+async def test_bulk_rejects_non_positive_concurrency(m):
+    with pytest.raises(ValueError):
+        async for _ in m.items_bulk(["m12871737078"], concurrency=0):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_bulk_bounds_requests_in_flight():
+    transport = StubTransport(latency=0.02)
+    m = Mercapi(transport=transport)
+    ids = [f"m{i:011}" for i in range(20)]
+
+    res = [pair async for pair in m.items_bulk(ids, concurrency=3)]
+
+    assert len(res) == 20
+    assert transport.requests["item"] == 20
+    assert transport.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_bounded_as_completed_awaits_cancelled_tasks():
+    tasks = []
+
+    async def fail(arg):
+        tasks.append(asyncio.current_task())
+        await asyncio.sleep(0.01 if arg < 2 else 1)
+        raise RuntimeError(arg)
+
+    with pytest.raises(RuntimeError):
+        async for _ in bounded_as_completed(fail, range(4), 4):
+            pass
+
+    assert len(tasks) == 4
+    assert all(task.done() for task in tasks)
+    assert sum(task.cancelled() for task in tasks) == 2
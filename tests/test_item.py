@@ -2,6 +2,9 @@ from datetime import datetime
 
 import pytest
 
+from mercapi import Mercapi
+from mercapi.models import Item
+
 
 @pytest.mark.asyncio
 @pytest.mark.vcr
@@ -87,3 +90,26 @@ async def test_item_with_comments(m):
 async def test_item_not_found(m):
     res = await m.item("m00000000000")
     assert res is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.vcr
+async def test_item_lazy():
+    m = Mercapi(lazy_models=True)
+    res = await m.item("m12871737078")
+
+    assert isinstance(res, Item)
+    assert res.id_ == "m12871737078"
+    assert res.price == 8000
+    assert res.seller.id_ == 485869194
+
+
+@pytest.mark.asyncio
+@pytest.mark.vcr
+async def test_item_fields(m):
+    res = await m.item("m12871737078", fields=["id_", "price", "updated"])
+
+    assert res.id_ == "m12871737078"
+    assert res.price == 8000
+    assert isinstance(res.updated, datetime)
+    assert not hasattr(res, "description")
@@ -44,3 +44,12 @@ async def test_items_fetch_full_item_from_seller_item(m):
     res = await items.items[0].full_item()
 
     assert res.id_ == "m77200069010"
+
+
+@pytest.mark.asyncio
+@pytest.mark.vcr
+async def test_items_fields(m):
+    res = await m.items("362164700", fields=["price", "id_"])
+
+    assert len(res.items) == 30
+    assert res.items[0] == (1600, "m62857872792")
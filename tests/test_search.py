@@ -90,6 +90,16 @@ async def test_search_fetch_next_page(m):
     assert item.name == "beatmania IIDX 28 BISTROVER サウンドトラック"
 
 
+@pytest.mark.asyncio
+@pytest.mark.vcr
+async def test_search_fields_next_page(m):
+    res = await m.search("sharpnel", fields=["id_", "name"])
+    res = await res.next_page()
+
+    assert res.items[0] == ("m49788155901", "beatmania IIDX 28 BISTROVER サウンドトラック")
+    assert res.items[0]._fields == ("id_", "name")
+
+
 @pytest.mark.asyncio
 @pytest.mark.vcr
 async def test_search_fetch_prev_page(m):
@@ -154,3 +164,31 @@ async def test_search_no_price_item(m):
     assert item.is_no_price
     assert item.price == 9999999
     assert item.real_price is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.vcr
+async def test_search_iter(m):
+    items = [i async for i in m.search_iter("sharpnel")]
+    assert len(items) == 143
+    assert items[0].id_ == "m93879216403"
+    assert items[119].id_ == "m49788155901"
+
+
+@pytest.mark.asyncio
+@pytest.mark.vcr
+async def test_search_iter_max_items(m):
+    items = [i async for i in m.search_iter("sharpnel", max_items=10, prefetch=2)]
+    assert len(items) == 10
+    assert items[0].id_ == "m93879216403"
+
+
+@pytest.mark.asyncio
+@pytest.mark.vcr
+async def test_search_columns(m):
+    table = await m.search_columns("sharpnel")
+
+    assert len(table) == 143
+    assert table["id_"][0] == "m93879216403"
+    assert table["id_"][119] == "m49788155901"
+    assert min(table["price"]) >= 300
@@ -0,0 +1,96 @@
+import pytest
+
+from mercapi import Mercapi
+from mercapi.crawl import PriceShardCrawler
+from mercapi.testing import Fixtures, StubTransport
+from mercapi.util.errors import ResponseStatusError
+from mercapi.util.ratelimit import AdaptiveRateLimiter
+
+
+@pytest.mark.asyncio
+async def test_stub_search_pagination():
+    m = Mercapi(transport=StubTransport(num_found=150))
+    res = await m.search("sharpnel")
+    assert res.meta.num_found == 150
+    assert len(res.items) == 120
+    assert res.meta.next_page_token == "v1:1"
+
+    res = await res.next_page()
+    assert len(res.items) == 30
+    assert res.meta.next_page_token == ""
+    assert res.meta.prev_page_token == "v1:0"
+
+
+@pytest.mark.asyncio
+async def test_stub_search_price_filter():
+    m = Mercapi(transport=StubTransport(num_found=100))
+    res = await m.search("sharpnel", price_min=1000, price_max=20_000)
+
+    assert 0 < res.meta.num_found < 100
+    assert all(1000 <= i.price <= 20_000 for i in res.items)
+
+
+@pytest.mark.asyncio
+async def test_stub_search_is_deterministic():
+    first = await Mercapi(transport=StubTransport(seed=1)).search("sharpnel")
+    second = await Mercapi(transport=StubTransport(seed=1)).search("sharpnel")
+
+    assert first.items == second.items
+
+
+@pytest.mark.asyncio
+async def test_stub_search_max_pages_with_price_shard_crawler():
+    transport = StubTransport(num_found=1000, max_pages=2)
+    m = Mercapi(transport=transport)
+    res = await m.search("sharpnel")
+    res = await res.next_page()
+    assert res.meta.next_page_token == ""
+
+    crawler = PriceShardCrawler(m, "sharpnel", window=240)
+    items = [i async for i in crawler]
+    assert len(items) == 1000
+    assert crawler.coverage == 1.0
+
+
+@pytest.mark.asyncio
+async def test_stub_item_profile_and_items():
+    m = Mercapi(transport=StubTransport(missing_ids={"m404"}))
+
+    item = await m.item("m12345")
+    assert item.id_ == "m12345"
+    assert await m.item("m404") is None
+
+    profile = await m.profile("362164700")
+    assert profile.id_ == 362164700
+
+    items = await m.items("362164700")
+    assert len(items.items) == 30
+    assert all(i.seller_id == "362164700" for i in items.items)
+
+
+@pytest.mark.asyncio
+async def test_stub_injects_errors():
+    transport = StubTransport(error_rate=1.0)
+    with pytest.raises(ResponseStatusError):
+        await Mercapi(transport=transport).item("m12345")
+    assert transport.requests["item"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stub_injects_throttling():
+    transport = StubTransport(throttle_rate=0.5, seed=3)
+    m = Mercapi(transport=transport, rate_limiter=AdaptiveRateLimiter(max_retries=10))
+    ids = [f"m{i}" for i in range(20)]
+    res = [pair async for pair in m.items_bulk(ids)]
+
+    assert len(res) == 20
+    assert transport.requests["item"] > 20
+
+
+def test_fixtures_from_cassettes():
+    fixtures = Fixtures.from_cassettes("tests/cassettes")
+
+    assert len(fixtures.search_items) > 100
+    assert any(i["id"] == "m12871737078" for i in fixtures.items)
+    assert fixtures.profiles[0]["name"] == "nananao"
+    assert len(fixtures.seller_items) > 0
@@ -0,0 +1,72 @@
+import json
+import os
+import stat
+from collections import Counter
+
+import httpx
+import pytest
+from jose import jws
+
+from mercapi import Mercapi
+from mercapi.util.identity import IdentityPool
+from mercapi.util.proxies import ProxyPool
+
+ITEM = {"data": {"id": "m1", "status": "on_sale", "name": "foo", "price": 300}}
+
+
+def _uuid(request: httpx.Request) -> str:
+    return json.loads(jws.get_unverified_claims(request.headers["DPoP"]))["uuid"]
+
+
+@pytest.mark.asyncio
+async def test_requests_rotate_over_identities():
+    uuids = []
+
+    def handler(request):
+        uuids.append(_uuid(request))
+        return httpx.Response(200, json=ITEM)
+
+    identities = IdentityPool(size=3)
+    m = Mercapi(identities=identities, transport=httpx.MockTransport(handler))
+    for i in range(6):
+        await m.item(f"m{i}")
+
+    assert uuids == [i.uuid for i in identities.identities] * 2
+
+
+def test_identities_save_and_load(tmp_path):
+    path = str(tmp_path / "identities.json")
+    created = IdentityPool.load_or_create(path, size=2)
+    loaded = IdentityPool.load_or_create(path, size=5)
+
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert [i.uuid for i in loaded.identities] == [i.uuid for i in created.identities]
+    assert [i.key.to_string() for i in loaded.identities] == [
+        i.key.to_string() for i in created.identities
+    ]
+
+
+def test_identities_cannot_be_combined_with_signing_backend():
+    with pytest.raises(ValueError):
+        Mercapi(identities=IdentityPool(), signing_backend=IdentityPool().backend)
+
+
+@pytest.mark.asyncio
+async def test_identities_paired_with_proxies():
+    sent = Counter()
+
+    def client(proxy):
+        def handler(request):
+            sent[proxy, _uuid(request)] += 1
+            return httpx.Response(200, json=ITEM)
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    identities = IdentityPool(size=2)
+    pool = ProxyPool(["a", "b"], pair_identities=True, client_factory=client)
+    m = Mercapi(identities=identities, proxy_pool=pool)
+    for i in range(4):
+        await m.item(f"m{i}")
+
+    first, second = (i.uuid for i in identities.identities)
+    assert sent == {("a", first): 2, ("b", second): 2}
@@ -0,0 +1,66 @@
+import json
+
+import pytest
+from ecdsa import SigningKey, NIST256p
+from jose import jws
+from jose.backends.ecdsa_backend import ECDSAECKey
+from jose.constants import ALGORITHMS
+
+from mercapi.util.jwt import DPoPSigner, SigningBackend, generate_dpop
+
+
+def _verify(token: str, key: SigningKey) -> dict:
+    public_key = ECDSAECKey(key.get_verifying_key(), ALGORITHMS.ES256)
+    return json.loads(jws.verify(token, public_key, ALGORITHMS.ES256))
+
+
+@pytest.mark.parametrize("backend", list(SigningBackend))
+def test_dpop_signer_generates_verifiable_token(backend):
+    key = SigningKey.generate(NIST256p)
+    signer = DPoPSigner(key, backend)
+    token = signer.generate_dpop(
+        "https://api.mercari.jp/items/get?id=m1", "GET", {"uuid": "foo"}
+    )
+
+    payload = _verify(token, key)
+    assert payload["htu"] == "https://api.mercari.jp/items/get?id=m1"
+    assert payload["htm"] == "GET"
+    assert payload["uuid"] == "foo"
+
+    header = jws.get_unverified_header(token)
+    expected_jwk = ECDSAECKey(key, ALGORITHMS.ES256).to_dict()
+    assert header["typ"] == "dpop+jwt"
+    assert header["alg"] == "ES256"
+    assert header["jwk"] == {k: expected_jwk[k] for k in ["crv", "kty", "x", "y"]}
+
+
+def test_dpop_signer_generates_unique_tokens():
+    signer = DPoPSigner(SigningKey.generate(NIST256p))
+    tokens = {signer.generate_dpop("https://api.mercari.jp/", "GET") for _ in range(5)}
+
+    assert len(tokens) == 5
+
+
+def test_generate_dpop():
+    key = SigningKey.generate(NIST256p)
+    token = generate_dpop("https://api.mercari.jp/", "POST", key, {"uuid": "bar"})
+
+    payload = _verify(token, key)
+    assert payload["htm"] == "POST"
+    assert payload["uuid"] == "bar"
+
+
+def test_dpop_signer_prefers_cryptography_backend():
+    signer = DPoPSigner(SigningKey.generate(NIST256p))
+
+    assert signer.backend == SigningBackend.CRYPTOGRAPHY
+
+
+def test_mercapi_signing_backend(m):
+    from mercapi import Mercapi
+
+    assert m.signing_backend == SigningBackend.CRYPTOGRAPHY
+    assert (
+        Mercapi(signing_backend=SigningBackend.ECDSA).signing_backend
+        == SigningBackend.ECDSA
+    )
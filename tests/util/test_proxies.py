@@ -0,0 +1,83 @@
+import asyncio
+from collections import Counter
+
+import httpx
+import pytest
+
+from mercapi import Mercapi
+from mercapi.util.errors import ResponseStatusError
+from mercapi.util.proxies import ProxyPool
+
+ITEM = {"data": {"id": "m1", "status": "on_sale", "name": "foo", "price": 300}}
+
+
+def _pool(statuses, **kwargs):
+    """Pool of proxies responding with statuses from `statuses[proxy]` in turn."""
+    sent = Counter()
+
+    def client(proxy):
+        async def handler(request):
+            sent[proxy] += 1
+            await asyncio.sleep(0.01)
+            queue = statuses[proxy]
+            status = queue.pop(0) if len(queue) > 1 else queue[0]
+            return httpx.Response(status, json=ITEM)
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    return ProxyPool(list(statuses), client_factory=client, **kwargs), sent
+
+
+@pytest.mark.asyncio
+async def test_pool_spreads_requests_over_least_loaded_proxies():
+    pool, sent = _pool({"a": [200], "b": [200], "c": [200]})
+    m = Mercapi(proxy_pool=pool)
+
+    await asyncio.gather(*(m.item(f"m{i}") for i in range(9)))
+
+    assert sent == {"a": 3, "b": 3, "c": 3}
+    assert m._client is None
+    assert all(len(p.latencies) == 3 for p in pool.proxies)
+    assert all(p.latency_percentile(50) >= 0.01 for p in pool.proxies)
+
+
+@pytest.mark.asyncio
+async def test_pool_ejects_throttled_proxy():
+    pool, sent = _pool({"a": [429, 200], "b": [200]}, ejection=60)
+    m = Mercapi(proxy_pool=pool)
+
+    with pytest.raises(ResponseStatusError):
+        await m.item("m1")
+    for i in range(3):
+        await m.item(f"m{i}")
+
+    assert sent == {"a": 1, "b": 3}
+    assert pool.proxies[0].ejected
+    assert pool.proxies[0].health < pool.proxies[1].health
+
+
+@pytest.mark.asyncio
+async def test_pool_ejects_proxy_after_consecutive_failures():
+    pool, sent = _pool({"a": [500, 500, 200]}, max_failures=2)
+    (proxy,) = pool.proxies
+
+    assert (await pool.send(httpx.Request("GET", "http://x"))).status_code == 500
+    assert not proxy.ejected
+    assert (await pool.send(httpx.Request("GET", "http://x"))).status_code == 500
+    assert proxy.ejected
+    assert proxy.failures == 2 and proxy.consecutive_failures == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_uses_proxy_returning_soonest_when_all_are_ejected():
+    pool, _ = _pool({"a": [200], "b": [200]})
+    pool._record_failure(pool.proxies[0], eject_for=60)
+    pool._record_failure(pool.proxies[1], eject_for=30)
+
+    assert pool.choose() is pool.proxies[1]
+
+
+def test_pool_cannot_be_combined_with_proxies():
+    pool, _ = _pool({"a": [200]})
+    with pytest.raises(ValueError):
+        Mercapi(proxy_pool=pool, proxies="http://example.com:1234")
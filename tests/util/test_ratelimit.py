@@ -0,0 +1,133 @@
+import asyncio
+
+import httpx
+import pytest
+
+from mercapi import Mercapi
+from mercapi.util.errors import ResponseStatusError
+from mercapi.util.ratelimit import AdaptiveRateLimiter, parse_retry_after
+
+ITEM = {"data": {"id": "m1", "status": "on_sale", "name": "foo", "price": 300}}
+
+
+def _mercapi(limiter, responses):
+    proofs = []
+
+    def handler(request):
+        proofs.append(request.headers["DPoP"])
+        return responses.pop(0)
+
+    m = Mercapi(rate_limiter=limiter, transport=httpx.MockTransport(handler))
+    return m, proofs
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+
+
+@pytest.mark.asyncio
+async def test_limiter_increases_additively():
+    limiter = AdaptiveRateLimiter(2, max_limit=3)
+    for _ in range(4):
+        await limiter.acquire()
+        limiter.release(200)
+
+    assert limiter.limit == 3
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_decreases_multiplicatively():
+    limiter = AdaptiveRateLimiter(8, min_limit=3)
+    await limiter.acquire()
+    limiter.release(429)
+    assert limiter.limit == 4
+
+    await limiter.acquire()
+    limiter.release(503)
+    assert limiter.limit == 3
+
+
+@pytest.mark.asyncio
+async def test_limiter_bounds_requests_in_flight():
+    limiter = AdaptiveRateLimiter(2)
+    await limiter.acquire()
+    await limiter.acquire()
+
+    waiting = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not waiting.done()
+
+    limiter.release(200)
+    await asyncio.sleep(0)
+    assert waiting.done()
+    assert limiter.in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_limiter_releases_slot_of_acquirer_cancelled_during_pause():
+    limiter = AdaptiveRateLimiter(1, max_limit=1)
+    await limiter.acquire()
+    limiter.release(200, retry_after=0.5)
+
+    paused = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0.01)
+    assert limiter.in_flight == 1
+    paused.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await paused
+
+    assert limiter.in_flight == 0
+    limiter._paused_until = 0.0
+    await asyncio.wait_for(limiter.acquire(), 0.1)
+
+
+@pytest.mark.asyncio
+async def test_limiter_passes_wakeup_of_cancelled_waiter_on():
+    limiter = AdaptiveRateLimiter(1, max_limit=1)
+    await limiter.acquire()
+    first = asyncio.ensure_future(limiter.acquire())
+    second = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+
+    limiter.release()
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    await asyncio.wait_for(second, 0.1)
+
+    assert limiter.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_throttled_request_is_retried_with_new_dpop():
+    m, proofs = _mercapi(
+        AdaptiveRateLimiter(),
+        [
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json=ITEM),
+        ],
+    )
+
+    item = await m.item("m1")
+
+    assert item.id_ == "m1"
+    assert len(proofs) == 2
+    assert proofs[0] != proofs[1]
+
+
+@pytest.mark.asyncio
+async def test_request_fails_after_max_retries():
+    m, proofs = _mercapi(
+        AdaptiveRateLimiter(max_retries=2, backoff=0),
+        [httpx.Response(503) for _ in range(3)],
+    )
+
+    with pytest.raises(ResponseStatusError) as exc:
+        await m.item("m1")
+
+    assert exc.value.status_code == 503
+    assert len(proofs) == 3
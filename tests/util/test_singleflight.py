@@ -0,0 +1,134 @@
+import asyncio
+
+import pytest
+
+from mercapi import Mercapi
+from mercapi.testing import StubTransport
+from mercapi.util.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_concurrent_calls():
+    flight = SingleFlight()
+    started = 0
+
+    async def call():
+        nonlocal started
+        started += 1
+        await asyncio.sleep(0.01)
+        return object()
+
+    results = await asyncio.gather(*(flight.do("item", "m1", call) for _ in range(5)))
+    other = await flight.do("item", "m2", call)
+
+    assert started == 2
+    assert all(r is results[0] for r in results)
+    assert other is not results[0]
+    assert flight.calls["item"] == 2
+    assert flight.coalesced["item"] == 4
+    assert len(flight) == 0
+
+    await flight.do("item", "m1", call)
+    assert started == 3
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_exceptions():
+    flight = SingleFlight()
+
+    async def call():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("failed")
+
+    results = await asyncio.gather(
+        *(flight.do("item", "m1", call) for _ in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_survives_cancelled_caller():
+    flight = SingleFlight()
+
+    async def call():
+        await asyncio.sleep(0.02)
+        return "result"
+
+    first = asyncio.ensure_future(flight.do("item", "m1", call))
+    second = asyncio.ensure_future(flight.do("item", "m1", call))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "result"
+    assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancels_call_without_callers():
+    flight = SingleFlight()
+    cancelled = asyncio.Event()
+
+    async def call():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    caller = asyncio.ensure_future(flight.do("item", "m1", call))
+    await asyncio.sleep(0)
+    caller.cancel()
+    await asyncio.wait_for(cancelled.wait(), 1)
+
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_mercapi_coalesces_identical_calls():
+    transport = StubTransport(latency=0.01)
+    m = Mercapi(transport=transport)
+
+    items = await asyncio.gather(*(m.item("m00000000001") for _ in range(4)))
+    profiles = await asyncio.gather(*(m.profile("100000001") for _ in range(3)))
+    searches = await asyncio.gather(*(m.search("sharpnel") for _ in range(3)))
+    await asyncio.gather(*(m.items("100000001") for _ in range(2)))
+
+    assert all(i is items[0] for i in items)
+    assert all(p is profiles[0] for p in profiles)
+    assert all(s is searches[0] for s in searches)
+    assert transport.requests == {"item": 1, "profile": 1, "search": 1, "items": 1}
+    assert m.single_flight.coalesced == {
+        "item": 3,
+        "profile": 2,
+        "search": 2,
+        "items": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_mercapi_does_not_coalesce_different_calls():
+    transport = StubTransport(latency=0.01)
+    m = Mercapi(transport=transport)
+
+    await asyncio.gather(
+        m.item("m00000000001"),
+        m.item("m00000000001", fields=["id_", "price"]),
+        m.search("sharpnel"),
+        m.search("sharpnel", price_min=1000),
+    )
+
+    assert transport.requests == {"item": 2, "search": 2}
+    assert sum(m.single_flight.coalesced.values()) == 0
+
+
+@pytest.mark.asyncio
+async def test_mercapi_coalescing_can_be_disabled():
+    transport = StubTransport(latency=0.01)
+    m = Mercapi(transport=transport, coalesce=False)
+
+    await asyncio.gather(*(m.item("m00000000001") for _ in range(3)))
+
+    assert m.single_flight is None
+    assert transport.requests == {"item": 3}